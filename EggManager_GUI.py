@@ -3,34 +3,47 @@ import sys
 import os
 import re
 import time
-import ctypes, pyperclip
-from itertools import combinations
+import ctypes
 from datetime import datetime
-import pyautogui
 import webbrowser
-import requests
-from PySide6.QtWidgets import *
-from PySide6.QtCore import *
-from PySide6.QtGui import *
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QDialog, QDialogButtonBox, QDockWidget,
+                               QFileDialog, QFrame, QGroupBox, QHBoxLayout, QHeaderView, QInputDialog, QLabel,
+                               QLineEdit, QMainWindow, QMenu, QMessageBox, QPlainTextEdit, QProgressBar,
+                               QProgressDialog, QPushButton, QRadioButton, QScrollArea, QSpinBox, QStackedWidget,
+                               QStyle, QStyleOptionButton, QStyleOptionViewItem, QStyledItemDelegate, QTableView,
+                               QTableWidget, QTableWidgetItem, QTreeView, QVBoxLayout, QWidget)
+from PySide6.QtCore import (QAbstractItemModel, QAbstractProxyModel, QAbstractTableModel, QEvent, QFileSystemWatcher,
+                            QMetaObject, QModelIndex, QObject, QPoint, QRect, QThread, QTimer, Q_ARG, Q_RETURN_ARG, Qt,
+                            Signal, Slot)
+from PySide6.QtGui import QAction, QColor, QFont, QIcon
 import configparser as cp
-import pywinauto
-from pywinauto import Application
-from win32api import GetSystemMetrics
-import win32con
-import win32gui
 import threading
-import urllib.request
-import zipfile
+import multiprocessing
+import bisect
 import shutil
 import subprocess
 import tempfile
+from eggcore import (DEFAULT_WALLET, PIN_INSERTED, PIN_REMOVED, PINS_LOADED, WALLET_RESET, IncrementalPinParser,
+                     LazyModule, PinQuery, PinSearchIndex, PinWallet, WalletRegistry, aggregate_days,
+                     find_pins_for_amount, is_valid_pin, may_contain_pins, open_pin_file, parse_pins)
+from eggcore.batchimport import MultiFileImport
+from eggcore.watchdog import StallWatchdog, read_stalls, stall_location, worst_stalls
+
+# 자동 입력, 업데이트에만 쓰는 모듈은 처음 사용할 때 불러옴 (시작 시간 단축)
+pyautogui = LazyModule("pyautogui")
+pyperclip = LazyModule("pyperclip")
+pywinauto = LazyModule("pywinauto")
+pythoncom = LazyModule("pythoncom")
+win32api = LazyModule("win32api")
+win32con = LazyModule("win32con")
+win32gui = LazyModule("win32gui")
+requests = LazyModule("requests")
+zipfile = LazyModule("zipfile")
 
 current_version = "1.3.0"  # 현재 버전
+startup_started = time.perf_counter()  # 시작 시간 측정 기준
 config = cp.ConfigParser()
 
-# Windows API 함수 로드
-user32 = ctypes.windll.user32
-
 def config_read():
     # 기본 설정값 정의
     default_settings = {
@@ -43,7 +56,15 @@ def config_read():
             'auto_update': 'True',
             'auto_submit': 'False',
             'theme': 'Light',
-            'size_adjust': 'True'
+            'size_adjust': 'True',
+            'wallet': DEFAULT_WALLET,  # 마지막으로 사용한 지갑
+            'wallet_cache_size': '3',  # 메모리에 유지할 최근 지갑 수
+            'stall_watchdog': 'False',  # 화면 멈춤 감지
+            'stall_threshold_ms': '250',  # 이보다 오래 멈추면 기록 (밀리초)
+            'import_batch_size': '5000',  # 파일에서 가져올 때 한 번에 저장할 PIN 수
+            'import_workers': '0',  # 여러 파일을 가져올 때 쓸 작업 프로세스 수 (0이면 CPU 수)
+            'clipboard_watch': 'False',  # 복사한 텍스트에서 PIN을 찾아 추가를 제안
+            'clipboard_default_amount': '50000'  # 클립보드 PIN에 금액이 적혀 있지 않을 때의 잔액
         },
         'UPDATE': {
             'last_check': '0',  # 마지막 업데이트 확인 시간 (UNIX 타임스탬프)
@@ -53,7 +74,7 @@ def config_read():
     }
     
     # 설정 파일 읽기 시도
-    config_file_exists = config.read('config.ini')
+    config_file_exists = config.read('config.ini', encoding='utf-8')
     config_changed = False
     
     if not config_file_exists:
@@ -86,6 +107,17 @@ def config_read():
     
     return config
 
+def default_wallet_paths():
+    # 기본 지갑은 기존 설정의 파일을 그대로 사용
+    return {
+        'pins': config["DEFAULT"]['pin_file'],
+        'txt': config["DEFAULT"]['txt_file'],
+        'log': config["DEFAULT"]['log_file'],
+        'locked': os.path.join("resource", "locked_pins.json"),
+        'journal': os.path.join("resource", "pins_sync.json"),  # 다른 PC와 동기화할 변경 기록
+        'summary': os.path.join("resource", "pins_summary.json"),
+    }
+
 class AutoUpdater:
     def __init__(self, current_version, parent=None):
         self.current_version = f"v{current_version}"
@@ -421,261 +453,767 @@ class AutoUpdater:
         
         return script_path
 
-class PinManager:
-    def __init__(self):
-        self.filename = config["DEFAULT"]['pin_file']
-        self.pins = self.load_pins()
-        self.locked_pins = set()  # 잠긴 핀 목록을 저장할 세트
-        self.txt_filename = config["DEFAULT"]['txt_file']
-        self.log_filename = config["DEFAULT"]['log_file']
-        self.locked_pins_file = os.path.join("resource", "locked_pins.json")  # 잠긴 핀 저장 파일
-        self.stats_log_filename = os.path.join("resource", "pin_stats.json")  # 통계용 구조화된 로그 파일
-        self.load_locked_pins()  # 잠긴 핀 정보 로드
-
-    def load_pins(self):
-        try:
-            with open(self.filename, "r") as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-        
-    def show_log(self):
-        try:
-            with open(self.log_filename, "r", encoding='utf-8') as log_file:
-                log = log_file.read()
-                log_file.close()
-                return log
-        except FileNotFoundError:
-            return "로그 파일을 찾을 수 없습니다."
-        except Exception as e:
-            return f"오류가 발생했습니다: {e}"
+class PinManager(PinWallet):
+    def __init__(self, paths=None, load=True):
+        # 지갑별 파일 경로 (기본 지갑의 잠긴 핀 목록은 resource/locked_pins.json)
+        # 모두 사용한 PIN 보관소는 모든 지갑이 함께 씀
+        super().__init__(paths or default_wallet_paths(), os.path.join("resource", "pin_stats.json"), load=load,
+                         spent_file=os.path.join("resource", "spent_pins.bin"))
+
+
+class PinTableModel(QAbstractTableModel):
+    """지갑(PinManager)을 그대로 보여주는 PIN 목록 모델
+
+    화면에 보이는 행만 data()로 그리므로 PIN 수가 많아도 위젯을 만들지 않습니다.
+    """
+    HEADERS = ["PIN 번호", "잔액", "잠금"]
+    PIN_COLUMN, BALANCE_COLUMN, LOCK_COLUMN = range(3)
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = None
+        self._rows = []  # 행 번호 -> PIN (지갑 저장 순서)
+        self._row_of = {}  # PIN -> 행 번호 (_valid_rows 이후 행은 행을 지운 뒤 어긋났을 수 있음)
+        self._valid_rows = 0
+        self.set_manager(manager)
+
+    def set_manager(self, manager):
+        """보여줄 지갑을 바꾸고 그 지갑의 변경 알림을 받습니다"""
+        if self.manager is not None:
+            self.manager.remove_listener(self.on_wallet_changed)
+        self.manager = manager
+        manager.add_listener(self.on_wallet_changed)
+        self.refresh()
+
+    def on_wallet_changed(self, event, pin, value):
+        # 바뀐 PIN의 행만 알려서 보이는 행만 다시 그리도록 함
+        if event == PIN_INSERTED:
+            row = len(self._rows)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.append(pin)
+            self._row_of[pin] = row
+            if self._valid_rows == row:
+                self._valid_rows += 1
+            self.endInsertRows()
+        elif event == PINS_LOADED:
+            # 불러오는 중에는 여러 행을 한 번에 추가
+            row = len(self._rows)
+            self.beginInsertRows(QModelIndex(), row, row + len(value) - 1)
+            self._rows.extend(value)
+            self._row_of.update(zip(value, range(row, row + len(value))))
+            if self._valid_rows == row:
+                self._valid_rows = len(self._rows)
+            self.endInsertRows()
+        elif event == PIN_REMOVED:
+            row = self.row_of(pin)
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            del self._row_of[pin]
+            self._valid_rows = min(self._valid_rows, row)  # 뒤쪽 행 번호는 필요할 때 다시 계산
+            self.endRemoveRows()
+        elif event == WALLET_RESET:
+            self.refresh()
+        else:
+            row = self.row_of(pin)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.LOCK_COLUMN))
+
+    def refresh(self):
+        self.beginResetModel()
+        self._rows = list(self.manager.pins)
+        self._row_of = dict(zip(self._rows, range(len(self._rows))))
+        self._valid_rows = len(self._rows)
+        self.endResetModel()
+
+    def row_of(self, pin):
+        """PIN의 행 번호 (행을 지운 뒤 어긋난 뒤쪽 행 번호는 이때 한 번에 다시 계산)"""
+        row = self._row_of[pin]
+        if row >= self._valid_rows:
+            start = self._valid_rows
+            self._row_of.update(zip(self._rows[start:], range(start, len(self._rows))))
+            self._valid_rows = len(self._rows)
+            row = self._row_of[pin]
+        return row
+
+    def pin_at(self, row):
+        return self._rows[row]
+
+    def pins_in_order(self):
+        """행 순서대로의 PIN 목록 (복사하지 않으므로 읽기 전용으로 사용)"""
+        return self._rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == self.LOCK_COLUMN:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        pin = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == self.PIN_COLUMN:
+                return pin
+            if column == self.BALANCE_COLUMN and pin in self.manager.pins:
+                return '{0:,}'.format(self.manager.pins[pin])
+        elif role == Qt.CheckStateRole and column == self.LOCK_COLUMN:
+            return Qt.Checked if self.manager.is_pin_locked(pin) else Qt.Unchecked
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        elif role == Qt.FontRole and column != self.LOCK_COLUMN and self.manager.is_pin_locked(pin):
+            # 잠긴 핀은 이탤릭체와 취소선으로 표시
+            font = QFont()
+            font.setItalic(True)
+            font.setStrikeOut(True)
+            return font
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or index.column() != self.LOCK_COLUMN:
+            return False
+        pin = self._rows[index.row()]
+        if self.manager.is_pin_locked(pin) != (Qt.CheckState(value) == Qt.Checked):
+            self.manager.toggle_pin_lock(pin)  # 행 갱신은 지갑 변경 알림으로 처리
+        return True
+
+
+class PinSortFilterProxyModel(QAbstractProxyModel):
+    """지갑 저장 순서는 그대로 두고 정렬·필터한 순서로 PinTableModel을 보여주는 프록시 모델
+
+    QSortFilterProxyModel은 비교할 때마다 파이썬 lessThan을 호출해 PIN이 많으면 매우 느리므로,
+    정렬 순서는 파이썬 sort로 한 번에 계산하고 이후에는 바뀐 행만 제자리로 옮깁니다.
+    PIN 번호 열은 추가한 순서(지갑 저장 순서)로 정렬합니다.
+    """
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self._sort_keys = []   # [(열, Qt.SortOrder), ...] 앞쪽 키가 우선
+        self._filter = None    # PIN -> 표시 여부 (None이면 모두 표시)
+        self._order = []       # 프록시 행 -> 원본 행
+        self._position = None  # 원본 행 -> 프록시 행 (-1은 숨김), 필요할 때 다시 계산
+        self.setSourceModel(source)
+        source.modelAboutToBeReset.connect(self.beginResetModel)
+        source.modelReset.connect(self._on_source_reset)
+        source.rowsInserted.connect(self._on_rows_inserted)
+        source.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        source.rowsRemoved.connect(self._on_rows_removed)
+        source.dataChanged.connect(self._on_data_changed)
+        self._order = self._build_order()
+
+    # 정렬/필터 설정
+    def sort_keys(self):
+        return list(self._sort_keys)
+
+    def set_sort_keys(self, keys):
+        self._sort_keys = list(keys)
+        self._relayout()
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.columnCount() - 1)
+
+    def toggle_sort_key(self, column, append=False):
+        """열 머리글 클릭: 같은 열이면 방향을 바꾸고, append면 보조 정렬 키로 추가합니다"""
+        keys = list(self._sort_keys)
+        columns = [key_column for key_column, _ in keys]
+        if column in columns:
+            position = columns.index(column)
+            order = Qt.DescendingOrder if keys[position][1] == Qt.AscendingOrder else Qt.AscendingOrder
+            if append:
+                keys[position] = (column, order)
+            elif position == 0:
+                keys = [(column, order)]
+            else:
+                keys = [(column, Qt.AscendingOrder)]
+        elif append:
+            keys.append((column, Qt.AscendingOrder))
+        else:
+            keys = [(column, Qt.AscendingOrder)]
+        self.set_sort_keys(keys)
 
-    def save_pins(self):
-        with open(self.filename, "w") as file:
-            json.dump(self.pins, file, indent=4)
-    
-    def save_pins_to_txt(self):
-        with open(self.txt_filename, "w") as file:
-            for idx, (pin, balance) in enumerate(self.pins.items(), start=1):
-                file.write(f"{idx}. {pin}: {balance}\n")
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.set_sort_keys([(column, order)] if column >= 0 else [])
+
+    def set_filter(self, accept, candidates=None):
+        """accept(PIN)이 참인 PIN만 표시합니다. None이면 모두 표시합니다
 
-    # 로그 파일로부터 PIN과 원금을 사용하여 PIN 목록을 복구하는 함수
-    def load_pins_from_log(self):
+        candidates는 지금 accept를 만족하는 PIN 집합(검색 색인 결과)으로, 주면 처음 거를 때
+        모든 PIN에 accept를 호출하지 않습니다. 이후 바뀐 행은 accept로 다시 확인합니다.
+        """
+        self.beginResetModel()
+        self._filter = accept
+        self._order = self._build_order(candidates)
+        self._position = None
+        self.endResetModel()
+
+    def pin_at(self, row):
+        return self.sourceModel().pin_at(self._order[row])
+
+    # 순서 계산
+    def _column_values(self, column, rows=None):
+        """원본 행 -> 정렬 값. rows를 주면 그 행의 값만 계산합니다 (검색으로 일부만 표시할 때)"""
+        source = self.sourceModel()
+        pins = source.pins_in_order()
+        if column == PinTableModel.BALANCE_COLUMN:
+            balances = source.manager.pins
+            if rows is not None:
+                return {row: balances[pins[row]] for row in rows}
+            return [balances[pin] for pin in pins]
+        if column == PinTableModel.LOCK_COLUMN:
+            locked = source.manager.locked_pins
+            if rows is not None:
+                return {row: pins[row] in locked for row in rows}
+            return [pin in locked for pin in pins]
+        return range(len(pins))  # 추가한 순서
+
+    def _build_order(self, candidates=None):
+        pins = self.sourceModel().pins_in_order()
+        if self._filter is None:
+            rows = list(range(len(pins)))
+        elif candidates is not None:
+            rows = [row for row, pin in enumerate(pins) if pin in candidates]
+        else:
+            rows = [row for row, pin in enumerate(pins) if self._filter(pin)]
+        subset = rows if len(rows) < len(pins) // 2 else None
+        # 덜 중요한 키부터 안정 정렬을 반복하면 앞쪽 키가 우선하는 다중 정렬이 됨
+        for column, order in reversed(self._sort_keys):
+            rows.sort(key=self._column_values(column, subset).__getitem__, reverse=order == Qt.DescendingOrder)
+        return rows
+
+    def _row_key(self, row):
+        # _build_order와 같은 순서를 만드는 한 행의 비교 키 (같으면 저장 순서)
+        source = self.sourceModel()
+        pin = source.pin_at(row)
+        key = []
+        for column, order in self._sort_keys:
+            if column == PinTableModel.BALANCE_COLUMN:
+                value = source.manager.pins[pin]
+            elif column == PinTableModel.LOCK_COLUMN:
+                value = int(pin in source.manager.locked_pins)
+            else:
+                value = row
+            key.append(-value if order == Qt.DescendingOrder else value)
+        key.append(row)
+        return key
+
+    def _insert_position(self, row):
+        return bisect.bisect_right(self._order, self._row_key(row), key=self._row_key)
+
+    def _accepts(self, row):
+        return self._filter is None or self._filter(self.sourceModel().pin_at(row))
+
+    def _relayout(self):
+        # 선택한 행이 유지되도록 순서만 바꿈
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self.mapToSource(index) for index in persistent]
+        self._order = self._build_order()
+        self._position = None
+        self.changePersistentIndexList(persistent, [self.mapFromSource(index) for index in sources])
+        self.layoutChanged.emit()
+
+    # 원본 모델 변경 반영
+    def _on_source_reset(self):
+        self._order = self._build_order()
+        self._position = None
+        self.endResetModel()
+
+    def _on_rows_inserted(self, parent, first, last):
+        if last > first and not self._sort_keys:
+            # 정렬하지 않으면 추가된 행은 모두 끝에 붙으므로 한 번에 알림 (지갑을 불러오는 중)
+            rows = [row for row in range(first, last + 1) if self._accepts(row)]
+            if rows:
+                position = len(self._order)
+                self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+                self._order.extend(rows)
+                self._position = None
+                self.endInsertRows()
+            return
+        if last - first >= 1000:
+            # 많은 행을 한 행씩 끼워 넣는 것보다 다시 정렬하는 편이 빠름
+            self.beginResetModel()
+            self._on_source_reset()
+            return
+        for row in range(first, last + 1):
+            if not self._accepts(row):
+                continue
+            position = self._insert_position(row)
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._order.insert(position, row)
+            self._position = None
+            self.endInsertRows()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        if first == last:
+            positions = [self._order.index(first)] if first in self._order else []
+        else:
+            positions = [position for position, row in enumerate(self._order) if first <= row <= last]
+        for position in sorted(positions, reverse=True):
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._order[position]
+            # 뒤쪽 프록시 행이 한 칸씩 당겨졌으므로 endRemoveRows에서 뷰가 mapFromSource를 부르기 전에 버림
+            self._position = None
+            self.endRemoveRows()
+
+    def _on_rows_removed(self, parent, first, last):
+        # 지운 행 뒤의 원본 행 번호를 앞으로 당김
+        count = last - first + 1
+        self._order = [row - count if row > last else row for row in self._order]
+        self._position = None
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._reposition(row)
+
+    def _reposition(self, row):
+        """잔액이나 잠금이 바뀐 행을 정렬/필터 결과에 맞는 자리로 옮깁니다"""
         try:
-            with open(self.log_filename, "r", encoding='utf-8') as log_file:
-                log_lines = log_file.readlines()
-                for line in log_lines:
-                    match = re.search(r'(\d{5}-\d{5}-\d{5}-\d{5}) \[원금: (\d+)\]', line)
-                    if match:
-                        pin = match.group(1)
-                        original_balance = int(match.group(2))
-                        self.pins[pin] = original_balance
-            self.save_pins()
-            self.save_pins_to_txt()
-            return "PIN 목록이 성공적으로 복구되었습니다."
-        except FileNotFoundError:
-            return "로그 파일을 찾을 수 없습니다."
-        except Exception as e:
-            return f"오류가 발생했습니다: {e}"
+            position = self._order.index(row)
+        except ValueError:
+            position = -1
+        accepted = self._accepts(row)
+        if position < 0:
+            if accepted:
+                self._on_rows_inserted(QModelIndex(), row, row)
+            return
+        if not accepted:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._order[position]
+            self._position = None
+            self.endRemoveRows()
+            return
 
-    def add_pin(self, pin, balance):
-        self.pins[pin] = balance
-        self.save_pins()
-        self.save_pins_to_txt()
-        return f"PIN {pin} 추가 완료. 잔액: {balance}"
-    
-    def format_pin(self, pin):
-        pattern = re.compile(r'^\d{4}-\d{4}-\d{4}-\d{4}-\d{4}$')
-        if bool(pattern.match(pin)):
-            pin = self.unformat_pin(pin)
-        if len(pin) == 20 and pin.isdigit():
-            return f"{pin[:5]}-{pin[5:10]}-{pin[10:15]}-{pin[15:]}"
-        return pin
-    
-    def unformat_pin(self, formatted_pin):
-        return formatted_pin.replace("-", "")
-
-    def is_valid_pin_format(self, pin):
-        pattern = re.compile(r'^\d{5}-\d{5}-\d{5}-\d{5}$')
-        return bool(pattern.match(pin))
-
-    def delete_pin(self, pin):
-        pin = self.format_pin(pin)
-        if pin in self.pins:
-            del self.pins[pin]
-            if pin in self.locked_pins:
-                self.locked_pins.remove(pin)
-                self.save_locked_pins()
-            self.save_pins()
-            self.save_pins_to_txt()
-            return f"PIN {pin} 삭제 완료."
-        return f"PIN {pin}은(는) 존재하지 않습니다."
-    
-    def update_pin_balance(self, pin, new_balance):
-        if pin in self.pins:
-            self.pins[pin] = new_balance
-            self.save_pins()
-            self.save_pins_to_txt()
-            return True
+        del self._order[position]
+        target = self._insert_position(row)
+        self._order.insert(position, row)
+        if target != position:
+            # beginMoveRows의 목적지는 옮기기 전 목록 기준
+            self.beginMoveRows(QModelIndex(), position, position, QModelIndex(), target if target < position else target + 1)
+            del self._order[position]
+            self._order.insert(target, row)
+            self._position = None
+            self.endMoveRows()
+            position = target
+        self.dataChanged.emit(self.index(position, 0), self.index(position, self.columnCount() - 1))
+
+    # QAbstractProxyModel 구현
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._order):
+            return QModelIndex()
+        return self.sourceModel().index(self._order[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._position is None:
+            self._position = [-1] * self.sourceModel().rowCount()
+            for position, row in enumerate(self._order):
+                self._position[row] = position
+        row = source_index.row()
+        if row >= len(self._position) or self._position[row] < 0:
+            return QModelIndex()
+        return self.index(self._position[row], source_index.column())
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._order)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+    def hasChildren(self, parent=QModelIndex()):
+        return not parent.isValid() and bool(self._order)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            text = self.sourceModel().headerData(section, orientation, role)
+            for number, (column, order) in enumerate(self._sort_keys, start=1):
+                if column == section:
+                    text += " ▲" if order == Qt.AscendingOrder else " ▼"
+                    if len(self._sort_keys) > 1:
+                        text += str(number)
+            return text
+        if orientation == Qt.Horizontal and role == Qt.ToolTipRole:
+            return "클릭: 정렬 (PIN 번호는 추가한 순서)\nShift+클릭: 보조 정렬 기준 추가"
+        return super().headerData(section, orientation, role)
+
+
+class LockDelegate(QStyledItemDelegate):
+    """잠금 열에 체크박스를 가운데 그리고, 클릭하면 잠금 상태를 바꿉니다"""
+
+    def _is_checked(self, index):
+        return Qt.CheckState(index.data(Qt.CheckStateRole)) == Qt.Checked
+
+    def _checkbox_rect(self, option):
+        style_option = QStyleOptionButton()
+        size = QApplication.style().subElementRect(QStyle.SE_CheckBoxIndicator, style_option).size()
+        rect = QRect(QPoint(0, 0), size)
+        rect.moveCenter(option.rect.center())
+        return rect
+
+    def paint(self, painter, option, index):
+        # 선택 배경 등은 기본 방식으로 그리고 체크박스만 직접 그림
+        background = QStyleOptionViewItem(option)
+        self.initStyleOption(background, index)
+        background.features &= ~QStyleOptionViewItem.HasCheckIndicator
+        QApplication.style().drawControl(QStyle.CE_ItemViewItem, background, painter, option.widget)
+
+        checkbox = QStyleOptionButton()
+        checkbox.rect = self._checkbox_rect(option)
+        checkbox.state = QStyle.State_Enabled
+        checkbox.state |= QStyle.State_On if self._is_checked(index) else QStyle.State_Off
+        QApplication.style().drawPrimitive(QStyle.PE_IndicatorCheckBox, checkbox, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if self._checkbox_rect(option).contains(event.position().toPoint()):
+                return model.setData(index, Qt.Unchecked if self._is_checked(index) else Qt.Checked, Qt.CheckStateRole)
         return False
 
-    def get_total_balance(self):
-        return sum(self.pins.values())
 
-    def list_pins(self):
-        return list(self.pins.items())
+class StatsNode:
+    """통계 트리의 한 행 (children이 None이면 아직 펼치지 않은 행)"""
+    YEAR, MONTH, DAY, PURCHASE = range(4)
 
-    def find_pins_for_amount(self, amount, select_pins = []):
-        if select_pins:
-            # 선택된 핀 중에서 잠기지 않은 핀만 필터링
-            filtered_pins = [(pin, balance) for pin, balance in select_pins if pin not in self.locked_pins]
-            sorted_pins = sorted(filtered_pins, key=lambda x: x[1])
-        else:
-            # 모든 핀 중에서 잠기지 않은 핀만 필터링
-            available_pins = [(pin, balance) for pin, balance in self.pins.items() if pin not in self.locked_pins]
-            sorted_pins = sorted(available_pins, key=lambda x: x[1])
+    __slots__ = ('kind', 'key', 'label', 'amount', 'count', 'data', 'parent', 'row', 'children')
 
-        selected_pins = []
-        total_selected = 0
-        best_combination = []
-        best_total = 0
+    def __init__(self, kind, key, label, amount, count, data, parent=None, row=0):
+        self.kind = kind
+        self.key = key
+        self.label = label
+        self.amount = amount
+        self.count = count
+        self.data = data        # 하위 행을 만들 때 쓰는 원본 통계
+        self.parent = parent
+        self.row = row
+        self.children = [] if kind == StatsNode.PURCHASE else None
+
+
+class StatsTreeModel(QAbstractItemModel):
+    """PIN 사용 통계를 연 → 월 → 일 → 구매 순서로 보여주는 트리 모델
+
+    처음에는 연도 행만 만들고, 하위 행은 펼칠 때(fetchMore) 통계 파일에 미리 합산된
+    연/월/일 금액으로 만듭니다. 내역이 늘어도 창을 여는 시간은 연도 수에만 비례합니다.
+    """
+    HEADERS = ["기간 / 상품", "금액", "건수"]
+
+    def __init__(self, stats_data, parent=None):
+        super().__init__(parent)
+        self.root = StatsNode(StatsNode.YEAR, None, "", stats_data.get('total_amount', 0), 0, stats_data)
+        years = stats_data.get('years', {})
+        self.root.children = [
+            StatsNode(StatsNode.YEAR, year, f"{year}년", years[year]['year_amount'],
+                      sum(len(month.get('products', [])) for month in years[year].get('months', {}).values()),
+                      years[year], self.root, row)
+            for row, year in enumerate(sorted(years, key=int, reverse=True))
+        ]
+
+    def _node(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+
+    def _load_children(self, node):
+        if node.kind == StatsNode.YEAR:
+            months = node.data.get('months', {})
+            return [StatsNode(StatsNode.MONTH, month, f"{month}월", months[month]['month_amount'],
+                              len(months[month].get('products', [])), months[month], node, row)
+                    for row, month in enumerate(sorted(months, key=int, reverse=True))]
+        if node.kind == StatsNode.MONTH:
+            days = node.data.get('days')
+            if days is None:
+                days = aggregate_days(node.data.get('products', []))
+            return [StatsNode(StatsNode.DAY, day, f"{day}일", days[day]['amount'], days[day]['count'], node.data, node, row)
+                    for row, day in enumerate(sorted(days, key=int, reverse=True))]
+        # 일: 그 달의 상품 중 그 날짜에 산 것만
+        products = [product for product in node.data.get('products', []) if str(product['date']) == node.key]
+        return [StatsNode(StatsNode.PURCHASE, None, product['name'], product['amount'], 1, product, node, row)
+                for row, product in enumerate(reversed(products))]
+
+    # 지연 로딩
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        return node.kind != StatsNode.PURCHASE and (node.children is None or bool(node.children))
+
+    def canFetchMore(self, parent):
+        return self._node(parent).children is None
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if node.children is not None:
+            return
+        children = self._load_children(node)
+        if not children:
+            node.children = []
+            return
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        node.children = children
+        self.endInsertRows()
+
+    # QAbstractItemModel 구현
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if node.children is None or not (0 <= row < len(node.children)) or not (0 <= column < len(self.HEADERS)):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        children = self._node(parent).children
+        return len(children) if children is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return node.label
+            if column == 1:
+                return f"{'{0:,}'.format(node.amount)}원"
+            if column == 2 and node.kind != StatsNode.PURCHASE:
+                return str(node.count)
+        elif role == Qt.TextAlignmentRole and column > 0:
+            return Qt.AlignRight | Qt.AlignVCenter
+        elif role == Qt.FontRole and node.kind == StatsNode.YEAR:
+            font = QFont()
+            font.setBold(True)
+            return font
+        return None
+
+
+class PinPreviewModel(QAbstractTableModel):
+    """PIN 일괄 추가 미리보기 모델
+
+    해석 결과 [(PIN, 금액, 줄)]만 들고 있고, 상태와 색은 화면에 보이는 행을 그릴 때 계산합니다.
+    수만 개를 붙여넣어도 QTableWidget처럼 행마다 항목을 만들지 않습니다.
+    """
+    HEADERS = ["PIN", "잔액", "상태"]
+    ADDABLE, EXISTS, SPENT, INVALID = "추가 가능", "이미 존재함", "이미 사용됨", "유효하지 않은 형식"
+    COLORS = {ADDABLE: QColor(0, 128, 0), EXISTS: QColor(255, 165, 0), SPENT: QColor(128, 128, 128),
+              INVALID: QColor(255, 0, 0)}
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.rows = []
+        self.generation = 0  # 표시 중인 결과를 만든 요청 번호
+
+    def set_rows(self, rows, generation):
+        self.beginResetModel()
+        self.rows = rows
+        self.generation = generation
+        self.endResetModel()
+
+    def apply_changes(self, changes, generation):
+        """IncrementalPinParser.changes를 차례로 적용해 바뀐 행만 갱신합니다"""
+        for start, removed, rows in changes:
+            common = min(removed, len(rows))
+            if common:
+                self.rows[start:start + common] = rows[:common]
+                self.dataChanged.emit(self.index(start, 0), self.index(start + common - 1, len(self.HEADERS) - 1))
+            if removed > common:
+                self.beginRemoveRows(QModelIndex(), start + common, start + removed - 1)
+                del self.rows[start + common:start + removed]
+                self.endRemoveRows()
+            elif len(rows) > common:
+                self.beginInsertRows(QModelIndex(), start + common, start + len(rows) - 1)
+                self.rows[start + common:start + common] = rows[common:]
+                self.endInsertRows()
+        self.generation = generation
+
+    def status(self, pin):
+        if not is_valid_pin(pin):
+            return self.INVALID
+        if pin in self.manager.pins:
+            return self.EXISTS
+        if self.manager.is_pin_spent(pin):
+            return self.SPENT
+        return self.ADDABLE
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        pin, amount, _ = self.rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return pin
+            if column == 1:
+                return f"{amount:,}"
+            return self.status(pin)
+        if role == Qt.ForegroundRole and column != 1:
+            return self.COLORS[self.status(pin)]
+        return None
+
+
+class AutomationCancelled(BaseException):
+    """자동 사용을 취소했을 때 작업 스레드에서 발생 (각 단계의 except Exception에 잡히지 않도록 BaseException)"""
+
+
+class AutomationWorker(QObject):
+    """PIN 자동 사용 작업을 작업 스레드에서 실행하고 진행 상황을 시그널로 알립니다
+
+    job(worker)은 worker.step()으로 진행 상황을 알리고 worker.sleep()으로 기다립니다.
+    취소하면 다음 step()/sleep()에서 AutomationCancelled가 발생합니다.
+    지갑은 GUI 스레드에서만 바꾸므로 job은 결과만 돌려주고, 반영은 succeeded를 받은 쪽에서 합니다.
+    """
+    progress = Signal(int, str)
+    succeeded = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        self._cancel = threading.Event()
 
-        # print("Sorted pins: ", sorted_pins)
+    def cancel(self):
+        self._cancel.set()
 
-        for pin, balance in sorted_pins:
-            if total_selected >= amount:
-                break
-            selected_pins.append((pin, balance))
-            total_selected += balance
+    def step(self, percent, text):
+        if self._cancel.is_set():
+            raise AutomationCancelled()
+        self.progress.emit(percent, text)
 
-        if total_selected >= amount and len(selected_pins) <= 5:
-            # print("Selected pins: ", selected_pins)
-            return selected_pins
-        else:
-            # 가능한 모든 조합을 고려하여 최적의 조합을 찾음
-            for r in range(1, 6):
-                for combination in combinations(sorted_pins, r):
-                    total = sum(balance for pin, balance in combination)
-                    if total >= amount and (best_total == 0 or total < best_total):
-                        best_combination = combination
-                        best_total = total
-
-            if best_total >= amount:
-                # print("Best combination: ", best_combination)
-                return best_combination
-    
-        return []
-    
-    def pin_check(self, pin):
-        pin = self.format_pin(pin)
-        for pins in self.pins.keys():
-            if pins == pin:
-                return 1
-        return 0
-    
-    def toggle_pin_lock(self, pin):
-        """핀의 잠금 상태를 토글합니다"""
-        if pin in self.locked_pins:
-            self.locked_pins.remove(pin)
-            self.save_locked_pins()
-            return False  # 잠금 해제됨
+    def sleep(self, seconds):
+        if self._cancel.wait(seconds):
+            raise AutomationCancelled()
+
+    @Slot()
+    def run(self):
+        com_initialized = False
+        try:
+            # pywinauto(UIA)는 스레드마다 COM 초기화가 필요 (실패해도 failed를 보내 버튼이 다시 켜지도록 try 안에서)
+            pythoncom.CoInitialize()
+            com_initialized = True
+            result = self.job(self)
+        except AutomationCancelled:
+            self.failed.emit("취소되었습니다.")
+        except Exception as e:
+            self.failed.emit(f"❌ 자동 입력에 실패했습니다.\n{e}")
         else:
-            self.locked_pins.add(pin)
-            self.save_locked_pins()
-            return True  # 잠김
+            self.succeeded.emit(result)
+        finally:
+            if com_initialized:
+                pythoncom.CoUninitialize()
 
-    def is_pin_locked(self, pin):
-        """핀이 잠겨있는지 확인합니다"""
-        return pin in self.locked_pins
 
-    def save_locked_pins(self):
-        """잠긴 핀 목록을 파일에 저장합니다"""
-        # resource 폴더가 없으면 생성
-        os.makedirs("resource", exist_ok=True)
-        
-        with open(self.locked_pins_file, "w") as file:
-            json.dump(list(self.locked_pins), file, indent=4)
-    
-    def load_locked_pins(self):
-        """잠긴 핀 목록을 파일에서 로드합니다"""
-        try:
-            with open(self.locked_pins_file, "r") as file:
-                self.locked_pins = set(json.load(file))
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.locked_pins = set()
+class WalletLoader(QObject):
+    """지갑 파일과 통계 로그를 작업 스레드에서 읽습니다 (PIN이 많으면 JSON 해석이 가장 오래 걸림)"""
+    loaded = Signal(object, object, object)
+    failed = Signal(str)
+
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
 
-    def load_stats_log(self):
-        """통계용 구조화된 로그 파일을 불러옵니다."""
+    @Slot()
+    def run(self):
         try:
-            with open(self.stats_log_filename, "r", encoding='utf-8') as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # 파일이 없거나 JSON 파싱 실패시 기본 구조 반환
-            return {
-                'total_amount': 0,
-                'years': {}
-            }
-    
-    def save_stats_log(self, stats_data):
-        """통계용 구조화된 로그 파일을 저장합니다."""
-        # resource 폴더가 없으면 생성
-        os.makedirs(os.path.dirname(self.stats_log_filename) or '.', exist_ok=True)
-        
-        with open(self.stats_log_filename, "w", encoding='utf-8') as file:
-            json.dump(stats_data, file, indent=4, ensure_ascii=False)
-    
-    def add_stats_log_entry(self, date_str, product_name, amount, pins_used):
-        """통계용 로그에 새 항목을 추가합니다."""
-        # 기존 로그 불러오기
-        stats_data = self.load_stats_log()
-        
-        # 날짜 파싱
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        year = date_obj.year
-        month = date_obj.month
-        day = date_obj.day
-        
-        # 총 금액 업데이트
-        stats_data['total_amount'] += amount
-        
-        # 연도별 통계 업데이트
-        if str(year) not in stats_data['years']:
-            stats_data['years'][str(year)] = {
-                'year_amount': 0,
-                'months': {}
-            }
-        stats_data['years'][str(year)]['year_amount'] += amount
-        
-        # 월별 통계 업데이트
-        if str(month) not in stats_data['years'][str(year)]['months']:
-            stats_data['years'][str(year)]['months'][str(month)] = {
-                'month_amount': 0,
-                'products': []
-            }
-        stats_data['years'][str(year)]['months'][str(month)]['month_amount'] += amount
-        
-        # 상품별 통계 추가
-        stats_data['years'][str(year)]['months'][str(month)]['products'].append({
-            'name': product_name,
-            'amount': amount,
-            'date': day,
-            
-            # 'pins_count': len(pins_used),
-            # 'pins_info': pins_used  # [(pin, original_balance, used_amount, remaining)]
-        })
-        
-        # 변경된 통계 저장
-        self.save_stats_log(stats_data)
-    
+            pins, locked_pins, stamp = self.manager.read_snapshot()
+            self.manager.load_stats_log()  # 통계 창을 처음 열 때 다시 읽지 않도록 캐시를 채워 둠
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.loaded.emit(pins, locked_pins, stamp)
+
+
+class PreviewParser(QObject):
+    """PIN 일괄 추가 창에 입력한 텍스트를 작업 스레드에서 해석합니다
+
+    요청마다 번호(generation)를 붙이고, 그보다 새 요청이 이미 들어왔으면 해석하지 않습니다.
+    이전 해석 결과를 줄/줄 묶음별로 기억해 두고 고친 부분만 다시 해석합니다.
+    결과와 함께 직전 결과(base 번호)에서 바뀐 행 목록을 보내므로, 미리보기가 base를 표시 중이면 그 행만 고칩니다.
+    """
+    parsed = Signal(int, object, object, int)  # 요청 번호, 결과 행, 바뀐 행 (None이면 전체), base 번호
+
+    def __init__(self):
+        super().__init__()
+        self.latest = 0  # GUI 스레드가 마지막으로 보낸 요청 번호
+        self.parsed_generation = 0  # 마지막으로 해석한 요청 번호
+        self.parser = IncrementalPinParser()
+
+    @Slot(int, str, int)
+    def parse(self, generation, text, default_amount):
+        if generation != self.latest:
+            return  # 입력이 계속되는 동안 쌓인 이전 요청
+        rows = self.parser.parse(text, default_amount)
+        base, self.parsed_generation = self.parsed_generation, generation
+        self.parsed.emit(generation, rows, self.parser.changes, base)
+
+
 class PinManagerApp(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.manager = PinManager()
+        self.first_paint_ms = None
+        self.wallets = WalletRegistry(PinManager, default_wallet_paths(),
+                                      cache_size=int(config['SETTING']['wallet_cache_size']))
+        self.current_wallet = config['SETTING']['wallet']
+        if self.current_wallet not in self.wallets.names():
+            self.current_wallet = DEFAULT_WALLET
+        # 창을 먼저 띄우고 지갑은 start_loading_wallet()에서 작업 스레드로 불러옴
+        self.manager = self.wallets.open(self.current_wallet, load=False)
         self.auto_updater = AutoUpdater(current_version, self)
             
         self.current_theme = config['SETTING'].get('theme', 'Light')  # 기본값은 Light
         self.apply_theme(self.current_theme)
         self.initUI()
+        self.setup_file_watcher()
+        self.stall_watchdog = None
+        if config['SETTING']['stall_watchdog'] == 'True':
+            self.start_stall_watchdog()
+        self.clipboard_watching = False
+        self.clipboard_own_text = None  # paste_javascript_code가 클립보드에 넣은 코드 (감지하지 않음)
+        self.clipboard_last_text = None
+        self.clipboard_offer = None
+        if config['SETTING']['clipboard_watch'] == 'True':
+            self.start_clipboard_watch()
+        self.start_loading_wallet()
         # 메뉴바 이벤트 필터 설치
         self.menuBar().installEventFilter(self)
         # self.check_for_updates(silent=True)
@@ -720,6 +1258,18 @@ class PinManagerApp(QMainWindow):
         restore_action.setToolTip("로그 파일로부터 PIN 목록을 복구합니다.")
         settings_menu.addAction(restore_action)
 
+        # 다른 PC와 지갑 동기화
+        sync_export_action = QAction("동기화 파일 내보내기", self)
+        sync_export_action.triggered.connect(self.export_sync_file)
+        sync_export_action.setToolTip("다른 PC에 가져갈 변경분을 파일로 저장합니다.")
+        settings_menu.addAction(sync_export_action)
+
+        sync_import_action = QAction("동기화 파일 가져오기", self)
+        sync_import_action.triggered.connect(self.import_sync_file)
+        sync_import_action.setToolTip("다른 PC에서 내보낸 변경분을 지갑에 병합합니다.")
+        settings_menu.addAction(sync_import_action)
+        self.wallet_actions = [restore_action, sync_import_action]  # 불러오는 중, 자동 사용 중에는 비활성화
+
         # # 업데이트 액션 추가
         update_action = QAction('업데이트 확인', self)
         update_action.triggered.connect(self.check_for_updates)
@@ -754,6 +1304,23 @@ class PinManagerApp(QMainWindow):
         settings_size_adjust.triggered.connect(self.size_adjust_change)
         settings_menu.addAction(settings_size_adjust)
 
+        # 화면 멈춤 감지 메뉴 추가
+        stall_menu = QMenu('화면 멈춤 감지', self)
+        settings_stall = QAction('멈춤 감지 켜기', self, checkable=True)
+        settings_stall.setChecked(config['SETTING']['stall_watchdog'] == 'True')
+        settings_stall.triggered.connect(self.stall_watchdog_change)
+        stall_menu.addAction(settings_stall)
+        show_stalls_action = QAction('멈춤 기록 보기', self)
+        show_stalls_action.triggered.connect(self.show_stall_log)
+        stall_menu.addAction(show_stalls_action)
+        settings_menu.addMenu(stall_menu)
+
+        # 클립보드 PIN 감지
+        settings_clipboard = QAction('클립보드 PIN 감지', self, checkable=True)
+        settings_clipboard.setChecked(config['SETTING']['clipboard_watch'] == 'True')
+        settings_clipboard.triggered.connect(self.clipboard_watch_change)
+        settings_menu.addAction(settings_clipboard)
+
         # 테마 메뉴 추가
         # theme_menu = QMenu('테마', self)
         theme_action = QAction('테마 선택', self)
@@ -765,21 +1332,69 @@ class PinManagerApp(QMainWindow):
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
 
-        # PIN 목록 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["PIN 번호", "잔액", "잠금"])
+        # 지갑(게임 계정) 선택
+        wallet_layout = QHBoxLayout()
+        wallet_layout.addWidget(QLabel("지갑 :", self))
+        self.wallet_combo = QComboBox(self)
+        self.wallet_combo.setMinimumWidth(150)
+        self.wallet_combo.activated.connect(self.on_wallet_selected)
+        wallet_layout.addWidget(self.wallet_combo)
+        btn_new_wallet = QPushButton("새 지갑", self)
+        btn_new_wallet.clicked.connect(self.create_wallet)
+        btn_new_wallet.setToolTip("다른 게임 계정용 지갑을 추가합니다.")
+        wallet_layout.addWidget(btn_new_wallet)
+        wallet_layout.addStretch(1)
+
+        # PIN 검색 (입력할 때마다 색인으로 바로 거름)
+        self.search_index = PinSearchIndex(self.manager)
+        self.search_edit = QLineEdit(self)
+        self.search_edit.setPlaceholderText("PIN 숫자 일부 또는 잔액 (예: 1234  5000~10000  >=50000)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setMinimumWidth(300)
+        self.search_edit.setToolTip("공백으로 나눠 여러 조건을 입력하면 모두 만족하는 PIN만 표시합니다.")
+        self.search_edit.textChanged.connect(self.apply_search)
+        wallet_layout.addWidget(self.search_edit)
+        layout.addLayout(wallet_layout)
+
+        # PIN 목록 테이블 (지갑을 직접 보여주는 모델, 보이는 행만 그림)
+        self.pin_model = PinTableModel(self.manager, self)
+        self.pin_proxy = PinSortFilterProxyModel(self.pin_model, self)  # 정렬해도 지갑 저장 순서는 그대로
+        self.table = QTableView()
+        self.table.setModel(self.pin_proxy)
+        self.table.setItemDelegateForColumn(PinTableModel.LOCK_COLUMN, LockDelegate(self.table))
+        # 지갑이 바뀌면 유지 중인 합계로 잔액 표시만 갱신
+        for signal in (self.pin_model.dataChanged, self.pin_model.rowsInserted,
+                       self.pin_model.rowsRemoved, self.pin_model.modelReset):
+            signal.connect(lambda *args: self.update_balance_label())
         self.table.verticalHeader().setVisible(False)
+        # 행 높이를 고정해 행 수와 무관하게 스크롤 위치를 계산
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         # 각 컬럼의 크기 정책 개별 설정
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)  # PIN 번호 컬럼 - 늘어남
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)  # 잔액 컬럼 - 늘어남
-        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Fixed)
+        self.table.setColumnWidth(2, 60)
         # 여기서 SingleSelection을 ExtendedSelection으로 변경
         self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)  # 행 단위 선택
+        self.table.horizontalHeader().setSectionsClickable(True)
         self.table.horizontalHeader().sectionClicked.connect(self.sort_pins)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        layout.addWidget(self.table)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        # 전체 지갑 합계 (읽기 전용, 각 지갑의 요약 파일만 읽음)
+        self.summary_table = QTableWidget()
+        self.summary_table.setColumnCount(4)
+        self.summary_table.setHorizontalHeaderLabels(["지갑", "잔액", "사용 가능", "PIN 수"])
+        self.summary_table.verticalHeader().setVisible(False)
+        self.summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.summary_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.summary_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.summary_table.cellDoubleClicked.connect(self.open_wallet_from_summary)
+
+        self.table_stack = QStackedWidget()
+        self.table_stack.addWidget(self.table)
+        self.table_stack.addWidget(self.summary_table)
+        layout.addWidget(self.table_stack)
 
         # 버튼 배치
         button_layout = QHBoxLayout()
@@ -802,6 +1417,7 @@ class PinManagerApp(QMainWindow):
         btn_use.clicked.connect(self.use_pins)
         btn_use.setToolTip("선택한 금액을 사용할 수 있는 PIN을 자동으로 사용합니다.")
         button_layout.addWidget(btn_use)
+        self.wallet_buttons = [btn_add, btn_add_multiple, btn_delete, btn_use, self.search_edit]  # 전체 합계 보기에서는 비활성화
 
         # btn_restore = QPushButton("PIN 복구", self)
         # btn_restore.clicked.connect(self.restore_pins)
@@ -811,7 +1427,8 @@ class PinManagerApp(QMainWindow):
         layout.addLayout(button_layout)
 
         bottom_layout = QHBoxLayout()
-        self.sum = QLabel(f"잔액 : {'{0:,}'.format(self.manager.get_total_balance())}", self)
+        self.sum = QLabel(self)
+        self.update_balance_label()
         bottom_layout.addWidget(self.sum)
 
         bottom_layout.addStretch(1)
@@ -828,7 +1445,21 @@ class PinManagerApp(QMainWindow):
         bottom_layout.addWidget(btn_quit)
 
         layout.addLayout(bottom_layout)
-
+        self.wallet_buttons.append(btn_restore)
+
+        # 자동 사용 진행 상황 (작업 중에만 표시)
+        self.automation = None
+        self.automation_thread = None
+        self.automation_bar = QProgressBar(self)
+        self.automation_bar.setRange(0, 100)
+        self.automation_bar.setMaximumWidth(200)
+        self.automation_cancel = QPushButton("취소", self)
+        self.automation_cancel.clicked.connect(self.cancel_automation)
+        self.statusBar().addPermanentWidget(self.automation_bar)
+        self.statusBar().addPermanentWidget(self.automation_cancel)
+        self.statusBar().hide()
+
+        self.update_wallet_combo()
         self.update_table()
 
         # 테마 선택을 위한 서랍형 패널
@@ -1163,56 +1794,28 @@ class PinManagerApp(QMainWindow):
             # 레이아웃 설정
             layout = QVBoxLayout(stats_dialog)
             
-            # 스크롤 영역 설정
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_content = QWidget()
-            scroll_layout = QVBoxLayout(scroll_content)
-            scroll_layout.setAlignment(Qt.AlignTop)
-            
             # 총 누적 금액 표시
             total_amount = stats_data.get('total_amount', 0)
             total_label = QLabel(f"<h2>총 누적 금액: {'{0:,}'.format(total_amount)}원</h2>")
-            scroll_layout.addWidget(total_label)
-            
-            # 연도별 통계 표시
-            years = sorted(stats_data.get('years', {}).keys(), reverse=True)
-            for year in years:
-                year_stats = stats_data['years'][year]
-                year_label = QLabel(f"<h3>{year}년 (연간 사용 금액: {'{0:,}'.format(year_stats['year_amount'])}원)</h3>")
-                scroll_layout.addWidget(year_label)
-                
-                # 월별 통계 표시 (내림차순)
-                months = sorted(year_stats.get('months', {}).keys(), reverse=True)
-                for month in months:
-                    month_stats = year_stats['months'][month]
-                    month_label = QLabel(f"<h4>{month}월 (월간 사용 금액: {'{0:,}'.format(month_stats['month_amount'])}원)</h4>")
-                    # month_label.setStyleSheet("color: #333; margin-left: 20px;")
-                    month_label.setStyleSheet("margin-left: 20px;")
-                    scroll_layout.addWidget(month_label)
-                    
-                    # 상품별 통계 표시
-                    products = sorted(month_stats.get('products', []), key=lambda x: x['date'], reverse=True)
-                    for product in products:
-                        product_label = QLabel(f"{product['date']}일: {product['name']} - {'{0:,}'.format(product['amount'])}원")
-                        product_label.setStyleSheet("margin-left: 40px;")
-                        scroll_layout.addWidget(product_label)
-                
-                # 연도 간 구분선 추가
-                if year != years[-1]:  # 마지막 연도가 아니면 구분선 추가
-                    line = QFrame()
-                    line.setFrameShape(QFrame.HLine)
-                    line.setFrameShadow(QFrame.Sunken)
-                    scroll_layout.addWidget(line)
-            
-            # 데이터가 없는 경우 안내 메시지 표시
-            if not years:
+            layout.addWidget(total_label)
+            
+            # 연 → 월 → 일 → 구매 트리 (펼칠 때 하위 행을 만듦)
+            if stats_data.get('years'):
+                stats_model = StatsTreeModel(stats_data, stats_dialog)
+                tree = QTreeView()
+                tree.setModel(stats_model)
+                tree.setUniformRowHeights(True)
+                tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+                tree.header().setStretchLastSection(False)
+                tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+                # 가장 최근 연도는 펼쳐서 표시
+                tree.expand(stats_model.index(0, 0))
+                layout.addWidget(tree)
+            else:
+                # 데이터가 없는 경우 안내 메시지 표시
                 no_data_label = QLabel("사용 내역이 없습니다.")
-                scroll_layout.addWidget(no_data_label)
-            
-            # 스크롤 영역 완성
-            scroll_area.setWidget(scroll_content)
-            layout.addWidget(scroll_area)
+                no_data_label.setAlignment(Qt.AlignTop)
+                layout.addWidget(no_data_label, 1)
             
             # 닫기 버튼 추가
             close_button = QPushButton("닫기")
@@ -1311,16 +1914,200 @@ class PinManagerApp(QMainWindow):
         with open('config.ini', 'w', encoding='utf-8') as configfile:
             config.write(configfile)
     
+    def stall_watchdog_change(self):
+        if config['SETTING']['stall_watchdog'] == 'True':
+            config['SETTING']['stall_watchdog'] = 'False'
+            self.stop_stall_watchdog()
+        else:
+            config['SETTING']['stall_watchdog'] = 'True'
+            self.start_stall_watchdog()
+        with open('config.ini', 'w', encoding='utf-8') as configfile:
+            config.write(configfile)
+
+    def start_stall_watchdog(self):
+        """이벤트 루프가 멈추면 멈춘 시간과 실행 중이던 코드를 resource/stalls.log에 기록합니다"""
+        if self.stall_watchdog is not None:
+            return
+        threshold = int(config['SETTING']['stall_threshold_ms']) / 1000
+        self.stall_watchdog = StallWatchdog(threshold=threshold)
+        # 이벤트 루프가 돌고 있으면 이 타이머가 계속 호출됨
+        self.stall_timer = QTimer(self)
+        self.stall_timer.setInterval(min(50, max(10, int(threshold * 250))))
+        self.stall_timer.timeout.connect(self.stall_watchdog.beat)
+        self.stall_timer.start()
+        self.stall_watchdog.start()
+
+    def stop_stall_watchdog(self):
+        if self.stall_watchdog is None:
+            return
+        self.stall_timer.stop()
+        self.stall_timer.deleteLater()
+        self.stall_watchdog.stop()
+        self.stall_watchdog = None
+
+    def clipboard_watch_change(self):
+        if config['SETTING']['clipboard_watch'] == 'True':
+            config['SETTING']['clipboard_watch'] = 'False'
+            self.stop_clipboard_watch()
+        else:
+            config['SETTING']['clipboard_watch'] = 'True'
+            self.start_clipboard_watch()
+        with open('config.ini', 'w', encoding='utf-8') as configfile:
+            config.write(configfile)
+
+    def start_clipboard_watch(self):
+        """텍스트를 복사할 때마다 PIN이 있는지 확인하고, 새 PIN이 있으면 한 번에 추가하도록 제안합니다"""
+        if self.clipboard_watching:
+            return
+        QApplication.clipboard().dataChanged.connect(self.on_clipboard_changed)
+        self.clipboard_watching = True
+
+    def stop_clipboard_watch(self):
+        if not self.clipboard_watching:
+            return
+        QApplication.clipboard().dataChanged.disconnect(self.on_clipboard_changed)
+        self.clipboard_watching = False
+        if self.clipboard_offer is not None:
+            self.clipboard_offer.close()
+
+    def on_clipboard_changed(self):
+        # 자동 사용 중에는 이 프로그램이 자바스크립트 코드와 실행 결과를 클립보드로 주고받으므로 보지 않음
+        if self.automation is not None:
+            return
+        text = QApplication.clipboard().text()
+        if text == self.clipboard_last_text or text == self.clipboard_own_text:
+            return
+        self.clipboard_last_text = text
+        # 길이와 숫자 비율로 먼저 거르므로 큰 텍스트나 PIN이 없는 텍스트는 해석하지 않음
+        if not may_contain_pins(text):
+            return
+        self.manager.refresh_spent_pins()
+        rows = [(pin, amount) for pin, amount, _ in parse_pins(text, int(config['SETTING']['clipboard_default_amount']))
+                if pin not in self.manager.pins and not self.manager.is_pin_spent(pin)]
+        if rows:
+            self.offer_clipboard_pins(rows)
+
+    def offer_clipboard_pins(self, rows):
+        """클립보드에서 찾은 새 PIN을 추가할지 묻는 창 (모달이 아니며 다른 창의 포커스를 빼앗지 않음)"""
+        if self.clipboard_offer is not None:
+            self.clipboard_offer.close()
+        preview = "\n".join(f"{pin}  {amount:,}원" for pin, amount in rows[:5])
+        if len(rows) > 5:
+            preview += f"\n... 외 {len(rows) - 5:,}개"
+        offer = QMessageBox(QMessageBox.Question, "클립보드 PIN 감지",
+                            f"복사한 텍스트에서 새 PIN {len(rows):,}개를 찾았습니다.\n\n{preview}", parent=self)
+        add_button = offer.addButton("추가", QMessageBox.AcceptRole)
+        offer.addButton("무시", QMessageBox.RejectRole)
+        offer.setModal(False)
+        offer.setAttribute(Qt.WA_ShowWithoutActivating)
+        offer.setAttribute(Qt.WA_DeleteOnClose)
+
+        def finished():
+            if self.clipboard_offer is offer:
+                self.clipboard_offer = None
+            if offer.clickedButton() is add_button:
+                # 제안한 뒤 다른 곳에서 추가했을 수 있으므로 add_pins가 이미 있는 PIN은 건너뜀
+                added = self.manager.add_pins(rows)
+                if added:
+                    self.manager.save_pins()
+                    self.manager.save_pins_to_txt()
+
+        offer.finished.connect(finished)
+        self.clipboard_offer = offer
+        offer.show()
+
+    def show_stall_log(self):
+        """기록된 화면 멈춤을 오래 멈춘 순으로 보여줍니다"""
+        entries = worst_stalls(read_stalls())
+        dialog = QDialog(self)
+        dialog.setWindowTitle("화면 멈춤 기록")
+        dialog.resize(760, 520)
+        layout = QVBoxLayout(dialog)
+
+        if not entries:
+            state = "켜져 있습니다" if self.stall_watchdog is not None else "꺼져 있습니다 (설정 - 화면 멈춤 감지 - 멈춤 감지 켜기)"
+            layout.addWidget(QLabel(f"기록된 멈춤이 없습니다.\n멈춤 감지가 {state}.", dialog))
+        else:
+            layout.addWidget(QLabel(f"오래 멈춘 순 {len(entries)}건 (기준: {config['SETTING']['stall_threshold_ms']}ms 이상)", dialog))
+            root = os.path.dirname(os.path.abspath(__file__))
+            table = QTableWidget(len(entries), 4, dialog)
+            table.setHorizontalHeaderLabels(["멈춘 시간", "발생 시각", "위치", "채취"])
+            table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            table.setSelectionBehavior(QAbstractItemView.SelectRows)
+            table.setSelectionMode(QAbstractItemView.SingleSelection)
+            table.verticalHeader().setVisible(False)
+            for row, entry in enumerate(entries):
+                elapsed = QTableWidgetItem(f"{entry.get('elapsed_ms', 0):,}ms")
+                elapsed.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, 0, elapsed)
+                table.setItem(row, 1, QTableWidgetItem(entry.get('time', '')))
+                table.setItem(row, 2, QTableWidgetItem(stall_location(entry, root)))
+                table.setItem(row, 3, QTableWidgetItem(f"{entry.get('stack_samples', 0)}/{entry.get('samples', 0)}"))
+            table.resizeColumnsToContents()
+            table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+            layout.addWidget(table, 2)
+
+            # 선택한 멈춤의 스택 (가장 많이 채취된 스택, 안쪽 프레임이 아래)
+            stack_view = QPlainTextEdit(dialog)
+            stack_view.setReadOnly(True)
+            stack_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+            layout.addWidget(stack_view, 1)
+
+            def show_stack():
+                entry = entries[table.currentRow()]
+                stack_view.setPlainText("\n".join(f'File "{filename}", line {lineno}, in {name}'
+                                                  for filename, lineno, name in entry.get('stack', [])))
+            table.currentCellChanged.connect(show_stack)
+            table.selectRow(0)
+
+        close_button = QPushButton("닫기", dialog)
+        close_button.clicked.connect(dialog.accept)
+        layout.addWidget(close_button)
+        dialog.exec()
+
     # PIN 목록을 로그 파일로부터 복구하는 함수
     def restore_pins(self):
         reply = QMessageBox.question(self, "PIN 복구", "PIN 목록을 로그 파일로부터 복구하시겠습니까?", QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             result = self.manager.load_pins_from_log()
             QMessageBox.information(self, "PIN 복구", result)
-            self.update_table()
+
+    # 다른 PC와 동기화할 변경분을 파일로 내보내는 함수
+    def export_sync_file(self):
+        filename, _ = QFileDialog.getSaveFileName(self, "동기화 파일 내보내기", "pins_sync.eggsync", "동기화 파일 (*.eggsync)")
+        if not filename:
+            return
+        try:
+            data = self.manager.export_sync()
+            with open(filename, "wb") as file:
+                file.write(data)
+        except (OSError, TimeoutError) as e:
+            QMessageBox.warning(self, "동기화 파일 내보내기", f"내보내기에 실패했습니다.\n{e}")
+            return
+        QMessageBox.information(self, "동기화 파일 내보내기", f"변경분을 저장했습니다. ({len(data):,} 바이트)\n{filename}")
+
+    # 다른 PC에서 내보낸 변경분을 가져와 병합하는 함수
+    def import_sync_file(self):
+        filename, _ = QFileDialog.getOpenFileName(self, "동기화 파일 가져오기", "", "동기화 파일 (*.eggsync);;모든 파일 (*)")
+        if not filename:
+            return
+        try:
+            with open(filename, "rb") as file:
+                delta, count = self.manager.import_sync(file.read())
+        except (OSError, ValueError, TimeoutError) as e:
+            QMessageBox.warning(self, "동기화 파일 가져오기", f"가져오기에 실패했습니다.\n{e}")
+            return
+        self.manager.save_pins_to_txt()
+        QMessageBox.information(self, "동기화 파일 가져오기",
+                                f"{count}개의 변경 기록을 병합했습니다.\n"
+                                f"추가/잔액 변경 {len(delta.changed)}개, 삭제 {len(delta.removed)}개, "
+                                f"잠금 변경 {len(delta.locked) + len(delta.unlocked)}개")
 
     # 테이블 위젯에 컨텍스트 메뉴 추가
     def contextMenuEvent(self, event):
+        if self.showing_combined_wallets() or self.loading or self.automation is not None:
+            # 불러오는 중에는 지갑이 아직 비어 있고, 자동 사용 중에는 작업이 끝난 뒤 반영할 PIN을 바꾸지 못하게 함
+            return
         context_menu = QMenu(self)
 
         copy_pin_action = QAction("PIN 복사", self)
@@ -1354,58 +2141,57 @@ class PinManagerApp(QMainWindow):
 
         context_menu.exec(self.mapToGlobal(event.pos()))
 
+    def current_pin(self):
+        """테이블에서 현재 선택된 PIN (없으면 None)"""
+        index = self.table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.pin_proxy.pin_at(index.row())
+
+    def selected_pins(self):
+        """테이블에서 선택된 행의 PIN 목록"""
+        rows = sorted(index.row() for index in self.table.selectionModel().selectedRows())
+        return [self.pin_proxy.pin_at(row) for row in rows]
+
     def copy_pin_to_clipboard(self):
         """선택된 PIN을 클립보드에 복사합니다"""
-        selected_items = self.table.currentItem()
-        if not selected_items:
+        pin = self.current_pin()
+        if not pin:
             QMessageBox.warning(self, "오류", "복사할 PIN을 선택해 주세요.")
             return
-        # 선택된 PIN의 행에서 PIN 번호를 가져옵니다
-        pin = self.table.item(selected_items.row(), 0).text()
         # 클립보드에 PIN 번호를 복사합니다
         pyperclip.copy(pin)
         
     def toggle_selected_pin_lock(self):
         """선택된 핀의 잠금 상태를 토글합니다"""
-        selected_items = self.table.selectedItems()
-        if not selected_items:
+        selected_pins = self.selected_pins()
+        if not selected_pins:
             QMessageBox.warning(self, "오류", "잠금/해제할 PIN을 선택해 주세요.")
             return
             
-        selected_rows = set([item.row() for item in selected_items])
-        for row in selected_rows:
-            pin = self.table.item(row, 0).text()
+        for pin in selected_pins:
             self.manager.toggle_pin_lock(pin)
             
-        QMessageBox.information(self, "완료", f"{len(selected_rows)}개의 PIN 잠금 상태가 변경되었습니다.")
-        self.update_table()
+        QMessageBox.information(self, "완료", f"{len(selected_pins)}개의 PIN 잠금 상태가 변경되었습니다.")
 
     # 테이블에서 선택된 핀을 삭제하는 기능
     def delete_selected_pin(self):
-        selected_items = self.table.currentItem()
-        if selected_items:
+        pin = self.current_pin()
+        if pin:
             cancel = QMessageBox.warning(self, "삭제 확인", "정말 삭제하시겠습니까?", QMessageBox.Yes | QMessageBox.No)
             if cancel == QMessageBox.Yes:
-                pin = self.table.item(selected_items.row(), 0).text()
                 result = self.manager.delete_pin(pin)
                 QMessageBox.information(self, "결과", result)
-                self.update_table()
     
     # 여러 PIN을 동시에 삭제하는 기능
     def delete_multiple_pins(self):
-        # 선택된 행 가져오기
-        selected_rows = set([item.row() for item in self.table.selectedItems()])
+        # 선택된 PIN 목록 가져오기
+        selected_pins = self.selected_pins()
         
-        if not selected_rows:
+        if not selected_pins:
             QMessageBox.warning(self, "오류", "삭제할 PIN을 선택해 주세요.")
             return
         
-        # 선택된 PIN 목록 생성
-        selected_pins = []
-        for row in selected_rows:
-            pin = self.table.item(row, 0).text()
-            selected_pins.append(pin)
-        
         # 사용자에게 삭제 확인 메시지 표시
         message = f"선택한 {len(selected_pins)}개의 PIN을 삭제하시겠습니까?\n\n"
         if len(selected_pins) <= 5:  # 5개 이하면 목록 표시
@@ -1432,13 +2218,11 @@ class PinManagerApp(QMainWindow):
         
         # 결과 메시지 표시
         QMessageBox.information(self, "결과", f"{deleted_count}개의 PIN이 삭제되었습니다.")
-        self.update_table()
     
     # 테이블에서 선택된 핀의 잔액을 수정하는 기능
     def edit_selected_pin_balance(self):
-        selected_items = self.table.currentItem()
-        if selected_items:
-            pin = self.table.item(selected_items.row(), 0).text()
+        pin = self.current_pin()
+        if pin:
             # new_balance, ok = QInputDialog.getInt(self, "잔액 수정", "새 잔액 입력:", 0)
             new_balance, ok = self.amount_input_dialog('잔액 수정')
             if not ok:
@@ -1450,98 +2234,270 @@ class PinManagerApp(QMainWindow):
             if ok:
                 result = self.manager.update_pin_balance(pin, new_balance)
                 QMessageBox.information(self, "성공", "잔액 수정이 완료되었습니다.")
-                self.update_table()
+
+    COMBINED_WALLETS = "전체 (합계)"
+
+    def showing_combined_wallets(self):
+        return self.table_stack.currentWidget() is self.summary_table
+
+    def update_wallet_combo(self):
+        self.wallet_combo.clear()
+        self.wallet_combo.addItems(self.wallets.names())
+        self.wallet_combo.insertSeparator(self.wallet_combo.count())
+        self.wallet_combo.addItem(self.COMBINED_WALLETS)
+        if self.showing_combined_wallets():
+            self.wallet_combo.setCurrentText(self.COMBINED_WALLETS)
+        else:
+            self.wallet_combo.setCurrentText(self.current_wallet)
+
+    def on_wallet_selected(self, index):
+        name = self.wallet_combo.itemText(index)
+        if name == self.COMBINED_WALLETS:
+            self.show_combined_wallets()
+        else:
+            self.switch_wallet(name)
+
+    def switch_wallet(self, name):
+        """지갑을 바꿉니다. 최근에 연 지갑은 다시 불러오지 않고 바뀐 부분만 반영합니다"""
+        was_open = self.wallets.is_open(name)
+        try:
+            manager = self.wallets.open(name)
+            if was_open:
+                manager.reload_external()
+        except (KeyError, json.JSONDecodeError, TimeoutError) as e:
+            QMessageBox.warning(self, "지갑 열기", f"'{name}' 지갑을 열 수 없습니다.\n{e}")
+            self.update_wallet_combo()
+            return
+
+        self.file_watcher.removePaths(self.file_watcher.files())
+        self.manager = manager
+        self.search_index.close()
+        self.search_index = PinSearchIndex(manager)
+        self.pin_model.set_manager(manager)
+        self.apply_search()
+        self.current_wallet = name
+        self.watch_wallet_files()
+
+        self.table_stack.setCurrentWidget(self.table)
+        for button in self.wallet_buttons:
+            button.setEnabled(True)
+        self.update_wallet_combo()
+        self.update_balance_label()
+
+        config['SETTING']['wallet'] = name
+        with open('config.ini', 'w', encoding='utf-8') as configfile:
+            config.write(configfile)
+
+    def show_combined_wallets(self):
+        """모든 지갑의 잔액 합계를 읽기 전용으로 표시합니다"""
+        rows, combined = self.wallets.combined_summary()
+        self.summary_table.setRowCount(len(rows))
+        for row, (name, data) in enumerate(rows):
+            values = [name, '{0:,}'.format(data['total']), '{0:,}'.format(data['total'] - data['locked']), str(data['count'])]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.summary_table.setItem(row, column, item)
+
+        self.table_stack.setCurrentWidget(self.summary_table)
+        for button in self.wallet_buttons:
+            button.setEnabled(False)
+        self.sum.setText(f"전체 잔액 : {'{0:,}'.format(combined['total'])} (PIN {combined['count']}개)")
+        self.update_wallet_combo()
+
+    def open_wallet_from_summary(self, row, column):
+        self.switch_wallet(self.summary_table.item(row, 0).text())
+
+    def create_wallet(self):
+        name, ok = QInputDialog.getText(self, "새 지갑", "지갑 이름 (예: 게임 계정 이름):")
+        if not ok or not name.strip():
+            return
+        if name.strip() == self.COMBINED_WALLETS:
+            QMessageBox.warning(self, "새 지갑", "사용할 수 없는 지갑 이름입니다.")
+            return
+        try:
+            name = self.wallets.create(name)
+        except (ValueError, OSError) as e:
+            QMessageBox.warning(self, "새 지갑", str(e))
+            return
+        self.switch_wallet(name)
+
+    def update_balance_label(self):
+        # 지갑이 유지하는 합계를 그대로 사용 (PIN 수와 무관하게 즉시 계산)
+        total = self.manager.get_total_balance()
+        available = self.manager.get_available_balance()
+        text = f"잔액 : {'{0:,}'.format(total)}"
+        if available != total:
+            text += f" (사용 가능 {'{0:,}'.format(available)})"
+        self.sum.setText(text + f" / PIN {self.manager.get_pin_count()}개")
 
     def update_table(self):
-        self.sum.setText(f"잔액 : {'{0:,}'.format(self.manager.get_total_balance())}")
-        pins = self.manager.list_pins()
-        self.table.setRowCount(len(pins))
-        for row, (pin, balance) in enumerate(pins):
-            # PIN 번호 열
-            self.table.setItem(row, 0, QTableWidgetItem(pin))
-            self.table.item(row, 0).setTextAlignment(Qt.AlignCenter)
-            
-            # 잔액 열
-            self.table.setItem(row, 1, QTableWidgetItem('{0:,}'.format(balance)))
-            self.table.item(row, 1).setTextAlignment(Qt.AlignCenter)
-            
-            # 잠금 상태 열 - 체크박스 위젯 사용
-            checkbox = QCheckBox()
-            checkbox.setChecked(self.manager.is_pin_locked(pin))
-            checkbox.stateChanged.connect(lambda state, p=pin: self.toggle_pin_lock(p, state))
-
-            # 체크박스 레이아웃 최적화
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            checkbox_widget.setLayout(checkbox_layout)
-            checkbox_widget.setStyleSheet("background-color: transparent;")
-
-            self.table.setCellWidget(row, 2, checkbox_widget)
-
-            # 잠긴 핀에 시각적 표시 추가 (회색 배경과 이탤릭체)
-            if self.manager.is_pin_locked(pin):
-                # for col in range(2):  # 첫 두 열만 스타일 적용 (체크박스 제외)
-                item = self.table.item(row, 0)
-                item2 = self.table.item(row, 1)
-                font = item.font()
-                font2 = item2.font()
-                font.setItalic(True)
-                font2.setItalic(True)
-                font.setStrikeOut(True)
-                font2.setStrikeOut(True)
-                item.setFont(font)
-                item2.setFont(font2)
-                # item.setForeground(QColor(128, 128, 128))  # 회색 텍스트
-                # item.setBackground(QColor(240, 240, 240))  # 연한 회색 배경
-            else:
-                # 잠긴 핀이 아닌 경우 스타일 초기화
-                item = self.table.item(row, 0)
-                item2 = self.table.item(row, 1)
-                font = item.font()
-                font2 = item2.font()
-                font.setItalic(False)
-                font2.setItalic(False)
-                font.setStrikeOut(False)
-                font2.setStrikeOut(False)
-                item.setFont(font)
-                item2.setFont(font2)
-
-        # PinManagerApp 클래스에 추가
-    def toggle_pin_lock(self, pin, state):
-        """핀의 잠금 상태를 토글합니다"""
-        self.manager.toggle_pin_lock(pin)
+        self.update_balance_label()
+        self.pin_model.refresh()
 
-        self.update_table()
-    
-    sort_flag = 0
-    
-    def sort_pins(self):
-        """잔액을 기준으로 PIN 목록을 정렬하는 함수"""
-        if self.sort_flag == 0:
-            self.manager.pins = dict(sorted(self.manager.pins.items(), key=lambda x: x[1]))
-            self.sort_flag = 1
+    # 시작할 때 지갑 불러오기
+    def start_loading_wallet(self):
+        """지갑을 작업 스레드에서 읽고, 읽은 PIN은 조금씩 나눠 테이블에 추가합니다
+
+        그동안 창은 먼저 표시되고 지갑 관련 버튼만 비활성화됩니다.
+        """
+        self.reload_pending = False
+        self.set_loading(True)
+        self.loader = WalletLoader(self.manager)
+        self.loader_thread = QThread(self)
+        self.loader.moveToThread(self.loader_thread)
+        self.loader_thread.started.connect(self.loader.run)
+        self.loader.loaded.connect(self.on_wallet_loaded)
+        self.loader.failed.connect(self.on_wallet_load_failed)
+        self.loader_thread.start()
+
+    def set_loading(self, loading):
+        self.loading = loading
+        for widget in self.wallet_buttons + self.wallet_actions + [self.wallet_combo]:
+            widget.setEnabled(not loading)
+        self.automation_cancel.setVisible(not loading)
+        if loading:
+            self.automation_bar.setRange(0, 0)  # 파일을 읽는 동안은 진행률을 알 수 없음
+            self.statusBar().showMessage("지갑을 불러오는 중...")
+            self.statusBar().show()
+            self.sum.setText("잔액 : 불러오는 중...")
         else:
-            self.manager.pins = dict(sorted(self.manager.pins.items(), key=lambda x: x[1], reverse=True))
-            self.sort_flag = 0
-        self.update_table()
+            self.automation_bar.setRange(0, 100)
+            self.statusBar().clearMessage()
+            self.statusBar().hide()
+            self.update_balance_label()
+
+    def finish_loader_thread(self):
+        self.loader_thread.quit()
+        self.loader_thread.wait()
+        self.loader.deleteLater()
+        self.loader_thread.deleteLater()
+        self.loader = None
+        self.loader_thread = None
+
+    @Slot(object, object, object)
+    def on_wallet_loaded(self, pins, locked_pins, stamp):
+        self.finish_loader_thread()
+        self.loading_total = len(pins)
+        self.loading_steps = self.manager.load_snapshot(pins, locked_pins, stamp)
+        self.automation_bar.setRange(0, max(1, len(pins)))
+        self.load_next_chunk()
+
+    def load_next_chunk(self):
+        # 한 묶음 추가할 때마다 이벤트 루프로 돌아가 그 사이에 화면을 그림
+        loaded = next(self.loading_steps, None)
+        if loaded is not None:
+            self.automation_bar.setValue(loaded)
+            self.statusBar().showMessage(f"지갑을 불러오는 중... ({loaded:,}/{self.loading_total:,})")
+            QTimer.singleShot(0, self.load_next_chunk)
+            return
+        self.loading_steps = None
+        self.finish_loading()
+
+    @Slot(str)
+    def on_wallet_load_failed(self, message):
+        self.finish_loader_thread()
+        self.finish_loading()
+        QMessageBox.warning(self, "지갑 열기", f"'{self.current_wallet}' 지갑을 불러올 수 없습니다.\n{message}")
+
+    def finish_loading(self):
+        self.set_loading(False)
+        self.report_startup_time()
+        if self.reload_pending:
+            self.reload_wallet_from_disk()
+        else:
+            self.watch_wallet_files()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.first_paint_ms is None:
+            self.first_paint_ms = (time.perf_counter() - startup_started) * 1000
+
+    def report_startup_time(self):
+        """첫 화면이 그려질 때까지와 사용할 수 있을 때까지 걸린 시간을 resource/startup_times.log에 남깁니다"""
+        interactive_ms = (time.perf_counter() - startup_started) * 1000
+        entry = {
+            'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'first_paint_ms': round(self.first_paint_ms) if self.first_paint_ms is not None else None,
+            'interactive_ms': round(interactive_ms),
+            'pins': self.manager.get_pin_count(),
+        }
+        try:
+            with open(os.path.join("resource", "startup_times.log"), "a", encoding='utf-8') as file:
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError:
+            pass
+
+    def setup_file_watcher(self):
+        """다른 EggManager 창이나 CLI가 지갑 파일을 바꾸면 변경분만 다시 불러오도록 감시합니다"""
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(self.on_wallet_file_changed)
+        self.watch_wallet_files()
+
+        # 한 번의 저장에 여러 번 알림이 올 수 있으므로 잠시 모아서 처리
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(200)
+        self.reload_timer.timeout.connect(self.reload_wallet_from_disk)
+
+    def watch_wallet_files(self):
+        # 임시 파일 교체 방식으로 저장하면 감시가 풀리므로 매번 다시 등록
+        for path in (self.manager.filename, self.manager.locked_pins_file):
+            if os.path.exists(path) and path not in self.file_watcher.files():
+                self.file_watcher.addPath(path)
+
+    def on_wallet_file_changed(self, path):
+        self.reload_timer.start()
+
+    def reload_wallet_from_disk(self):
+        """디스크의 변경분을 지갑과 테이블에 반영합니다"""
+        if self.loading or self.automation is not None:
+            # 불러오기나 자동 사용이 끝난 뒤에 반영
+            self.reload_pending = True
+            return
+        self.watch_wallet_files()
+        try:
+            # 바뀐 PIN만 지갑 변경 알림으로 테이블에 반영됨
+            self.manager.reload_external()
+        except (json.JSONDecodeError, TimeoutError):
+            # 다른 프로세스가 아직 쓰는 중이면 다음 알림에서 다시 시도
+            return
+
+    def apply_search(self, text=None):
+        """검색어에 맞는 PIN만 테이블에 표시합니다"""
+        if text is None:
+            text = self.search_edit.text()
+        query = PinQuery(text)
+        if not query:
+            self.pin_proxy.set_filter(None)
+            return
+        # 처음에는 색인 결과로 거르고, 이후 바뀐 PIN은 검색어와 직접 비교
+        self.pin_proxy.set_filter(lambda pin: query.matches(pin, self.manager.pins[pin]), self.search_index.search(query))
+
+    def sort_pins(self, column):
+        """열 머리글을 클릭한 열로 정렬합니다 (Shift+클릭은 보조 정렬 기준 추가)"""
+        append = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        self.pin_proxy.toggle_sort_key(column, append)
 
     # PIN 추가 다이얼로그
     def add_pin(self):
         pin, ok = QInputDialog.getText(self, "PIN 추가", "PIN 입력 (핀 전체 또는 숫자만 입력):")
         pin = self.manager.format_pin(pin)
+        self.manager.refresh_spent_pins()
         if self.manager.pin_check(pin) == 1:
             QMessageBox.warning(self, "PIN오류", "중복된 PIN입니다.")
         elif not self.manager.is_valid_pin_format(pin) and ok:
             QMessageBox.warning(self, "오류", "올바른 PIN 형식이 아닙니다.")
+        elif ok and self.manager.is_pin_spent(pin) and QMessageBox.question(
+                self, "이미 사용됨", f"PIN {pin}은(는) 이미 모두 사용한 PIN입니다.\n그래도 추가하시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No) != QMessageBox.Yes:
+            return
         elif ok and pin:
             balance, ok = self.amount_input_dialog()
             if ok and balance > 0:
                 result = self.manager.add_pin(pin, balance)
                 QMessageBox.information(self, "결과", result)
-                self.update_table()
             elif ok and balance <= 0:
                 QMessageBox.warning(self, "금액 오류", "0보다 작은 금액은 입력할 수 없습니다.")
             elif ok and not balance:
@@ -1550,11 +2506,10 @@ class PinManagerApp(QMainWindow):
     # PIN 삭제 다이얼로그
     def delete_pin(self):
         # pin, ok = QInputDialog.getText(self, "PIN 삭제", "삭제할 PIN 입력:")
-        selected_items = self.table.currentItem()
-        if not selected_items:
+        pin = self.current_pin()
+        if not pin:
             QMessageBox.warning(self, "오류", "삭제할 PIN을 선택해 주세요.")
             return
-        pin = self.table.item(selected_items.row(), 0).text()
         ok = QMessageBox.question(self, "PIN 삭제", f"PIN: {pin}을 삭제하시겠습니까?", QMessageBox.Yes | QMessageBox.No)
         if ok != QMessageBox.Yes:
             return
@@ -1566,7 +2521,6 @@ class PinManagerApp(QMainWindow):
                 if cancel == QMessageBox.Yes:
                     result = self.manager.delete_pin(pin)
                     QMessageBox.information(self, "결과", result)
-                    self.update_table()
 
     # PIN 자동 사용 기능
     def use_pins(self):
@@ -1576,7 +2530,7 @@ class PinManagerApp(QMainWindow):
         selectbox.setWindowTitle("PIN 자동 사용")
         
         # 선택된 행이 있는지 확인
-        selected_rows = set([item.row() for item in self.table.selectedItems()])
+        selected_rows = self.selected_pins()
         
         if selected_rows:
             selectbox.setWindowTitle("선택된 PIN 자동 사용")
@@ -1584,12 +2538,9 @@ class PinManagerApp(QMainWindow):
             locked_pin_count = 0
             
             # 선택된 핀 중 잠기지 않은 핀만 필터링
-            filtered_rows = []
-            for row in selected_rows:
-                pin = self.table.item(row, 0).text()
+            for pin in selected_rows:
                 if not self.manager.is_pin_locked(pin):
                     pin_num.append(pin)
-                    filtered_rows.append(row)
                 else:
                     locked_pin_count += 1
             
@@ -1605,12 +2556,12 @@ class PinManagerApp(QMainWindow):
                 message += "사용될 PIN 목록:\n" + "\n".join(pin_num)
             else:  # 5개 초과면 일부만 표시
                 message += "사용될 PIN 목록 (일부):\n" + "\n".join(pin_num[:5]) + f"\n... 외 {len(pin_num)-5}개"
-            selectbox.setText("\n사용 방법을 선택하세요.\n" + message + "\n사용가능한 총 금액: " + str('{0:,}'.format(sum(int(self.table.item(row, 1).text().replace(',', '')) for row in filtered_rows))) + "원")
+            selectbox.setText("\n사용 방법을 선택하세요.\n" + message + "\n사용가능한 총 금액: " + str('{0:,}'.format(sum(self.manager.pins[pin] for pin in pin_num))) + "원")
             # PIN이 선택되었을 때 "선택된 PIN 사용" 버튼 추가
             # selected_pins = QPushButton("선택된 PIN 사용")
             # selectbox.addButton(selected_pins, QMessageBox.AcceptRole)
         else:
-            selectbox.setText("\n사용 방법을 선택하세요.\n")
+            selectbox.setText("\n사용 방법을 선택하세요.\n\n사용가능한 총 금액: " + str('{0:,}'.format(self.manager.get_available_balance())) + "원")
             
         browser = QPushButton("브라우저")
         ingame = QPushButton("HAOPLAY")
@@ -1624,51 +2575,155 @@ class PinManagerApp(QMainWindow):
         clicked_button = selectbox.clickedButton()
 
         if selected_rows:
-            selected_pins_data = []
-            for row in filtered_rows:
-                pin = self.table.item(row, 0).text()
-                balance = int(self.table.item(row, 1).text().replace(',', ''))
-                selected_pins_data.append((pin, balance))
+            selected_pins_data = [(pin, self.manager.pins[pin]) for pin in pin_num]
 
             if clicked_button == browser:
                 # 브라우저 사용
-                result = self.use_selected_pins_browser(selected_pins_data)
-                if isinstance(result, str) and ("❌" in result or "오류" in result or "실패" in result):
-                    self.show_warning_with_copy("오류", result)
-                else:
-                    QMessageBox.information(self, "결과", result)
-                self.update_table()
+                self.use_selected_pins_browser(selected_pins_data)
             elif clicked_button == ingame:
                 # HAOPLAY 사용
-                result = self.use_selected_pins_auto(selected_pins_data)
-                if isinstance(result, str) and ("❌" in result or "오류" in result or "실패" in result):
-                    self.show_warning_with_copy("오류", result)
-                else:
-                    QMessageBox.information(self, "결과", result)
-                self.update_table()
+                self.use_selected_pins_auto(selected_pins_data)
         elif clicked_button == ingame:
             ok = QMessageBox.question(self, "인게임 결제", "인게임 자동 결제를 사용하시겠습니까?")
             if ok == QMessageBox.Yes:
-                result = self.use_pins_auto()
-                if isinstance(result, str) and ("❌" in result or "오류" in result or "실패" in result):
-                    self.show_warning_with_copy("오류", result)
-                else:
-                    QMessageBox.information(self, "결과", result)
-                self.update_table()
+                self.use_pins_auto()
         elif clicked_button == browser:
             amount, ok = QInputDialog.getInt(self, "브라우저 PIN 자동 채우기", "사용할 금액 입력:", step=1000)
             if ok and amount > 0:
-                result = self.use_pins_browser(amount)
-                if isinstance(result, str) and ("❌" in result or "오류" in result or "실패" in result):
-                    self.show_warning_with_copy("오류", result)
-                else:
-                    QMessageBox.information(self, "결과", result)
-                self.update_table()
+                self.use_pins_browser(amount)
+
+    def show_usage_result(self, result):
+        if isinstance(result, str) and ("❌" in result or "오류" in result or "실패" in result):
+            self.show_warning_with_copy("오류", result)
+        else:
+            QMessageBox.information(self, "결과", result)
+
+    # 자동 사용 작업 스레드 관리
+    def start_automation(self, job, on_success):
+        """job(worker)을 작업 스레드에서 실행하고, 끝나면 GUI 스레드에서 on_success(결과)를 호출합니다
+
+        자동 사용은 다른 창에 키 입력을 보내며 여러 번 기다리므로, GUI 스레드에서 실행하면
+        그동안 창이 응답하지 않습니다. 진행 상황은 상태 표시줄에 표시하고 취소할 수 있습니다.
+        """
+        if self.automation is not None:
+            return
+        self.automation = AutomationWorker(job)
+        self.automation_thread = QThread(self)
+        self.automation_done = on_success
+        self.automation.moveToThread(self.automation_thread)
+        self.automation_thread.started.connect(self.automation.run)
+        self.automation.progress.connect(self.on_automation_progress)
+        self.automation.succeeded.connect(self.on_automation_succeeded)
+        self.automation.failed.connect(self.on_automation_failed)
+
+        # 진행 중에는 지갑을 바꾸지 못하게 함 (끝나면 GUI 스레드에서 지갑에 반영)
+        for widget in self.wallet_buttons + self.wallet_actions + [self.wallet_combo]:
+            widget.setEnabled(False)
+        self.automation_bar.setValue(0)
+        self.automation_cancel.setEnabled(True)
+        self.statusBar().show()
+        self.automation_thread.start()
+
+    def cancel_automation(self):
+        if self.automation is not None:
+            self.automation.cancel()
+            self.automation_cancel.setEnabled(False)
+            self.statusBar().showMessage("취소하는 중...")
+
+    def finish_automation(self):
+        self.automation_thread.quit()
+        self.automation_thread.wait()
+        self.automation.deleteLater()
+        self.automation_thread.deleteLater()
+        self.automation = None
+        self.automation_thread = None
+        self.statusBar().clearMessage()
+        self.statusBar().hide()
+        for widget in self.wallet_buttons + self.wallet_actions + [self.wallet_combo]:
+            widget.setEnabled(True)
+        if self.reload_pending:
+            # 자동 사용 중에 바뀐 디스크 변경분은 사용 결과를 반영한 뒤에 불러옴
+            self.reload_wallet_from_disk()
+
+    @Slot(int, str)
+    def on_automation_progress(self, percent, text):
+        self.automation_bar.setValue(percent)
+        self.statusBar().showMessage(text)
+
+    @Slot(object)
+    def on_automation_succeeded(self, result):
+        on_success = self.automation_done
+        self.automation_done = None
+        message = on_success(result)  # 미뤄 둔 다시 불러오기보다 먼저 사용 결과를 반영
+        self.finish_automation()
+        self.show_usage_result(message)
+
+    @Slot(str)
+    def on_automation_failed(self, message):
+        self.finish_automation()
+        self.show_usage_result(message)
+
+    def automation_sleep(self, seconds):
+        """자동 사용 중이면 취소를 확인하며 기다립니다"""
+        if self.automation is not None and QThread.currentThread() != self.thread():
+            self.automation.sleep(seconds)
+        else:
+            time.sleep(seconds)
+
+    def call_in_gui_thread(self, slot, *args):
+        """GUI 스레드에서 slot(*args)을 실행하고 반환값(int)을 돌려받습니다 (작업 스레드에서 대화상자를 띄울 때)"""
+        if QThread.currentThread() == self.thread():
+            return getattr(self, slot)(*args)
+        return QMetaObject.invokeMethod(self, slot, Qt.BlockingQueuedConnection, Q_RETURN_ARG(int),
+                                        *[Q_ARG(str, arg) for arg in args])
+
+    def show_warning_later(self, title, message):
+        """어느 스레드에서든 GUI 스레드에 경고창을 띄웁니다 (기다리지 않음)"""
+        QMetaObject.invokeMethod(self, "show_warning_with_copy", Qt.QueuedConnection,
+                                 Q_ARG(str, title), Q_ARG(str, message))
+
+    @Slot(str, str, str, result=int)
+    def ask_amount(self, title, message, label):
+        """금액을 직접 입력받습니다. 취소하면 -1을 반환합니다"""
+        if message:
+            QMessageBox.warning(self, title, message)
+        amount, ok = QInputDialog.getInt(self, "금액 수동 입력", label, 0, 0, 1000000, 1000)
+        return amount if ok else -1
+
+    @Slot(str, str, result=int)
+    def ask_yes_no(self, title, text):
+        return int(QMessageBox.question(self, title, text, QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes)
+
+    def record_pin_usage(self, selected_pins, amount, product_name, log_header):
+        """자동 사용이 끝난 뒤 사용한 PIN을 지갑과 로그에 반영합니다 (GUI 스레드)
+
+        selected_pins는 작업을 시작할 때의 잔액이므로, PIN마다 그때 쓴 금액을 지금 지갑의 잔액에서 뺍니다.
+        그사이 지갑에서 없어진 PIN은 건너뛰고 알립니다.
+        """
+        total_used = 0
+        pins_used_info = []
+        missing = []
+        for pin, balance in selected_pins:
+            if total_used >= amount:
+                break
+            used_amount = min(balance, amount - total_used)
+            total_used += used_amount
+            if pin in self.manager.pins:
+                pins_used_info += self.manager.apply_usage([(pin, self.manager.pins[pin])], used_amount)
+            else:
+                missing.append(pin)
+        self.log_pin_usage(log_header, product_name, amount, pins_used_info)
+        self.manager.save_pins()
+        self.manager.save_pins_to_txt()
+        self.table.clearSelection()
+        if missing:
+            self.show_warning_with_copy("PIN 확인", "자동 사용 중 지갑에서 없어진 PIN은 반영하지 못했습니다:\n" + "\n".join(missing))
 
     # 선택된 PIN을 브라우저에서 사용
     def use_selected_pins_browser(self, selected_pins):
         if not selected_pins:
-            return "선택된 PIN이 없습니다."
+            self.show_usage_result("선택된 PIN이 없습니다.")
+            return
         
         total_balance = sum(balance for _, balance in selected_pins)
 
@@ -1676,313 +2731,177 @@ class PinManagerApp(QMainWindow):
                           f"사용할 금액 입력 (최대 {total_balance}원):", 
                           0, 1, total_balance, 1000)
         
-        selected_pins = self.manager.find_pins_for_amount(amount, selected_pins)
-        
         if not ok:
-            return "취소되었습니다."
+            self.show_usage_result("취소되었습니다.")
+            return
         
         if amount <= 0:
-            return "올바른 금액을 입력하세요."
+            self.show_usage_result("올바른 금액을 입력하세요.")
+            return
         
         if amount > total_balance:
-            return "선택된 PIN의 총 잔액보다 큰 금액을 사용할 수 없습니다."
-        
+            self.show_usage_result("선택된 PIN의 총 잔액보다 큰 금액을 사용할 수 없습니다.")
+            return
+
+        selected_pins = self.manager.find_pins_for_amount(amount, selected_pins)
+        self.type_pins_in_browser(selected_pins, amount, f"선택된 PIN {len(selected_pins)}개로 {amount}원 사용이 완료되었습니다.")
+
+    def use_pins_browser(self, amount):
+        selected_pins = self.manager.find_pins_for_amount(amount)
+        if not selected_pins:
+            self.show_usage_result("충분한 잔액이 없습니다.")
+            return
+        self.type_pins_in_browser(selected_pins, amount, f"PIN {len(selected_pins)}개 {amount}원 사용이 완료되었습니다.")
+
+    def type_pins_in_browser(self, selected_pins, amount, done_message):
+        """브라우저의 PIN 입력칸에 PIN을 차례로 입력합니다"""
         QMessageBox.information(self, "준비", f"{amount}원을 사용하기 위해 {len(selected_pins)}개의 PIN을 사용합니다.")
         if len(selected_pins) > 1:
             QMessageBox.information(self, "준비", f"핀 입력창을 {len(selected_pins)-1}개 추가해 주세요.")
         QMessageBox.information(self, "준비", "첫번째 핀 입력창의 첫번째 칸을 클릭하고 PIN이 입력될 준비를 하세요.\n3초 후 시작합니다.")
-        time.sleep(3)
-        
-        total_used = 0
-        new_log_entry = '브라우저 자동사용 - ' + str(amount) + '원\n'
-        pins_used_info = []  # 통계 로그용 정보 수집
 
-        for pin, balance in selected_pins:
-            if total_used >= amount:
-                break
-            pyautogui.write(pin.replace("-", ""))  # PIN 입력
-            used_amount = min(balance, amount - total_used)
-            remaining_balance = balance - used_amount
-            # 사용한 PIN 정보를 로그에 기록
-            new_log_entry += f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} : {pin} [원금: {balance}] [사용된 금액: {used_amount}] [남은 잔액: {remaining_balance}]\n"
-            pins_used_info.append((pin, balance, used_amount, remaining_balance))
-            if remaining_balance > 0:
-                self.manager.pins[pin] = remaining_balance
-                total_used = amount
-            else:
-                del self.manager.pins[pin]
+        def job(worker):
+            worker.step(0, "3초 후 PIN 입력을 시작합니다.")
+            worker.sleep(3)
+            total_used = 0
+            for number, (pin, balance) in enumerate(selected_pins, start=1):
+                if total_used >= amount:
+                    break
+                worker.step(100 * number // (len(selected_pins) + 1), f"PIN 입력 중 ({number}/{len(selected_pins)})")
+                pyautogui.write(pin.replace("-", ""))  # PIN 입력
                 total_used += balance
 
-        # self.log_pin_usage(new_log_entry)
-        self.log_pin_usage(new_log_entry, "브라우저 자동사용", amount, pins_used_info)
-        self.manager.save_pins()
-        self.manager.save_pins_to_txt()
-        self.table.clearSelection()
+        def done(result):
+            self.record_pin_usage(selected_pins, amount, "브라우저 자동사용", '브라우저 자동사용 - ' + str(amount) + '원\n')
+            return done_message
 
-        return f"선택된 PIN {len(selected_pins)}개로 {amount}원 사용이 완료되었습니다."
+        self.start_automation(job, done)
 
     # 선택된 PIN을 HAOPLAY에서 사용
     def use_selected_pins_auto(self, selected_pins):
-        if config['SETTING']['size_adjust'] == 'True':
-            self.adjust_window_size()
-            time.sleep(1)  # 창 크기 조절 후 잠시 대기
-        # 현재 클립보드 데이터 저장
-        original_clipboard = pyperclip.paste()
-        total_used = 0
-        new_log_entry = ""
-        pins_used_info = []  # 통계 로그용 정보 수집
-        
-        try:
-            # 1️⃣ HAOPLAY 창 핸들 찾기
-            app = Application(backend="uia").connect(title_re=".*HAOPLAY.*")
-            haoplay_window = app.window(title_re=".*HAOPLAY.*")
-            if not haoplay_window.exists():
-                return "❌ HAOPLAY 창을 찾을 수 없습니다."
-            webview_control = haoplay_window.child_window(class_name_re="BrowserRootView", control_type="Pane").wrapper_object()
-            if not webview_control:
-                return "❌ 웹뷰 컨트롤을 찾을 수 없습니다."
-            webview_control.set_focus()  # 웹뷰 컨트롤을 활성화
-
-            time.sleep(0.5)  # 안정성을 위해 대기
-            
-            pyautogui.hotkey('ctrl', 'shift', 'j')  # DevTools 열기
-            time.sleep(1)
-            pyautogui.hotkey('ctrl', '`') # Console 탭으로 이동
-            time.sleep(0.2)
-
-            # amount = int(self.find_amount())
-            amount = self.find_amount()
-            product_name = self.find_Product()
-            new_log_entry += f'{product_name} - {amount}원\n'
-
-            # 선택된 PIN의 총 잔액 확인
-            total_balance = sum(balance for _, balance in selected_pins)
-            if total_balance < amount:
-                return f"선택된 PIN의 총 잔액({total_balance}원)이 필요한 금액({amount}원)보다 적습니다."
-
-            # 목록에서 최대 5개의 핀번호 제한
-            pins_to_use = self.manager.find_pins_for_amount(amount, selected_pins)
-            if not pins_to_use:
-                return "충분한 잔액이 없습니다."
-            if len(pins_to_use) == 0:
-                return "사용할 수 있는 핀 조합이 없습니다."
-            
-            pins_to_inject = [pin for pin, _ in pins_to_use]
-
-            # 4️⃣ 핀번호를 입력박스에 추가
-            self.add_pin_input_box(len(pins_to_inject))
-
-            # 5️⃣ 핀번호들 자바스크립트를 통해 입력
-            result = self.inject_pin_codes(pins_to_inject)
-            if not result:
-                return "❌ PIN 입력에 실패했습니다.\n PIN 입력이 완료되지 않았습니다."
-
-            # 모두 동의
-            self.click_all_agree()
-
-            # 다음 버튼
-            self.submit()
-
-            # 제출
-            if config['SETTING']['auto_submit'] == 'True':
-                time.sleep(1.2)
-                self.final_submit()
-
-        except Exception as e:
-            return f"❌ 자동 입력에 실패했습니다.\n{e}"
-
-        finally:
-            # 클립보드 데이터 원래 값으로 복원
-            pyperclip.copy(original_clipboard)
-
-        # 사용한 핀의 잔액을 갱신하고 필요 시 PIN 삭제
-        for pin, balance in pins_to_use:
-            if total_used >= amount:
-                break
-            used_amount = min(balance, amount - total_used)
-            remaining_balance = balance - used_amount
-            # 사용한 PIN 정보를 로그에 기록
-            new_log_entry += f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} : {pin} [원금: {balance}] [사용된 금액: {used_amount}] [남은 잔액: {remaining_balance}]\n"
-            pins_used_info.append((pin, balance, used_amount, remaining_balance))
-            if remaining_balance > 0:
-                self.manager.pins[pin] = remaining_balance
-                total_used = amount
-            else:
-                del self.manager.pins[pin]
-                total_used += balance
-
-        # self.log_pin_usage(new_log_entry)
-        self.log_pin_usage(new_log_entry, product_name, amount, pins_used_info)
-        self.manager.save_pins()
-        self.manager.save_pins_to_txt()
-        self.table.clearSelection()
-
-        return f"{product_name}\n선택된 PIN {len(pins_to_use)}개로 {amount}원 사용이 완료되었습니다."
+        self.use_pins_haoplay(selected_pins)
 
     # PIN 자동 사용 기능
     def use_pins_auto(self):
-        if config['SETTING']['size_adjust'] == 'True':
-            self.adjust_window_size()
-            time.sleep(1)  # 창 크기 조절 후 잠시 대기
-        # 현재 클립보드 데이터 저장
-        original_clipboard = pyperclip.paste()
-        total_used = 0
-        new_log_entry = ""
-        pins_used_info = []  # 통계 로그용 정보 수집
-        print("🔔 자동 사용 시작")
-
-        try:
-            # 1️⃣ HAOPLAY 창 핸들 찾기
-            app = Application(backend="uia").connect(title_re=".*HAOPLAY.*")
-            haoplay_window = app.window(title_re=".*HAOPLAY.*")
-            if not haoplay_window.exists():
-                return "❌ HAOPLAY 창을 찾을 수 없습니다."
-            webview_control = haoplay_window.child_window(class_name_re="BrowserRootView", control_type="Pane").wrapper_object()
-            if not webview_control:
-                return "❌ 웹뷰 컨트롤을 찾을 수 없습니다."
-            webview_control.set_focus()  # 웹뷰 컨트롤을 활성화
-
-            time.sleep(0.5)  # 안정성을 위해 대기
-            
-            pyautogui.hotkey('ctrl', 'shift', 'j')  # DevTools 열기
-            time.sleep(1)
-            pyautogui.hotkey('ctrl', '`') # Console 탭으로 이동
-            time.sleep(0.2)
-
-            # amount = int(self.find_amount())
-            amount = self.find_amount()
-            product_name = self.find_Product()
-            new_log_entry += f'{product_name} - {amount}원\n'
-
-            selected_pins = self.manager.find_pins_for_amount(amount)
-            if not selected_pins:
-                return "충분한 잔액이 없습니다."
-            if len(selected_pins) == 0:
-                return "사용할 수 있는 핀 조합이 없습니다."
-
-            # 목록에서 최대 5개의 핀번호를 가져옴
-            pins_to_inject = [selected_pins[i][0] for i in range(min(5, len(selected_pins)))]
-
-            # 4️⃣ 핀번호를 입력박스에 추가
-            self.add_pin_input_box(len(pins_to_inject))
-
-            # 5️⃣ 핀번호들 자바스크립트를 통해 입력
-            result = self.inject_pin_codes(pins_to_inject)
-            if not result:
-                return "❌ PIN 입력에 실패했습니다.\n PIN 입력이 완료되지 않았습니다."
-
-            # 모두 동의
-            self.click_all_agree()
-
-            # 다음 버튼
-            self.submit()
-
-            # 제출
-            if config['SETTING']['auto_submit'] == 'True':
-                time.sleep(1.2)  # 제출 후 잠시 대기
-                self.final_submit()
-
-        except Exception as e:
-            return f"❌ 자동 입력에 실패했습니다.\n{e}"
-
-        finally:
-            # 클립보드 데이터 원래 값으로 복원
-            pyperclip.copy(original_clipboard)
-            # print("✅ 클립보드 복원 완료.")
-
-        # 사용한 핀의 잔액을 갱신하고 사용한 핀을 삭제
-        for pin, balance in selected_pins:
-            if total_used >= amount:
-                break
-            used_amount = min(balance, amount - total_used)
-            remaining_balance = balance - used_amount
-            # 사용한 PIN 정보를 로그에 기록
-            new_log_entry += f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} : {pin} [원금: {balance}] [사용된 금액: {used_amount}] [남은 잔액: {remaining_balance}]\n"
-            pins_used_info.append((pin, balance, used_amount, remaining_balance))
-            if remaining_balance > 0:
-                self.manager.pins[pin] = remaining_balance
-                total_used = amount
-            else:
-                del self.manager.pins[pin]
-                total_used += balance
-
-        # self.log_pin_usage(new_log_entry)
-        self.log_pin_usage(new_log_entry, product_name, amount, pins_used_info)
-        self.manager.save_pins()
-        self.manager.save_pins_to_txt()
-
-        return f"{product_name}\nPIN {len(selected_pins)}개 {amount}원 사용이 완료되었습니다."
-    
-    def use_pins_browser(self, amount):
-        selected_pins = self.manager.find_pins_for_amount(amount)
-        if not selected_pins:
-            return "충분한 잔액이 없습니다."
-        if len(selected_pins) == 0:
-            return "사용할 수 있는 핀 조합이 없습니다."
-        
-        QMessageBox.information(self, "준비", f"{amount}원을 사용하기 위해 {len(selected_pins)}개의 PIN을 사용합니다.")
-        if len(selected_pins) > 1:
-            QMessageBox.information(self, "준비", f"핀 입력창을 {len(selected_pins)-1}개 추가해 주세요.")
-        QMessageBox.information(self, "준비", "첫번째 핀 입력창의 첫번째 칸을 클릭하고 PIN이 입력될 준비를 하세요.\n3초 후 시작합니다.")
-        time.sleep(3)
-        total_used = 0
-        new_log_entry = '브라우저 자동사용 - ' + str(amount) + '원\n'
-        pins_used_info = []  # 통계 로그용 정보 수집
-        for pin, balance in selected_pins:
-            if total_used >= amount:
-                break
-            pyautogui.write(pin.replace("-", ""))  # PIN 입력
-            used_amount = min(balance, amount - total_used)
-            remaining_balance = balance - used_amount
-            # 사용한 PIN 정보를 로그에 기록
-            new_log_entry += f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} : {pin} [원금: {balance}] [사용된 금액: {used_amount}] [남은 잔액: {remaining_balance}]\n"
-            pins_used_info.append((pin, balance, used_amount, remaining_balance))
-            if remaining_balance > 0:
-                self.manager.pins[pin] = remaining_balance
-                total_used = amount
-            else:
-                del self.manager.pins[pin]
-                total_used += balance
+        self.use_pins_haoplay(None)
+
+    def use_pins_haoplay(self, selected_pins):
+        """HAOPLAY 결제창에 금액에 맞는 PIN을 입력합니다. selected_pins가 None이면 지갑 전체에서 고릅니다"""
+        # 작업 스레드는 지갑을 읽지 않도록, 잠기지 않은 후보를 잔액 순으로 미리 복사
+        source = self.manager.pins.items() if selected_pins is None else selected_pins
+        candidates = sorted(((pin, balance) for pin, balance in source if pin not in self.manager.locked_pins),
+                            key=lambda x: x[1])
+        selected_total = None if selected_pins is None else sum(balance for _, balance in selected_pins)
+        auto_submit = config['SETTING']['auto_submit'] == 'True'
+        size_adjust = config['SETTING']['size_adjust'] == 'True'
+
+        def job(worker):
+            if size_adjust:
+                worker.step(5, "결제창 크기를 조절하는 중...")
+                self.adjust_window_size()
+                worker.sleep(1)  # 창 크기 조절 후 잠시 대기
+            # 현재 클립보드 데이터 저장
+            original_clipboard = pyperclip.paste()
+            print("🔔 자동 사용 시작")
 
-        # self.log_pin_usage(new_log_entry)
-        self.log_pin_usage(new_log_entry, "브라우저 자동사용", amount, pins_used_info)
-        self.manager.save_pins()
-        self.manager.save_pins_to_txt()
-
-        return f"PIN {len(selected_pins)}개 {amount}원 사용이 완료되었습니다."
+            try:
+                # 1️⃣ HAOPLAY 창 핸들 찾기
+                worker.step(10, "HAOPLAY 창을 찾는 중...")
+                app = pywinauto.Application(backend="uia").connect(title_re=".*HAOPLAY.*")
+                haoplay_window = app.window(title_re=".*HAOPLAY.*")
+                if not haoplay_window.exists():
+                    return "❌ HAOPLAY 창을 찾을 수 없습니다."
+                webview_control = haoplay_window.child_window(class_name_re="BrowserRootView", control_type="Pane").wrapper_object()
+                if not webview_control:
+                    return "❌ 웹뷰 컨트롤을 찾을 수 없습니다."
+                webview_control.set_focus()  # 웹뷰 컨트롤을 활성화
+
+                worker.sleep(0.5)  # 안정성을 위해 대기
+
+                worker.step(20, "개발자 도구를 여는 중...")
+                pyautogui.hotkey('ctrl', 'shift', 'j')  # DevTools 열기
+                worker.sleep(1)
+                pyautogui.hotkey('ctrl', '`') # Console 탭으로 이동
+                worker.sleep(0.2)
+
+                worker.step(35, "결제 금액을 확인하는 중...")
+                amount = self.find_amount()
+                worker.step(45, "상품명을 확인하는 중...")
+                product_name = self.find_Product()
+
+                if selected_total is not None and selected_total < amount:
+                    # 선택된 PIN의 총 잔액 확인
+                    return f"선택된 PIN의 총 잔액({selected_total}원)이 필요한 금액({amount}원)보다 적습니다."
+
+                # 목록에서 최대 5개의 핀번호 제한
+                pins_to_use = find_pins_for_amount(candidates, amount)
+                if not pins_to_use:
+                    return "충분한 잔액이 없습니다."
+                pins_to_inject = [pin for pin, _ in pins_to_use]
+
+                # 4️⃣ 핀번호를 입력박스에 추가
+                worker.step(55, f"PIN {len(pins_to_inject)}개를 입력하는 중...")
+                self.add_pin_input_box(len(pins_to_inject))
+
+                # 5️⃣ 핀번호들 자바스크립트를 통해 입력
+                result = self.inject_pin_codes(pins_to_inject)
+                if not result:
+                    return "❌ PIN 입력에 실패했습니다.\n PIN 입력이 완료되지 않았습니다."
+
+                # 모두 동의
+                worker.step(75, "약관에 동의하는 중...")
+                self.click_all_agree()
+
+                # 다음 버튼
+                worker.step(85, "결제를 진행하는 중...")
+                self.submit()
+
+                # 제출
+                if auto_submit:
+                    worker.sleep(1.2)  # 제출 후 잠시 대기
+                    worker.step(95, "최종 결제를 진행하는 중...")
+                    self.final_submit()
+
+            finally:
+                # 클립보드 데이터 원래 값으로 복원
+                pyperclip.copy(original_clipboard)
+
+            return pins_to_use, amount, product_name
+
+        def done(result):
+            if isinstance(result, str):
+                return result
+            pins_to_use, amount, product_name = result
+            # 사용한 핀의 잔액을 갱신하고 필요 시 PIN 삭제
+            self.record_pin_usage(pins_to_use, amount, product_name, f'{product_name} - {amount}원\n')
+            if selected_pins is not None:
+                return f"{product_name}\n선택된 PIN {len(pins_to_use)}개로 {amount}원 사용이 완료되었습니다."
+            return f"{product_name}\nPIN {len(pins_to_use)}개 {amount}원 사용이 완료되었습니다."
+
+        self.start_automation(job, done)
     
     # PIN 사용 로그를 파일에 기록하는 기능
-    def log_pin_usage(self, new_log_entry, product_name=None, total_amount=0, pins_used_info=None):
+    def log_pin_usage(self, log_header, product_name=None, total_amount=0, pins_used_info=None):
         if pins_used_info is None:
             pins_used_info = []
         
         try:
-            # 기존 로그 파일 저장 및 구조화된 로그 추가
-            with open("pin_usage_log.txt", "w", encoding='utf-8') as log_file:
-                log_file.write(new_log_entry)
-            
-            # 통계용 로그 저장 (product_name과 total_amount가 있을 때만)
-            if product_name and total_amount > 0 and pins_used_info:
-                self.manager.add_stats_log_entry(
-                    datetime.now().strftime('%Y-%m-%d'),
-                    product_name,
-                    total_amount,
-                    pins_used_info
-                )
-            
+            # 사용 로그와 통계용 로그 저장 (지갑 서비스, CLI와 같은 형식)
+            self.manager.log_usage(log_header, pins_used_info, product_name, total_amount)
             return True
         except Exception as e:
             self.show_warning_with_copy("로그 저장 오류", f"로그를 저장하는 중 오류가 발생했습니다: {str(e)}")
             return False
         
     def webview_rise(self):
+        user32 = ctypes.windll.user32  # Windows API 함수 로드
        # 1️⃣ HAOPLAY 창 핸들 찾기
         haoplay_hwnd = user32.FindWindowW(None, "HAOPLAY")
         if haoplay_hwnd:
             # 2️⃣ "Chrome_WidgetWin_0" 컨트롤 핸들 찾기 (웹뷰 컨트롤)
             webview_hwnd = user32.FindWindowExW(haoplay_hwnd, 0, "Chrome_WidgetWin_0", None)
             if not webview_hwnd:
-                app = Application(backend="uia").connect(title_re=".*HAOPLAY.*")
+                app = pywinauto.Application(backend="uia").connect(title_re=".*HAOPLAY.*")
                 haoplay_window = app.window(title_re=".*HAOPLAY.*")
                 if not haoplay_window.exists():
                     return "❌ HAOPLAY 창을 찾을 수 없습니다."
@@ -1995,7 +2914,7 @@ class PinManagerApp(QMainWindow):
                 # 3️⃣ 창 활성화 (child_hWnd로 변경)
                 user32.SetForegroundWindow(webview_hwnd)  # 웹뷰 컨트롤을 최상위로 활성화
         else:
-            app = Application(backend="uia").connect(title_re=".*HAOPLAY.*")
+            app = pywinauto.Application(backend="uia").connect(title_re=".*HAOPLAY.*")
             haoplay_window = app.window(title_re=".*HAOPLAY.*")
             if not haoplay_window.exists():
                 return "❌ HAOPLAY 창을 찾을 수 없습니다."
@@ -2003,7 +2922,7 @@ class PinManagerApp(QMainWindow):
             if not webview_control:
                 return "❌ 웹뷰 컨트롤을 찾을 수 없습니다."
             webview_control.set_focus()  # 웹뷰 컨트롤을 활성화
-        time.sleep(0.5)  # 안정성을 위해 대기
+        self.automation_sleep(0.5)  # 안정성을 위해 대기
 
     def find_amount(self):
         """금액을 추출하는 향상된 함수"""
@@ -2058,7 +2977,7 @@ class PinManagerApp(QMainWindow):
             amount_text = None
             for code in javascript_code_options:
                 self.paste_javascript_code(code)
-                time.sleep(0.5)  # 시간 약간 증가
+                self.automation_sleep(0.5)  # 시간 약간 증가
                 
                 # 클립보드에서 결과 확인
                 clipboard_text = pyperclip.paste()
@@ -2071,14 +2990,12 @@ class PinManagerApp(QMainWindow):
             
             # 결과 추출 실패 시 사용자에게 직접 물어보기
             if not amount_text or "추출 실패" in amount_text:
-                QMessageBox.warning(self, "금액 감지 실패", 
-                    "자동으로 금액을 감지하지 못했습니다.\n수동으로 금액을 입력해주세요.")
-                amount, ok = QInputDialog.getInt(self, "금액 수동 입력", "사용할 금액:", 
-                                                0, 0, 1000000, 1000)
-                if ok:
+                amount = self.call_in_gui_thread("ask_amount", "금액 감지 실패",
+                    "자동으로 금액을 감지하지 못했습니다.\n수동으로 금액을 입력해주세요.", "사용할 금액:")
+                if amount >= 0:
                     self.webview_rise()
                     pyautogui.hotkey('ctrl', 'shift', 'j')
-                    time.sleep(0.2)
+                    self.automation_sleep(0.2)
                     return amount
                 else:
                     raise ValueError("금액 입력이 취소되었습니다.")
@@ -2090,24 +3007,22 @@ class PinManagerApp(QMainWindow):
             # 추출된 숫자가 없거나 너무 작은 경우 (의심스러운 결과)
             if not digits_only or int(digits_only) < 1000:
                 # 사용자에게 확인
-                confirm = QMessageBox.question(self, "금액 확인", 
-                    f"감지된 금액이 {digits_only}원입니다. 정확한가요?",
-                    QMessageBox.Yes | QMessageBox.No)
+                confirm = self.call_in_gui_thread("ask_yes_no", "금액 확인",
+                    f"감지된 금액이 {digits_only}원입니다. 정확한가요?")
                     
-                if confirm == QMessageBox.No:
+                if not confirm:
                     # 수동 입력 요청
-                    amount, ok = QInputDialog.getInt(self, "금액 수동 입력", 
-                        "정확한 금액을 입력해주세요:", 0, 0, 1000000, 1000)
-                    if ok:
+                    amount = self.call_in_gui_thread("ask_amount", "", "", "정확한 금액을 입력해주세요:")
+                    if amount >= 0:
                         self.webview_rise()
                         pyautogui.hotkey('ctrl', 'shift', 'j')
-                        time.sleep(0.2)
+                        self.automation_sleep(0.2)
                         return amount
                     else:
                         raise ValueError("금액 입력이 취소되었습니다.")
                 self.webview_rise()
                 pyautogui.hotkey('ctrl', 'shift', 'j')
-                time.sleep(0.2)
+                self.automation_sleep(0.2)
             
             # 최종 금액 리턴
             return int(digits_only)
@@ -2119,15 +3034,13 @@ class PinManagerApp(QMainWindow):
             # 오류 상세 출력 및 사용자에게 알림
             error_msg = f"금액을 감지하는 중 오류가 발생했습니다: {str(e)}"
             print(error_msg)
-            QMessageBox.warning(self, "금액 감지 오류", error_msg + "\n수동으로 금액을 입력해주세요.")
-            
             # 사용자 입력 요청
-            amount, ok = QInputDialog.getInt(self, "금액 수동 입력", 
-                "사용할 금액:", 0, 0, 1000000, 1000)
-            if ok:
+            amount = self.call_in_gui_thread("ask_amount", "금액 감지 오류",
+                error_msg + "\n수동으로 금액을 입력해주세요.", "사용할 금액:")
+            if amount >= 0:
                 self.webview_rise()
                 pyautogui.hotkey('ctrl', 'shift', 'j')
-                time.sleep(0.2)
+                self.automation_sleep(0.2)
                 return amount
             else:
                 raise ValueError("금액 입력이 취소되었습니다.")
@@ -2194,7 +3107,7 @@ class PinManagerApp(QMainWindow):
             product_name = None
             for code in javascript_code_options:
                 self.paste_javascript_code(code)
-                time.sleep(0.3)
+                self.automation_sleep(0.3)
                 
                 # 클립보드에서 결과 확인
                 clipboard_text = pyperclip.paste()
@@ -2299,7 +3212,7 @@ class PinManagerApp(QMainWindow):
             
             # 스크립트 실행
             self.paste_javascript_code(javascript_code)
-            time.sleep(0.3)
+            self.automation_sleep(0.3)
             
             # 결과 확인
             result = pyperclip.paste()
@@ -2317,15 +3230,16 @@ class PinManagerApp(QMainWindow):
     # javascript 코드를 붙여넣는 기능
     def paste_javascript_code(self, javascript_code):
         # 6️⃣ 클립보드에 자바스크립트 코드 복사 (pyperclip 사용)
+        self.clipboard_own_text = javascript_code  # 클립보드 PIN 감지에서 제외
         pyperclip.copy(javascript_code)
         # print(f"✅ 자바스크립트 코드 클립보드에 복사 완료.\n{pyperclip.paste()}")
 
         pyautogui.hotkey('ctrl', 'v')
-        time.sleep(0.2)
+        self.automation_sleep(0.2)
 
         # 8️⃣ Enter 키 입력 (자바스크립트 실행)
         pyautogui.press('enter')
-        time.sleep(0.1)
+        self.automation_sleep(0.1)
 
         # print("✅ 자바스크립트 실행 완료.")
 
@@ -2359,15 +3273,15 @@ class PinManagerApp(QMainWindow):
             # 작업 표시줄 정보 가져오기
             taskbar_hwnd = win32gui.FindWindow("Shell_TrayWnd", None)
             if not taskbar_hwnd:
-                self.show_warning_with_copy("오류", "작업 표시줄을 찾을 수 없습니다.")
+                self.show_warning_later("오류", "작업 표시줄을 찾을 수 없습니다.")
                 return False
                 
             # 작업 표시줄 위치 및 크기 가져오기
             taskbar_rect = win32gui.GetWindowRect(taskbar_hwnd)
             
             # 화면 크기 가져오기
-            screen_width = GetSystemMetrics(0)   # 화면 너비
-            screen_height = GetSystemMetrics(1)  # 화면 높이
+            screen_width = win32api.GetSystemMetrics(0)   # 화면 너비
+            screen_height = win32api.GetSystemMetrics(1)  # 화면 높이
             
             # 작업 표시줄 위치 확인 (위, 아래, 왼쪽, 오른쪽)
             taskbar_pos = 'bottom'  # 기본값
@@ -2393,7 +3307,7 @@ class PinManagerApp(QMainWindow):
                 window_found = True
                 
             if not window_found or not hwnd:
-                self.show_warning_with_copy("오류", "조절할 창을 찾을 수 없습니다.")
+                self.show_warning_later("오류", "조절할 창을 찾을 수 없습니다.")
                 return False
             
             # 창이 최소화되어 있으면 복원
@@ -2439,7 +3353,7 @@ class PinManagerApp(QMainWindow):
             return True
             
         except Exception as e:
-            self.show_warning_with_copy("오류", f"창 크기 조절 중 오류가 발생했습니다: {str(e)}")
+            self.show_warning_later("오류", f"창 크기 조절 중 오류가 발생했습니다: {str(e)}")
             return False
 
     def add_multiple_pins(self):
@@ -2461,7 +3375,22 @@ class PinManagerApp(QMainWindow):
         # 예시 버튼
         example_btn = QPushButton("예시 보기", self)
         example_btn.clicked.connect(self.show_pin_input_examples)
-        layout.addWidget(example_btn)
+        
+        # 큰 파일은 붙여넣지 않고 한 줄씩 읽어서 가져옴 (여러 파일을 고르면 작업 프로세스에서 나눠 읽음)
+        file_btn = QPushButton("파일에서 가져오기", self)
+        file_to_import = []
+        
+        def choose_file():
+            paths, _ = QFileDialog.getOpenFileNames(dialog, "PIN 파일 선택", "", "PIN 파일 (*.txt *.csv);;모든 파일 (*)")
+            if paths:
+                file_to_import.extend(paths)
+                dialog.reject()
+        
+        file_btn.clicked.connect(choose_file)
+        button_row = QHBoxLayout()
+        button_row.addWidget(example_btn)
+        button_row.addWidget(file_btn)
+        layout.addLayout(button_row)
         
         # 텍스트 입력 영역
         text_edit = QPlainTextEdit()
@@ -2497,13 +3426,15 @@ class PinManagerApp(QMainWindow):
         preview_group = QGroupBox("추가될 PIN 미리보기")
         preview_layout = QVBoxLayout(preview_group)
         
-        preview_table = QTableWidget()
-        preview_table.setColumnCount(3)
-        preview_table.setHorizontalHeaderLabels(["PIN", "잔액", "상태"])
+        self.manager.refresh_spent_pins()
+        preview_model = PinPreviewModel(self.manager, dialog)
+        preview_table = QTableView()
+        preview_table.setModel(preview_model)
         preview_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         preview_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         preview_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        preview_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        preview_table.verticalHeader().setDefaultSectionSize(22)
+        preview_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         preview_layout.addWidget(preview_table)
         
         refresh_btn = QPushButton("미리보기 새로고침")
@@ -2517,227 +3448,199 @@ class PinManagerApp(QMainWindow):
         button_box.rejected.connect(dialog.reject)
         layout.addWidget(button_box)
         
-        # PIN 및 금액 추출 함수
-        def extract_pin_and_amount(text):
-            """텍스트에서 PIN과 금액을 추출"""
-            # 기본값
-            pin = None
-            amount = default_balance.value()
-            
-            # PIN 추출
-            pin_patterns = [
-                r'(\d{5}-\d{5}-\d{5}-\d{5})',  # 하이픈 포함 20자리
-                r'(\d{20})',                    # 하이픈 없는 20자리
-                r'(\d{4}-\d{4}-\d{4}-\d{4}-\d{4})'  # 4-4-4-4-4 형식
-            ]
-            
-            for pattern in pin_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    pin_text = match.group(1)
-                    if '-' in pin_text:
-                        # 하이픈 제거 후 포맷팅
-                        digits = pin_text.replace('-', '')
-                        pin = f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}"
-                    else:
-                        # 하이픈 없는 경우 포맷팅
-                        pin = f"{pin_text[:5]}-{pin_text[5:10]}-{pin_text[10:15]}-{pin_text[15:]}"
-                    break
-            
-            # 금액 추출
-            # 에그머니 패턴
-            if '[에그머니' in text or '(에그머니' in text:
-                # 쉼표 포함 금액 (50,000원)
-                comma_amount = re.search(r'[^\d](\d+),(\d{3})원', text)
-                if comma_amount:
-                    amount = int(comma_amount.group(1)) * 1000 + int(comma_amount.group(2))
-                # 만원 표현
-                elif '만원' in text:
-                    man_match = re.search(r'(\d+)만원', text)
-                    if man_match:
-                        amount = int(man_match.group(1)) * 10000
-                    elif '만원' in text:
-                        amount = 10000
-                # 천원 표현
-                elif '천원' in text:
-                    cheon_match = re.search(r'(\d+)천원', text)
-                    if cheon_match:
-                        amount = int(cheon_match.group(1)) * 1000
-                    elif '천원' in text:
-                        amount = 1000
-            
-            # PIN 옆에 직접 적힌 금액
-            if pin and ' ' in text:
-                parts = text.split()
-                for i, part in enumerate(parts):
-                    if pin in part and i < len(parts) - 1:
-                        amount_part = parts[i + 1].replace(',', '')
-                        if amount_part.isdigit():
-                            amount = int(amount_part)
-                        break
-            
-            # 쉼표로 구분된 금액
-            if pin and ',' in text:
-                parts = text.split(',')
-                if len(parts) > 1:
-                    amount_part = parts[1].strip()
-                    amount_digits = ''.join(re.findall(r'\d', amount_part))
-                    if amount_digits:
-                        amount = int(amount_digits)
-            
-            return pin, amount
-        
-        # 테이블 업데이트 함수
-        def update_preview_table():
-            """입력 텍스트 분석하여 테이블 업데이트"""
-            text = text_edit.toPlainText().strip()
-            if not text:
-                preview_table.setRowCount(0)
+        # 입력이 멈추면(300ms) 작업 스레드에서 해석하고, 늦게 도착한 이전 결과는 버림
+        parser = PreviewParser()
+        parser_thread = QThread(dialog)
+        parser.moveToThread(parser_thread)
+        generation = [0]
+        
+        def request_preview():
+            """입력 텍스트 해석 요청"""
+            generation[0] += 1
+            parser.latest = generation[0]
+            preview_group.setTitle("추가될 PIN 미리보기 (해석 중...)")
+            QMetaObject.invokeMethod(parser, "parse", Qt.QueuedConnection, Q_ARG(int, generation[0]),
+                                     Q_ARG(str, text_edit.toPlainText()), Q_ARG(int, default_balance.value()))
+        
+        def show_preview(parsed_generation, rows, changes, base):
+            """해석 결과로 미리보기 갱신 (표시 중인 결과에서 바뀐 행만 고칠 수 있으면 그 행만)"""
+            if parsed_generation != generation[0]:
                 return
-            
-            # 텍스트 전처리
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            normalized_text = '\n'.join(lines)
-            
-            # 에그머니 헤더 패턴 찾기
-            header_pattern = r'\[에그머니.*?\]|\(에그머니.*?\)'
-            headers = list(re.finditer(header_pattern, normalized_text))
-            
-            pins_with_amounts = []
-            
-            # 헤더별로 처리
-            if headers:
-                for i, header_match in enumerate(headers):
-                    header = header_match.group()
-                    header_end = header_match.end()
-                    
-                    # 다음 헤더까지의 영역 추출
-                    next_start = len(normalized_text)
-                    if i + 1 < len(headers):
-                        next_start = headers[i+1].start()
-                    
-                    # 헤더의 금액 추출
-                    _, header_amount = extract_pin_and_amount(header)
-                    
-                    # 헤더와 다음 헤더 사이 영역에서 PIN 찾기
-                    section = normalized_text[header_end:next_start]
-                    pin_matches = re.finditer(r'(\d{5}-\d{5}-\d{5}-\d{5}|\d{20})', section)
-                    
-                    for pin_match in pin_matches:
-                        pin_text = pin_match.group(1)
-                        pin, _ = extract_pin_and_amount(pin_text)
-                        # 헤더 금액을 사용
-                        pins_with_amounts.append((pin, header_amount, f"{header} {pin_text}"))
-            
-            # 줄별로 처리
-            if not pins_with_amounts:
-                current_header = None
-                current_amount = default_balance.value()
-                
-                for line in lines:
-                    # 라인이 헤더인지 확인
-                    if '[에그머니' in line or '(에그머니' in line:
-                        _, amount = extract_pin_and_amount(line)
-                        current_header = line
-                        current_amount = amount
-                        continue
-                    
-                    # PIN 추출
-                    pin, amount = extract_pin_and_amount(line)
-                    
-                    if pin:
-                        # 헤더가 있고 라인에 금액이 없으면 헤더 금액 사용
-                        if amount == default_balance.value() and current_header:
-                            amount = current_amount
-                        
-                        pins_with_amounts.append((pin, amount, line))
-            
-            # 전체 텍스트에서 PIN 찾기
-            if not pins_with_amounts:
-                all_pins = re.finditer(r'(\d{5}-\d{5}-\d{5}-\d{5}|\d{20})', normalized_text)
-                for match in all_pins:
-                    pin_text = match.group(1)
-                    
-                    # PIN 전후 컨텍스트 추출
-                    start = max(0, match.start() - 50)
-                    end = min(len(normalized_text), match.end() + 50)
-                    context = normalized_text[start:end]
-                    
-                    pin, amount = extract_pin_and_amount(context)
-                    pins_with_amounts.append((pin, amount, context))
-            
-            # 중복 제거 및 테이블 업데이트
-            unique_pins = {}
-            for pin, amount, context in pins_with_amounts:
-                if pin and pin not in unique_pins:
-                    unique_pins[pin] = (amount, context)
-            
-            # 테이블 업데이트
-            preview_table.setRowCount(len(unique_pins))
-            row = 0
-            
-            for pin, (amount, context) in unique_pins.items():
-                # 상태 결정
-                is_valid = bool(re.match(r'^\d{5}-\d{5}-\d{5}-\d{5}$', pin))
-                exists_in_manager = pin in self.manager.pins
-                
-                if not is_valid:
-                    status = "유효하지 않은 형식"
-                    color = QColor(255, 0, 0)  # 빨간색
-                elif exists_in_manager:
-                    status = "이미 존재함"
-                    color = QColor(255, 165, 0)  # 주황색
-                else:
-                    status = "추가 가능"
-                    color = QColor(0, 128, 0)  # 초록색
-                
-                # 테이블에 데이터 추가
-                pin_item = QTableWidgetItem(pin)
-                pin_item.setForeground(color)
-                
-                amount_item = QTableWidgetItem(f"{amount:,}")
-                status_item = QTableWidgetItem(status)
-                status_item.setForeground(color)
-                
-                preview_table.setItem(row, 0, pin_item)
-                preview_table.setItem(row, 1, amount_item)
-                preview_table.setItem(row, 2, status_item)
-                
-                row += 1
+            if changes is not None and preview_model.generation == base:
+                preview_model.apply_changes(changes, parsed_generation)
+            else:
+                preview_model.set_rows(rows, parsed_generation)
+            preview_group.setTitle(f"추가될 PIN 미리보기 ({len(rows):,}개)")
+        
+        debounce = QTimer(dialog)
+        debounce.setSingleShot(True)
+        debounce.setInterval(300)
+        debounce.timeout.connect(request_preview)
+        parser.parsed.connect(show_preview)
         
         # 버튼과 이벤트 연결
-        refresh_btn.clicked.connect(update_preview_table)
-        text_edit.textChanged.connect(update_preview_table)
+        refresh_btn.clicked.connect(request_preview)
+        text_edit.textChanged.connect(debounce.start)
+        default_balance.valueChanged.connect(debounce.start)
         
         # 다이얼로그 표시 및 결과 처리
-        if dialog.exec() == QDialog.Accepted:
+        parser_thread.start()
+        try:
+            accepted = dialog.exec() == QDialog.Accepted
+            stale = debounce.isActive() or preview_model.generation != generation[0]
+        finally:
+            debounce.stop()
+            parser_thread.quit()
+            parser_thread.wait()
+        if len(file_to_import) > 1:
+            self.import_pins_from_files(file_to_import, default_balance.value())
+            return
+        if file_to_import:
+            self.import_pins_from_file(file_to_import[0], default_balance.value())
+            return
+        if accepted:
             text = text_edit.toPlainText().strip()
             if not text:
                 return
             
-            # 테이블에 표시된 PIN 추가
-            added_count = 0
+            # 마지막 입력이 아직 해석되지 않았으면 지금 해석
+            rows = parse_pins(text, default_balance.value()) if stale else preview_model.rows
+            
+            # 미리보기에 표시된 PIN을 모아서 한 번에 추가하고 저장
+            to_add = []
             duplicated_count = 0
+            spent_count = 0
             skipped_count = 0
             
-            for row in range(preview_table.rowCount()):
-                pin = preview_table.item(row, 0).text()
-                amount = int(preview_table.item(row, 1).text().replace(',', ''))
-                status = preview_table.item(row, 2).text()
+            for pin, amount, _ in rows:
+                status = preview_model.status(pin)
                 
-                if status == "추가 가능":
-                    self.manager.add_pin(pin, amount)
-                    added_count += 1
-                elif status == "이미 존재함":
+                if status == PinPreviewModel.ADDABLE:
+                    to_add.append((pin, amount))
+                elif status == PinPreviewModel.EXISTS:
                     duplicated_count += 1
+                elif status == PinPreviewModel.SPENT:
+                    spent_count += 1
                 else:
                     skipped_count += 1
             
+            added_count = len(self.manager.add_pins(to_add))
+            if added_count:
+                self.manager.save_pins()
+                self.manager.save_pins_to_txt()
+            duplicated_count += len(to_add) - added_count  # 붙여넣은 글 안에서 중복된 PIN
+            
             # 결과 메시지 표시
-            message = f"추가: {added_count}개\n중복: {duplicated_count}개\n형식 오류: {skipped_count}개"
+            message = (f"추가: {added_count}개\n중복: {duplicated_count}개\n이미 사용됨: {spent_count}개\n"
+                       f"형식 오류: {skipped_count}개")
             QMessageBox.information(self, "PIN 일괄 추가 결과", message)
-            self.update_table()
     
+    def import_pins_from_file(self, path, default_amount):
+        """TXT/CSV 파일에서 PIN을 가져옵니다 (import_batch_size개마다 저장)
+
+        보통은 한 줄씩 읽고, 아주 큰 TXT 파일은 메모리에 매핑해 바이트 그대로 훑습니다.
+        """
+        try:
+            reader = open_pin_file(path, default_amount)
+        except OSError as e:
+            QMessageBox.warning(self, "파일에서 가져오기", f"파일을 열 수 없습니다.\n{e}")
+            return
+        self.file_import_reader = reader
+        self.manager.refresh_spent_pins()
+        self.file_import = self.manager.import_pins(reader, int(config['SETTING']['import_batch_size']),
+                                                    is_spent=self.manager.is_pin_spent)
+        self.file_import_counts = (0, 0, 0)
+        self.file_import_progress = QProgressDialog("파일에서 PIN을 가져오는 중...", "취소", 0, 1000, self)
+        self.file_import_progress.setWindowTitle("파일에서 가져오기")
+        self.file_import_progress.setWindowModality(Qt.WindowModal)
+        self.file_import_progress.setMinimumDuration(0)
+        self.file_import_progress.setAutoClose(False)
+        self.file_import_progress.setValue(0)
+        QTimer.singleShot(0, self.import_next_batch)
+
+    def import_next_batch(self):
+        # 한 묶음 저장할 때마다 이벤트 루프로 돌아가 진행률을 그리고 취소를 확인함
+        progress = self.file_import_progress
+        if progress.wasCanceled():
+            self.file_import.close()  # 저장한 묶음은 그대로 남김
+            self.finish_file_import("가져오기를 취소했습니다.")
+            return
+        try:
+            self.file_import_counts = next(self.file_import)
+        except StopIteration:
+            self.finish_file_import("가져오기를 마쳤습니다.")
+            return
+        except Exception as e:
+            self.finish_file_import(f"가져오는 중 오류가 발생했습니다.\n{e}")
+            return
+        reader = self.file_import_reader
+        added, duplicated, spent = self.file_import_counts
+        progress.setValue(int(reader.position * 1000 / max(reader.size, 1)))
+        progress.setLabelText(f"파일에서 PIN을 가져오는 중... ({reader.position / 1024 / 1024:,.1f}MB / "
+                              f"{reader.size / 1024 / 1024:,.1f}MB)\n추가: {added:,}개, 중복: {duplicated:,}개, "
+                              f"이미 사용됨: {spent:,}개")
+        QTimer.singleShot(0, self.import_next_batch)
+
+    def finish_file_import(self, title):
+        added, duplicated, spent = self.file_import_counts
+        self.file_import_progress.close()
+        self.file_import = self.file_import_reader = self.file_import_progress = None
+        if added:
+            self.manager.save_pins_to_txt()
+        QMessageBox.information(self, "파일에서 가져오기",
+                                f"{title}\n추가: {added:,}개\n중복: {duplicated:,}개\n이미 사용됨: {spent:,}개")
+
+    def import_pins_from_files(self, paths, default_amount):
+        """TXT/CSV 파일 여러 개를 작업 프로세스에서 나눠 읽고, 중복을 지워 한 번에 추가합니다 (취소하면 추가하지 않음)"""
+        self.manager.refresh_spent_pins()
+        self.files_import_job = MultiFileImport(paths, default_amount, int(config['SETTING']['import_workers']),
+                                                is_spent=self.manager.is_pin_spent)
+        self.files_import = self.files_import_job.run(self.manager)
+        self.files_import_progress = QProgressDialog("파일에서 PIN을 읽는 중...", "취소", 0, len(paths), self)
+        self.files_import_progress.setWindowTitle("여러 파일에서 가져오기")
+        self.files_import_progress.setWindowModality(Qt.WindowModal)
+        self.files_import_progress.setMinimumDuration(0)
+        self.files_import_progress.setAutoClose(False)
+        self.files_import_progress.setValue(0)
+        QTimer.singleShot(0, self.import_next_files)
+
+    def import_next_files(self):
+        # 작업 프로세스를 조금씩(최대 0.1초) 기다리며 이벤트 루프로 돌아가 진행률을 그리고 취소를 확인함
+        progress = self.files_import_progress
+        if progress.wasCanceled():
+            self.files_import.close()  # 남은 작업을 취소하고 아무것도 추가하지 않음
+            self.finish_files_import("가져오기를 취소했습니다. 추가한 PIN이 없습니다.")
+            return
+        try:
+            done, total = next(self.files_import)
+        except StopIteration:
+            self.finish_files_import("가져오기를 마쳤습니다.")
+            return
+        except Exception as e:
+            self.finish_files_import(f"가져오는 중 오류가 발생했습니다.\n{e}")
+            return
+        progress.setValue(done)
+        progress.setLabelText(f"파일에서 PIN을 읽는 중... ({done}/{total}개)" if done < total
+                              else "읽은 PIN을 합쳐 저장하는 중...")
+        QTimer.singleShot(0, self.import_next_files)
+
+    def finish_files_import(self, title):
+        job = self.files_import_job
+        self.files_import_progress.close()
+        self.files_import = self.files_import_job = self.files_import_progress = None
+        if not job.committed:
+            QMessageBox.information(self, "여러 파일에서 가져오기", title)
+            return
+        if job.added:
+            self.manager.save_pins_to_txt()
+        # 파일이 많을 수 있으므로 파일별 결과는 자세히 보기에 넣음
+        message = QMessageBox(QMessageBox.Information, "여러 파일에서 가져오기",
+                              f"{title}\n추가: {job.added:,}개\n중복: {job.duplicated:,}개\n이미 사용됨: {job.spent:,}개\n"
+                              f"형식 오류: {job.invalid:,}개",
+                              QMessageBox.Ok, self)
+        message.setDetailedText(job.report())
+        message.exec()
+
     def show_pin_input_examples(self):
         """PIN 입력 예시 다이얼로그 표시"""
         examples = QDialog(self)
@@ -2777,6 +3680,7 @@ class PinManagerApp(QMainWindow):
         examples.exec()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # 실행파일에서 여러 파일 가져오기 작업 프로세스를 띄울 때 필요
     config_read()
     app = QApplication(sys.argv)
     ex = PinManagerApp()
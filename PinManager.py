@@ -1,64 +1,62 @@
-import json
-import pyautogui
+import multiprocessing
+import os
+import sys
 import time
+from eggcore import LazyModule, PinWallet, open_pin_file
+from eggcore.batchimport import MultiFileImport
+from eggcore.cli import open_wallet
+from eggcore.daemon import DEFAULT_SOCKET, PIN_SPENT, DaemonError, WalletClient
 
-class PinManager:
-    def __init__(self, filename="pins.json", txt_filename="pins.txt"):
-        self.filename = filename
-        self.txt_filename = txt_filename
-        self.pins = self.load_pins()
-        self.last_used_pin = None
+# 자동 입력(use_pins)에서만 쓰므로 처음 사용할 때 불러옴 (조회/추가 명령은 GUI 환경 없이도 동작)
+pyautogui = LazyModule("pyautogui")
 
-    def load_pins(self):
-        try:
-            with open(self.filename, "r") as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+USAGE_PRODUCT = "CLI 자동사용"  # 자동 입력 사용 내역을 사용 로그/통계에 남길 때의 상품 이름
+
+def print_totals(totals):
+    print(f"총 잔액: {totals['total']} (사용 가능: {totals['available']}, 잠금: {totals['locked']}, PIN {totals['count']}개)")
+    for balance, count in totals['counts']:
+        print(f"  {balance}: {count}개")
+
+
+class PinManager(PinWallet):
+    """대화형 CLI용 지갑: GUI, pinmgr 명령과 같은 지갑 파일과 잠금, 사용한 PIN 보관소, PIN 조합 계산을 쓰고 결과만 출력합니다"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_used_pin = None
 
     def save_pins(self):
-        with open(self.filename, "w") as file:
-            json.dump(self.pins, file, indent=4)
+        # 다른 프로세스(GUI 등)의 변경분과 병합하여 저장
+        super().save_pins()
         self.save_pins_to_txt()
 
-    def save_pins_to_txt(self):
-        with open(self.txt_filename, "w") as file:
-            for idx, (pin, balance) in enumerate(self.pins.items(), start=1):
-                file.write(f"{idx}. {pin}: {balance}\n")
-
     def add_pin(self, pin, balance):
+        self.refresh_spent_pins()
         if pin in self.pins:
             print(f"PIN {pin}은(는) 이미 존재합니다.")
+        elif self.is_pin_spent(pin) and input(f"PIN {pin}은(는) 이미 사용됨. 그래도 추가할까요? (y/n): ").strip().lower() != "y":
+            print("추가하지 않았습니다.")
         else:
-            self.pins[pin] = balance
-            self.save_pins()
-            print(f"PIN {pin} 추가 완료. 잔액: {balance}")
+            print(super().add_pin(pin, balance))
 
     def delete_pin(self, pin):
-        if pin in self.pins:
-            del self.pins[pin]
-            self.save_pins()
-            print(f"PIN {pin} 삭제 완료.")
-        else:
-            print(f"PIN {pin}은(는) 존재하지 않습니다.")
+        print(super().delete_pin(pin))
 
     def update_balance(self, pin, amount):
-        if pin in self.pins:
-            lastbal = self.pins[pin]
-            self.pins[pin] = amount
-            if self.pins[pin] <= 0:
-                print("0이하의 금액은 불가능합니다.")
-            else:
-                self.save_pins()
-                print(f"PIN {pin} 잔액 갱신 완료. 이전 잔액: {lastbal} 현재 잔액: {self.pins[pin]}")
-        else:
+        if pin not in self.pins:
             print(f"PIN {pin}은(는) 존재하지 않습니다.")
+        elif amount <= 0:
+            print("0이하의 금액은 불가능합니다.")
+        else:
+            lastbal = self.pins[pin]
+            self.update_pin_balance(pin, amount)
+            print(f"PIN {pin} 잔액 갱신 완료. 이전 잔액: {lastbal} 현재 잔액: {amount}")
 
     def get_total_balance(self):
         self.list_pins()
-        total_balance = sum(self.pins.values())
-        print(f"총 잔액: {total_balance}")
-        return total_balance
+        totals = self.get_totals()
+        print_totals(totals)
+        return totals['total']
 
     def list_pins(self):
         if not self.pins:
@@ -66,27 +64,17 @@ class PinManager:
         else:
             print("현재 등록된 PIN 목록:")
             for idx, (pin, balance) in enumerate(self.pins.items(), start=1):
-                print(f"{idx}. PIN: {pin}, 잔액: {balance}")
-
-    def find_pins_for_amount(self, amount):
-        sorted_pins = sorted(self.pins.items(), key=lambda x: x[1])
-        selected_pins = []
-        total_selected = 0
-
-        for pin, balance in sorted_pins:
-            if total_selected >= amount:
-                break
-            selected_pins.append((pin, balance))
-            total_selected += balance
+                print(f"{idx}. PIN: {pin}, 잔액: {balance}" + (" (잠금)" if pin in self.locked_pins else ""))
 
-        if total_selected >= amount:
+    def find_pins_for_amount(self, amount, select_pins=None):
+        selected_pins = super().find_pins_for_amount(amount, select_pins)
+        if selected_pins:
             print("선택된 PIN:")
             for pin, balance in selected_pins:
                 print(f"PIN: {pin}, 잔액: {balance}")
-            return selected_pins
         else:
             print("충분한 잔액이 없습니다.")
-            return []
+        return selected_pins
 
     def use_pins(self, amount):
         selected_pins = self.find_pins_for_amount(amount)
@@ -98,6 +86,7 @@ class PinManager:
         print("브라우저 창을 선택하고 PIN이 입력될 준비를 하세요. 4초 후 시작합니다.")
 
         total_used = 0
+        pins_used_info = []
         for pin, balance in selected_pins:
             if total_used >= amount:
                 break
@@ -105,6 +94,7 @@ class PinManager:
             pyautogui.write(pin.replace("-", ""))  # PIN 입력 (하이픈 제거 후 붙여넣기)
             print(f"\nPIN {pin}이 입력되었습니다.")
             remaining_balance = balance - (amount - total_used)
+            pins_used_info.append((pin, balance, min(balance, amount - total_used), max(remaining_balance, 0)))
             if remaining_balance > 0:
                 self.pins[pin] = remaining_balance
                 self.last_used_pin = (pin, remaining_balance)
@@ -112,6 +102,7 @@ class PinManager:
                 total_used = amount
             else:
                 self.delete_pin(pin)
+                self.spent_pins.add([pin])  # GUI와 함께 쓰는 사용한 PIN 보관소
                 total_used += balance
                 self.last_used_pin = (pin, 0)
                 if total_used < amount:
@@ -119,35 +110,193 @@ class PinManager:
                     time.sleep(3)
                     print("브라우저 창을 선택하고 PIN이 입력될 준비를 하세요. 4초 후 시작합니다.")
             self.save_pins()
+        self.log_usage(f"{USAGE_PRODUCT} - {amount}원\n", pins_used_info, USAGE_PRODUCT, amount)
+
+class RemotePinManager:
+    """실행 중인 지갑 서비스(eggcore.daemon)에 요청을 보내는 PinManager"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def reload_external(self):
+        # 서비스가 항상 최신 지갑을 유지하므로 다시 불러올 필요가 없음
+        return None
+
+    def _call(self, method, **params):
+        try:
+            return self.client.call(method, **params)
+        except DaemonError as e:
+            print(e)
+            return None
+
+    def add_pin(self, pin, balance):
+        # 이미 사용한 PIN이면 PinManager.add_pin처럼 물어보고 allow_spent로 다시 요청
+        try:
+            added = self.client.call("add", pin=pin, balance=balance)
+        except DaemonError as e:
+            if e.code != PIN_SPENT:
+                print(e)
+                return
+            if input(f"PIN {pin}은(는) 이미 사용됨. 그래도 추가할까요? (y/n): ").strip().lower() != "y":
+                print("추가하지 않았습니다.")
+                return
+            added = self._call("add", pin=pin, balance=balance, allow_spent=True)
+        if added:
+            print(f"PIN {pin} 추가 완료. 잔액: {balance}")
+
+    def delete_pin(self, pin):
+        if self._call("delete", pin=pin):
+            print(f"PIN {pin} 삭제 완료.")
+
+    def update_balance(self, pin, amount):
+        if amount <= 0:
+            print("0이하의 금액은 불가능합니다.")
+            return
+        lastbal = self._call("update", pin=pin, balance=amount)
+        if lastbal is not None:
+            print(f"PIN {pin} 잔액 갱신 완료. 이전 잔액: {lastbal} 현재 잔액: {amount}")
+
+    def get_total_balance(self):
+        self.list_pins()
+        totals = self._call("query", what="total")
+        if totals is not None:
+            print_totals(totals)
+            return totals['total']
+
+    def list_pins(self):
+        pins = self._call("query", what="list") or []
+        if not pins:
+            print("등록된 PIN이 없습니다.")
+        else:
+            print("현재 등록된 PIN 목록:")
+            for idx, (pin, balance, locked) in enumerate(pins, start=1):
+                print(f"{idx}. PIN: {pin}, 잔액: {balance}" + (" (잠금)" if locked else ""))
+
+    def find_pins_for_amount(self, amount, reserve=False):
+        plan = self._call("plan", amount=amount, reserve=reserve)
+        if not plan or not plan['pins']:
+            print("충분한 잔액이 없습니다.")
+            return [], None
+        print("선택된 PIN:")
+        for pin, balance in plan['pins']:
+            print(f"PIN: {pin}, 잔액: {balance}")
+        return plan['pins'], plan.get('token')
+
+    def use_pins(self, amount):
+        # 입력하는 동안 다른 클라이언트가 같은 PIN을 쓰지 못하도록 예약
+        selected_pins, token = self.find_pins_for_amount(amount, reserve=True)
+        if not selected_pins:
+            print("해당 금액에 맞는 PIN을 사용할 수 없습니다.")
+            return
+
+        print("브라우저 창을 선택하고 PIN이 입력될 준비를 하세요. 4초 후 시작합니다.")
+        try:
+            for idx, (pin, balance) in enumerate(selected_pins):
+                time.sleep(4)
+                pyautogui.write(pin.replace("-", ""))
+                print(f"\nPIN {pin}이 입력되었습니다.")
+                if idx < len(selected_pins) - 1:
+                    print("\n추가를 눌러 다음 PIN을 입력할 준비를 하세요. 3초 후 진행됩니다.")
+                    time.sleep(3)
+                    print("브라우저 창을 선택하고 PIN이 입력될 준비를 하세요. 4초 후 시작합니다.")
+        except BaseException:
+            self._call("release", token=token)
+            raise
+        result = self._call("commit", amount=amount, token=token, product_name=USAGE_PRODUCT)
+        if result:
+            for pin, balance, used_amount, remaining_balance in result['used']:
+                print(f"PIN {pin} 사용 완료. 남은 잔액: {remaining_balance}")
+
 
 if __name__ == "__main__":
-    manager = PinManager()
+    multiprocessing.freeze_support()  # 실행파일에서 여러 파일 가져오기 작업 프로세스를 띄울 때 필요
+    if len(sys.argv) > 1:
+        # 명령을 주면 묻지 않고 일괄 처리한 뒤 JSON으로 결과를 출력 (pinmgr add/delete/.../export)
+        from eggcore.cli import main
+        sys.exit(main(sys.argv[1:]))
+    # 지갑 서비스가 실행 중이면 서비스에 요청하고, 아니면 파일을 직접 사용
+    socket_path = os.environ.get('EGGMANAGER_SOCKET', DEFAULT_SOCKET)
+    if WalletClient.available(socket_path):
+        manager = RemotePinManager(WalletClient(socket_path))
+        print(f"지갑 서비스에 연결되었습니다: {socket_path}")
+    else:
+        manager = open_wallet(wallet_class=PinManager)
 
     while True:
-        print("\n옵션: 추가(add), 삭제(delete), 잔액 수정(update), 총 잔액(total), 목록 보기(list), PIN 찾기(find), PIN 사용(use), 종료(quit)")
+        # GUI 등 다른 프로그램이 저장한 변경분 반영
+        try:
+            manager.reload_external()
+        except (ValueError, TimeoutError):
+            pass
+        print("\n옵션: 추가(add), 삭제(delete), 잔액 수정(update), 총 잔액(total), 목록 보기(list), PIN 찾기(find), PIN 사용(use), 파일에서 가져오기(import), 동기화 내보내기(sync-export), 동기화 가져오기(sync-import), 종료(quit)")
         option = input("옵션을 선택하세요: ").strip().lower()
         
         if option == "add":
             pin = input("PIN 입력 (형식: 12345-12345-12345-12345): ").strip()
-            balance = float(input("잔액 입력: "))
+            balance = int(input("잔액 입력: "))
             manager.add_pin(pin, balance)
         elif option == "delete":
             pin = input("삭제할 PIN 입력: ").strip()
             manager.delete_pin(pin)
         elif option == "update":
             pin = input("잔액을 수정할 PIN 입력: ").strip()
-            amount = float(input("수정할 금액 입력: "))
+            amount = int(input("수정할 금액 입력: "))
             manager.update_balance(pin, amount)
         elif option == "total":
             manager.get_total_balance()
         elif option == "list":
             manager.list_pins()
         elif option == "find":
-            amount = float(input("PIN을 찾을 금액 입력: "))
+            amount = int(input("PIN을 찾을 금액 입력: "))
             manager.find_pins_for_amount(amount)
         elif option == "use":
-            amount = float(input("사용할 금액 입력: "))
+            amount = int(input("사용할 금액 입력: "))
             manager.use_pins(amount)
+        elif option in ("import", "sync-export", "sync-import") and not isinstance(manager, PinManager):
+            print("지갑 서비스에 연결된 상태에서는 파일을 가져오거나 동기화 파일을 사용할 수 없습니다.")
+        elif option == "import":
+            paths = [path.strip() for path in input("가져올 TXT/CSV 파일 경로 입력 (여러 개는 ;로 구분): ").split(";")
+                     if path.strip()]
+            balance = int(input("금액이 적혀 있지 않은 PIN의 잔액 입력: "))
+            if len(paths) > 1:
+                # 여러 파일은 작업 프로세스에서 나눠 읽고 한 번에 저장
+                manager.refresh_spent_pins()
+                job = MultiFileImport(paths, balance, is_spent=manager.is_pin_spent)
+                for done, total in job.run(manager):
+                    print(f"\r파일 {done}/{total}개 읽음", end="", flush=True)
+                print(f"\n{job.report()}")
+            else:
+                path = paths[0] if paths else ""
+                batch_size = int(input("한 번에 저장할 PIN 수 (기본 5000): ").strip() or 5000)
+                try:
+                    reader = open_pin_file(path, balance)
+                    manager.refresh_spent_pins()
+                    added = duplicated = spent = 0
+                    for added, duplicated, spent in manager.import_pins(reader, batch_size,
+                                                                        is_spent=manager.is_pin_spent):
+                        percent = reader.position * 100 // max(reader.size, 1)
+                        print(f"\r{percent:3d}% 추가 {added}개, 중복 {duplicated}개, 이미 사용됨 {spent}개",
+                              end="", flush=True)
+                except (OSError, ValueError) as e:
+                    print(f"\n가져오기에 실패했습니다: {e}")
+                else:
+                    print(f"\n파일에서 {added}개의 PIN을 추가했습니다. (이미 있던 PIN {duplicated}개, 이미 사용된 PIN {spent}개)")
+        elif option == "sync-export":
+            path = input("저장할 동기화 파일 경로 입력: ").strip()
+            data = manager.export_sync()
+            with open(path, "wb") as file:
+                file.write(data)
+            print(f"변경분을 저장했습니다. ({len(data)} 바이트)")
+        elif option == "sync-import":
+            path = input("가져올 동기화 파일 경로 입력: ").strip()
+            try:
+                with open(path, "rb") as file:
+                    delta, count = manager.import_sync(file.read())
+            except (OSError, ValueError) as e:
+                print(f"가져오기에 실패했습니다: {e}")
+            else:
+                manager.save_pins_to_txt()
+                print(f"{count}개의 변경 기록을 병합했습니다. (추가/변경 {len(delta.changed)}개, 삭제 {len(delta.removed)}개)")
         elif option == "quit":
             print("PinManager를 종료합니다.")
             break
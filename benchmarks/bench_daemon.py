@@ -0,0 +1,113 @@
+"""지갑 서비스(eggcore.daemon) 처리량 벤치마크
+
+임시 지갑으로 서비스를 별도 프로세스에서 실행하고, 여러 클라이언트 프로세스가 동시에
+plan(파이프라이닝) 요청과 plan+commit 요청을 보내 초당 처리량을 측정합니다.
+
+실행: python benchmarks/bench_daemon.py --pins 10000 --clients 16 --seconds 3
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eggcore.daemon import WalletClient
+
+DENOMINATIONS = [1000, 3000, 5000, 10000, 30000, 50000]
+
+
+def make_wallet(path, count, seed=0):
+    rng = random.Random(seed)
+    pins = {}
+    while len(pins) < count:
+        digits = "".join(rng.choice("0123456789") for _ in range(20))
+        pins[f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}"] = rng.choice(DENOMINATIONS)
+    with open(path, "w") as file:
+        json.dump(pins, file)
+
+
+def plan_worker(socket_path, seconds, batch, seed, queue):
+    rng = random.Random(seed)
+    done = 0
+    with WalletClient(socket_path) as client:
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            calls = [("plan", {"amount": rng.choice(DENOMINATIONS) + rng.randint(0, 20) * 100}) for _ in range(batch)]
+            client.pipeline(calls)
+            done += batch
+    queue.put(done)
+
+
+def commit_worker(socket_path, seconds, seed, queue):
+    rng = random.Random(seed)
+    done = 0
+    with WalletClient(socket_path) as client:
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            plan = client.call("plan", amount=rng.choice([100, 500, 1000]), reserve=True)
+            if not plan["pins"]:
+                break
+            client.call("commit", amount=100, token=plan["token"])
+            done += 1
+    queue.put(done)
+
+
+def run_phase(target, args_list):
+    queue = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=target, args=args + (queue,)) for args in args_list]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    total = sum(queue.get() for _ in processes)
+    for process in processes:
+        process.join()
+    return total, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pins", type=int, default=10000, help="지갑의 PIN 개수")
+    parser.add_argument("--clients", type=int, default=16, help="동시 클라이언트 수")
+    parser.add_argument("--seconds", type=float, default=3.0, help="단계별 측정 시간")
+    parser.add_argument("--batch", type=int, default=32, help="파이프라이닝으로 한 번에 보내는 plan 요청 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # 서비스는 작업 디렉터리의 기본 지갑(pins.json, resource/...)을 GUI와 같은 방식으로 엶
+        pins_file = os.path.join(workdir, "pins.json")
+        socket_path = os.path.join(workdir, "bench.sock")
+        os.makedirs(os.path.join(workdir, "resource"))
+        make_wallet(pins_file, args.pins)
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        server = subprocess.Popen(
+            [sys.executable, "-m", "eggcore.daemon", "--socket", socket_path],
+            cwd=workdir, env=dict(os.environ, PYTHONPATH=root), stdout=subprocess.DEVNULL)
+        try:
+            while not WalletClient.available(socket_path):
+                if server.poll() is not None:
+                    raise SystemExit("서비스를 시작하지 못했습니다.")
+                time.sleep(0.05)
+
+            plans, elapsed = run_phase(plan_worker, [(socket_path, args.seconds, args.batch, seed)
+                                                     for seed in range(args.clients)])
+            print(f"plan:   {plans:>8}건 / {elapsed:.2f}s = {plans / elapsed:,.0f} plans/sec "
+                  f"(클라이언트 {args.clients}, 파이프라인 {args.batch})")
+
+            commits, elapsed = run_phase(commit_worker, [(socket_path, args.seconds, seed)
+                                                         for seed in range(args.clients)])
+            print(f"commit: {commits:>8}건 / {elapsed:.2f}s = {commits / elapsed:,.0f} commits/sec "
+                  f"(plan+reserve+commit, 그룹 커밋 저장 포함)")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""EggManager GUI 모듈을 불러오는 데 걸리는 시간(콜드 스타트) 벤치마크
+
+새 파이썬 프로세스에서 `python -X importtime -c "import EggManager_GUI"`를 실행해 모듈별 시간을 모으고,
+전체 시간과 오래 걸린 모듈을 보여줍니다. 자동 입력/업데이트에만 쓰는 모듈은 처음 사용할 때 불러오므로
+시작할 때 불려 오면 안 됩니다. 전체 시간(중앙값)이 --budget을 넘거나 그런 모듈이 불려 오면
+종료 코드 1로 끝납니다.
+
+실행: python benchmarks/bench_import.py --runs 5 --budget 800
+      python benchmarks/bench_import.py --module eggcore --forbid PySide6 win32api pythoncom --budget 50
+      (eggcore는 Qt/Windows API 없이 불러올 수 있어야 함)
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작할 때 불러오면 안 되는 모듈 (EggManager_GUI의 LazyModule)
+# zipfile, urllib.request도 LazyModule이지만 PySide6가 시작할 때 불러오므로 확인하지 않음
+DEFERRED = ["pyautogui", "pywinauto", "pyperclip", "pythoncom", "win32api", "win32con", "win32gui", "requests"]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def import_times(module):
+    """새 프로세스에서 module을 불러오고 [(모듈, 자체 시간 us, 누적 시간 us, 깊이)]를 반환합니다"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, encoding="utf-8", errors="replace")
+    if result.returncode != 0:
+        raise SystemExit(f"{module}을(를) 불러오지 못했습니다.\n{result.stderr[-2000:]}")
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def direct_imports(entries, module):
+    """module이 직접 불러온 모듈 (importtime은 하위 모듈을 부모보다 먼저 출력함)"""
+    children = []
+    for entry in entries:
+        if entry[3] == 0:
+            if entry[0] == module:
+                return children
+            children = []
+        elif entry[3] == 1:
+            children.append(entry)
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="EggManager_GUI", help="불러올 모듈")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수 (첫 실행은 .pyc 생성 때문에 느릴 수 있음)")
+    parser.add_argument("--top", type=int, default=15, help="보여줄 오래 걸린 모듈 수")
+    parser.add_argument("--budget", type=float, default=800.0, help="허용하는 전체 시간 (ms, 중앙값 기준)")
+    parser.add_argument("--forbid", nargs="*", default=[], help="불려 오면 안 되는 모듈 (지연 로딩 모듈에 추가)")
+    args = parser.parse_args()
+
+    totals = []
+    entries = []
+    for _ in range(args.runs):
+        entries = import_times(args.module)
+        totals.append(sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000)
+    total = statistics.median(totals)
+
+    print(f"{args.module} 불러오기: 중앙값 {total:.1f}ms (최소 {min(totals):.1f}ms, 최대 {max(totals):.1f}ms, {args.runs}회)")
+    print(f"\n{args.module}이(가) 직접 불러온 모듈 중 오래 걸린 순 (마지막 실행):")
+    direct = sorted(direct_imports(entries, args.module), key=lambda entry: entry[2], reverse=True)
+    for name, _, cumulative, _ in direct[:args.top]:
+        print(f"  {cumulative / 1000:8.1f}ms  {name}")
+
+    loaded = {name for name, _, _, _ in entries}
+    eager = [name for name in DEFERRED + args.forbid if name in loaded]
+    failed = False
+    if eager:
+        print(f"\n시작할 때 불려 온 지연 로딩 모듈: {', '.join(eager)}")
+        failed = True
+    if total > args.budget:
+        print(f"\n허용 시간 {args.budget:g}ms 초과")
+        failed = True
+    if not failed:
+        print(f"\n허용 시간 {args.budget:g}ms 이내, 지연 로딩 모듈 없음")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
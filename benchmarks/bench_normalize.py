@@ -0,0 +1,70 @@
+"""PIN 일괄 정규화(eggcore.normalize.normalize_pins) 벤치마크
+
+숫자만 20자리, 00000-00000-00000-00000, 4-4-4-4-4 형식과 잘못된 입력이 섞인 PIN 문자열을 만들고
+NumPy로 한꺼번에 처리할 때와 한 개씩(pin_key) 처리할 때의 시간을 비교합니다.
+두 결과가 다르면 종료 코드 1로 끝납니다. NumPy가 없으면 한 개씩 처리하는 시간만 측정합니다.
+
+실행: python benchmarks/bench_normalize.py --count 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eggcore import normalize_pins
+from eggcore.normalize import _numpy
+
+
+def make_inputs(count, seed=0):
+    rng = random.Random(seed)
+    inputs = []
+    for number in range(count):
+        digits = "%020d" % rng.getrandbits(66) if number % 10 else "%020d" % rng.getrandbits(40)
+        digits = digits[-20:]
+        kind = number % 5
+        if kind == 0:
+            inputs.append(digits)
+        elif kind == 1:
+            inputs.append("-".join(digits[i:i + 5] for i in range(0, 20, 5)))
+        elif kind == 2:
+            inputs.append("-".join(digits[i:i + 4] for i in range(0, 20, 4)))
+        elif kind == 3:
+            # 잘못된 입력: 글자가 섞이거나 자리수/하이픈 위치가 틀림
+            broken = list("-".join(digits[i:i + 5] for i in range(0, 20, 5)))
+            broken[rng.randrange(len(broken))] = rng.choice("x-0 ")
+            inputs.append("".join(broken) + rng.choice(["", "", "1"]))
+        else:
+            inputs.append("-".join(digits[i:i + 5] for i in range(0, 20, 5)))
+    return inputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000000, help="PIN 문자열 수")
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.count)
+
+    start = time.perf_counter()
+    python_keys, python_valid = normalize_pins(inputs, use_numpy=False)
+    python_elapsed = time.perf_counter() - start
+    print(f"한 개씩: {python_elapsed * 1000:8.1f}ms ({args.count:,}개, 유효 {sum(python_valid):,}개)")
+
+    if _numpy() is None:
+        print("NumPy가 설치되어 있지 않아 일괄 처리는 측정하지 않습니다.")
+        return
+    start = time.perf_counter()
+    keys, valid = normalize_pins(inputs, use_numpy=True)
+    numpy_elapsed = time.perf_counter() - start
+    print(f"NumPy  : {numpy_elapsed * 1000:8.1f}ms ({python_elapsed / numpy_elapsed:.1f}배)")
+
+    if valid.tolist() != python_valid or [tuple(key) for key in keys.tolist()] != python_keys:
+        print("두 결과가 다릅니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
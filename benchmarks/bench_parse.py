@@ -0,0 +1,89 @@
+"""PIN 일괄 추가 해석기(eggcore.importer.parse_pins) 속도 벤치마크
+
+에그머니 헤더, 금액이 붙은 PIN, 숫자만 20자리, G마켓(4-4-4-4-4) 형식이 섞인 긴 텍스트를 만들어
+붙여넣기 한 번을 해석하는 데 걸리는 시간을 측정합니다. 10만 줄도 1초 안에 끝나야 합니다.
+미리보기처럼 한 줄씩 고쳐 가며 다시 해석할 때(IncrementalPinParser) 걸리는 시간도 측정합니다.
+
+실행: python benchmarks/bench_parse.py --lines 100000 --budget 1000 --edits 50
+      python benchmarks/bench_parse.py --lines 100000 --edits 50 --no-headers  (헤더 없이 PIN만 붙여넣은 경우)
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eggcore import IncrementalPinParser, parse_pins
+
+
+def make_text(lines, seed=0, headers=True):
+    """붙여넣기 예시 형식을 돌아가며 섞은 lines줄짜리 텍스트 (headers=False면 에그머니 헤더 줄 없음)"""
+    rng = random.Random(seed)
+    rows = []
+    for number in range(lines):
+        digits = "".join(rng.choice("0123456789") for _ in range(20))
+        pin = f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}"
+        kind = number % 5
+        if kind == 0 and headers:
+            rows.append(f"[에그머니-{rng.choice([1, 3, 5])}만원권]")
+        elif kind <= 1:
+            rows.append(f"{pin} {rng.choice([1000, 5000, 10000])}")
+        elif kind == 2:
+            rows.append(digits)
+        elif kind == 3:
+            grouped = "-".join(digits[i:i + 4] for i in range(0, 20, 4))
+            rows.append(f"주문번호 {number} 에그머니 모바일 상품권 {grouped}")
+        elif number % 10 == 4:
+            rows.append(f"{pin}, 10,000원")
+        else:
+            rows.append(f"PIN: {pin}, 금액: 5,000원")
+    return "\n".join(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=100000, help="텍스트 줄 수")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--budget", type=float, default=1000.0, help="허용 시간 (ms, 중앙값 기준)")
+    parser.add_argument("--edits", type=int, default=50, help="한 줄씩 고쳐 다시 해석해 볼 횟수")
+    parser.add_argument("--no-headers", action="store_true", help="에그머니 헤더 줄 없이 만들기")
+    args = parser.parse_args()
+
+    text = make_text(args.lines, headers=not args.no_headers)
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        found = parse_pins(text, 50000)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    elapsed = statistics.median(timings)
+    print(f"{args.lines:,}줄 ({len(text) / 1024 / 1024:.1f}MB) 해석: 중앙값 {elapsed:.1f}ms, "
+          f"최소 {min(timings):.1f}ms, PIN {len(found):,}개")
+
+    # 임의의 줄 하나를 고칠 때마다 다시 해석
+    rng = random.Random(1)
+    rows = text.split("\n")
+    incremental = IncrementalPinParser()
+    incremental.parse(text, 50000)
+    edit_timings = []
+    for _ in range(args.edits):
+        number = rng.randrange(len(rows))
+        rows[number] = rows[number][:-1] if rng.random() < 0.5 else rows[number] + "0"
+        edited = "\n".join(rows)
+        start = time.perf_counter()
+        incremental.parse(edited, 50000)
+        edit_timings.append((time.perf_counter() - start) * 1000)
+    if edit_timings:
+        print(f"한 줄 고친 뒤 다시 해석 {args.edits}회: 중앙값 {statistics.median(edit_timings):.1f}ms, "
+              f"최대 {max(edit_timings):.1f}ms")
+
+    if elapsed > args.budget:
+        print(f"허용 시간 {args.budget:g}ms 초과")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
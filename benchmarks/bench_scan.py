@@ -0,0 +1,66 @@
+"""아주 큰 PIN 파일 가져오기 속도 벤치마크: 줄 단위 읽기(PinFileReader) vs 메모리 매핑(MappedPinScanner)
+
+bench_parse.py와 같은 형식이 섞인 텍스트를 --size MB 크기의 임시 파일로 만들고(--file로 기존 파일 지정 가능),
+두 방식으로 끝까지 읽으며 찾은 PIN 수와 걸린 시간, 초당 처리량을 비교합니다.
+두 방식이 찾은 PIN 수가 다르면 종료 코드 1로 끝납니다.
+
+실행: python benchmarks/bench_scan.py --size 1024
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parse import make_text
+from eggcore import MappedPinScanner, PinFileReader
+
+
+def make_dump(path, size_mb):
+    """4MB 정도의 예시 텍스트를 반복해서 size_mb MB 파일을 만듭니다"""
+    block = (make_text(150000) + "\n").encode("utf-8")
+    target = size_mb * 1024 * 1024
+    with open(path, "wb") as file:
+        written = 0
+        while written < target:
+            file.write(block)
+            written += len(block)
+
+
+def measure(reader):
+    start = time.perf_counter()
+    count = sum(1 for _ in reader)
+    return count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1024, help="만들 파일 크기 (MB)")
+    parser.add_argument("--file", help="만들지 않고 이 파일로 측정")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = args.file
+        if not path:
+            path = os.path.join(workdir, "dump.txt")
+            start = time.perf_counter()
+            make_dump(path, args.size)
+            print(f"파일 생성: {time.perf_counter() - start:.1f}초")
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        results = {}
+        for name, reader_class in (("줄 단위 읽기", PinFileReader), ("메모리 매핑", MappedPinScanner)):
+            count, elapsed = measure(reader_class(path, 50000))
+            results[name] = count
+            print(f"{name:>8}: {elapsed:7.2f}초, {size_mb / elapsed:7.1f}MB/s, PIN {count:,}개 ({size_mb:,.0f}MB)")
+
+    if len(set(results.values())) != 1:
+        print("두 방식이 찾은 PIN 수가 다릅니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
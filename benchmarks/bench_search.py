@@ -0,0 +1,83 @@
+"""PIN 검색 색인(eggcore.search) 키 입력당 응답 시간 벤치마크
+
+임시 지갑에 PIN을 만들고, 실제 PIN의 숫자 일부를 한 글자씩 입력하는 것처럼 검색어를 늘려 가며
+검색할 때마다 걸린 시간을 측정합니다. 입력할 때마다 다음 화면 갱신(16ms) 전에 결과가 나와야 하므로,
+--budget을 넘은 키 입력이 하나라도 있으면 종료 코드 1로 끝납니다.
+
+실행: python benchmarks/bench_search.py --pins 100000 --words 20
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eggcore import PinSearchIndex, PinStore
+
+DENOMINATIONS = [1000, 3000, 5000, 10000, 30000, 50000]
+BALANCE_QUERIES = ["5000~10000", ">=30000", "<5000", "=1000"]
+
+
+def make_pins(count, seed=0):
+    rng = random.Random(seed)
+    pins = {}
+    while len(pins) < count:
+        digits = "".join(rng.choice("0123456789") for _ in range(20))
+        pins[f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}"] = rng.choice(DENOMINATIONS)
+    return pins
+
+
+def keystrokes(pins, words, length, seed=0):
+    """실제 PIN에서 숫자 조각을 골라 한 글자씩 입력한 검색어 목록"""
+    rng = random.Random(seed)
+    sample = rng.sample(list(pins), words)
+    for number, pin in enumerate(sample):
+        digits = pin.replace("-", "")
+        start = rng.randint(0, len(digits) - length)
+        prefix = ""
+        if number % 4 == 3:
+            # 잔액 범위와 함께 입력하는 경우
+            prefix = rng.choice(BALANCE_QUERIES) + " "
+        for end in range(start + 1, start + length + 1):
+            yield prefix + digits[start:end]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pins", type=int, default=100000, help="지갑의 PIN 개수")
+    parser.add_argument("--words", type=int, default=20, help="입력해 볼 검색어 수")
+    parser.add_argument("--length", type=int, default=6, help="검색어마다 입력하는 숫자 수")
+    parser.add_argument("--budget", type=float, default=16.0, help="키 입력당 허용 시간 (ms)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store = PinStore(os.path.join(workdir, "pins.json"))
+        store.pins = make_pins(args.pins)
+
+        start = time.perf_counter()
+        index = PinSearchIndex(store)
+        print(f"색인 생성: {(time.perf_counter() - start) * 1000:.1f}ms (PIN {args.pins:,}개)")
+
+        timings = []
+        for text in keystrokes(store.pins, args.words, args.length):
+            start = time.perf_counter()
+            found = index.search(text)
+            elapsed = (time.perf_counter() - start) * 1000
+            timings.append(elapsed)
+            if elapsed > args.budget:
+                print(f"  {text!r:>24}: {elapsed:6.2f}ms ({'전체' if found is None else len(found)}개) - 허용 시간 초과")
+
+        timings.sort()
+        over = sum(1 for elapsed in timings if elapsed > args.budget)
+        print(f"키 입력 {len(timings)}회: 중앙값 {statistics.median(timings):.2f}ms, "
+              f"95% {timings[int(len(timings) * 0.95)]:.2f}ms, 최대 {timings[-1]:.2f}ms, "
+              f"{args.budget:g}ms 초과 {over}회")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""EggManager GUI와 PinManager CLI가 함께 사용하는 지갑 저장소
+
+Qt나 Windows API를 쓰지 않으므로 어떤 환경에서든 빠르게 불러올 수 있습니다.
+화면 멈춤 감시(eggcore.watchdog), 지갑 서비스(eggcore.daemon), 여러 파일 가져오기(eggcore.batchimport),
+일괄 명령(eggcore.cli)은 필요할 때 직접 불러옵니다.
+"""
+
+from .aggregates import WalletTotals
+from .fileio import file_stamp, write_json_atomic
+from .filelock import FileLock
+from .importer import (IncrementalPinParser, MappedPinScanner, PinFileReader, detect_encoding, format_pin,
+                       header_amount, is_valid_pin, iter_pins, may_contain_pins, open_pin_file, parse_pins,
+                       unformat_pin)
+from .lazy import LazyModule
+from .normalize import key_to_pin, normalize_pins, pin_key
+from .search import PinQuery, PinSearchIndex
+from .solver import compress_candidates, find_pins_for_amount
+from .spent import SpentPinArchive, spent_key
+from .stats import StatsLog, aggregate_days, empty_stats
+from .store import (BALANCE_CHANGED, LOCK_CHANGED, PIN_INSERTED, PIN_REMOVED, PINS_LOADED, WALLET_RESET, PinDelta,
+                    PinStore, diff_pins, summary_stamp)
+from .sync import SyncJournal
+from .wallet import PinWallet
+from .wallets import DEFAULT_WALLET, WalletRegistry
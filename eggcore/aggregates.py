@@ -0,0 +1,146 @@
+"""PIN이 바뀔 때마다 합계를 함께 갱신하는 지갑 컨테이너
+
+PinStore.pins / PinStore.locked_pins 는 이 모듈의 PinDict / LockedSet 이므로
+어디에서 딕셔너리나 집합을 직접 고쳐도 WalletTotals 의 합계가 항상 맞습니다.
+"""
+from collections import Counter
+
+_MISSING = object()
+
+
+class WalletTotals:
+    """총 잔액, 잠긴 잔액, PIN 개수, 잔액별 PIN 개수"""
+
+    def __init__(self):
+        self.total = 0
+        self.locked = 0
+        self.count = 0
+        self.histogram = Counter()
+
+    @property
+    def available(self):
+        return self.total - self.locked
+
+    def add(self, balance, locked):
+        self.total += balance
+        self.count += 1
+        self.histogram[balance] += 1
+        if locked:
+            self.locked += balance
+
+    def remove(self, balance, locked):
+        self.total -= balance
+        self.count -= 1
+        self.histogram[balance] -= 1
+        if not self.histogram[balance]:
+            del self.histogram[balance]
+        if locked:
+            self.locked -= balance
+
+
+class PinDict(dict):
+    """PIN -> 잔액 딕셔너리. 값이 바뀔 때마다 owner._pin_changed(pin, 이전 잔액, 새 잔액)을 호출합니다."""
+
+    def __init__(self, owner):
+        super().__init__()
+        self._owner = owner
+
+    def __setitem__(self, pin, balance):
+        old = self.get(pin, _MISSING)
+        super().__setitem__(pin, balance)
+        self._owner._pin_changed(pin, old, balance)
+
+    def __delitem__(self, pin):
+        old = self[pin]
+        super().__delitem__(pin)
+        self._owner._pin_changed(pin, old, _MISSING)
+
+    def pop(self, pin, *default):
+        if pin in self:
+            balance = self[pin]
+            del self[pin]
+            return balance
+        if default:
+            return default[0]
+        raise KeyError(pin)
+
+    def popitem(self):
+        pin, balance = super().popitem()
+        self._owner._pin_changed(pin, balance, _MISSING)
+        return pin, balance
+
+    def setdefault(self, pin, balance=None):
+        if pin not in self:
+            self[pin] = balance
+        return self[pin]
+
+    def update(self, *args, **kwargs):
+        for pin, balance in dict(*args, **kwargs).items():
+            self[pin] = balance
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        for pin in list(self):
+            del self[pin]
+
+
+class LockedSet(set):
+    """잠긴 PIN 집합. 바뀔 때마다 owner._lock_changed(pin, 잠김 여부)를 호출합니다."""
+
+    def __init__(self, owner):
+        super().__init__()
+        self._owner = owner
+
+    def add(self, pin):
+        if pin not in self:
+            super().add(pin)
+            self._owner._lock_changed(pin, True)
+
+    def discard(self, pin):
+        if pin in self:
+            super().discard(pin)
+            self._owner._lock_changed(pin, False)
+
+    def remove(self, pin):
+        if pin not in self:
+            raise KeyError(pin)
+        self.discard(pin)
+
+    def pop(self):
+        pin = super().pop()
+        self._owner._lock_changed(pin, False)
+        return pin
+
+    def update(self, *others):
+        for other in others:
+            for pin in other:
+                self.add(pin)
+
+    def difference_update(self, *others):
+        for other in others:
+            for pin in list(other):
+                self.discard(pin)
+
+    def intersection_update(self, *others):
+        keep = set(self).intersection(*others)
+        for pin in self - keep:
+            self.discard(pin)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def clear(self):
+        for pin in list(self):
+            self.discard(pin)
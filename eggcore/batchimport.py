@@ -0,0 +1,178 @@
+"""주문 하나로 받은 PIN 파일 여러 개를 프로세스 풀에서 나눠 읽고 한 번에 지갑에 추가하는 일괄 가져오기
+
+파일마다 작업 프로세스가 PIN을 찾아 정규 키(eggcore.normalize)로 바꿔 돌려주면, 이 프로세스는
+파일 순서대로 키를 합쳐 중복을 지우고(처음 나온 파일이 이김) 지갑에 한 번만 추가하고 저장합니다.
+도중에 취소하면 아무것도 추가하지 않습니다.
+"""
+import os
+import re
+import time
+from array import array
+
+from .importer import PinFileReader, iter_pins
+from .normalize import key_to_pin, normalize_pins
+
+# PIN처럼 보이는 숫자/하이픈 묶음 (20자 이상). PIN으로 인식되지 않은 묶음을 형식 오류로 셈
+_CANDIDATE = re.compile(r'\d[\d-]{18,}\d')
+
+
+def scan_pin_file(path, default_amount):
+    """작업 프로세스에서 실행: 파일 하나의 (정규 키, 금액, 형식 오류 수)
+
+    키는 (high, low)를 차례로 이어 붙인 array('Q'), 금액은 array('q')로 돌려줘 주고받는 비용이 적습니다.
+    """
+    reader = PinFileReader(path, default_amount)
+    candidates = 0
+
+    def counted(lines):
+        nonlocal candidates
+        for line in lines:
+            candidates += len(_CANDIDATE.findall(line))
+            yield line
+
+    pins = []
+    amounts = array('q')
+    for pin, amount, _ in iter_pins(counted(reader._lines()), default_amount):
+        pins.append(pin)
+        amounts.append(amount)
+    keys, _ = normalize_pins(pins)  # 찾은 PIN은 모두 올바른 형식
+    packed = array('Q')
+    if hasattr(keys, 'tobytes'):
+        packed.frombytes(keys.tobytes())
+    else:
+        for high, low in keys:
+            packed.append(high)
+            packed.append(low)
+    return packed, amounts, max(candidates - len(pins), 0)
+
+
+class FileImportResult:
+    """파일 하나의 가져오기 결과"""
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path) if os.path.exists(path) else 0
+        self.found = 0       # 찾은 PIN 수 (파일 안의 중복 포함)
+        self.added = 0       # 지갑에 추가한 PIN 수
+        self.duplicated = 0  # 지갑이나 앞 파일(또는 같은 파일)에 이미 있던 PIN 수
+        self.spent = 0       # 이미 모두 사용해 추가하지 않은 PIN 수
+        self.invalid = 0     # PIN처럼 보이지만 형식이 맞지 않는 숫자 묶음 수
+        self.error = None    # 읽지 못했으면 오류 메시지
+
+
+class MultiFileImport:
+    """PIN 파일 여러 개를 프로세스 풀로 읽어 지갑에 한 번에 추가합니다
+
+    run(wallet)은 파일 하나를 다 읽을 때마다 (읽은 파일 수, 전체 파일 수)를 내놓는 제너레이터입니다.
+    끝까지 돌면 지갑에 추가하고 저장하며, 도중에 멈추면(close) 남은 작업을 취소하고 아무것도 추가하지 않습니다.
+    is_spent(pin)을 주면 참인 PIN(이미 모두 사용한 PIN)은 추가하지 않고 spent로 셉니다.
+    """
+
+    def __init__(self, paths, default_amount, max_workers=None, is_spent=None):
+        self.default_amount = default_amount
+        self.is_spent = is_spent
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.files = [FileImportResult(path) for path in paths]
+        self.elapsed = 0.0
+        self.committed = False
+
+    @property
+    def found(self):
+        return sum(result.found for result in self.files)
+
+    @property
+    def added(self):
+        return sum(result.added for result in self.files)
+
+    @property
+    def duplicated(self):
+        return sum(result.duplicated for result in self.files)
+
+    @property
+    def spent(self):
+        return sum(result.spent for result in self.files)
+
+    @property
+    def invalid(self):
+        return sum(result.invalid for result in self.files)
+
+    @property
+    def size(self):
+        return sum(result.size for result in self.files)
+
+    def run(self, wallet):
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        started = time.perf_counter()
+        scans = [None] * len(self.files)
+        workers = max(1, min(self.max_workers, len(self.files)))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending = {executor.submit(scan_pin_file, result.path, self.default_amount): index
+                       for index, result in enumerate(self.files)}
+            done_count = 0
+            while pending:
+                # 진행률을 보여줄 수 있도록 조금씩만 기다림
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        scans[index] = future.result()
+                    except Exception as e:
+                        self.files[index].error = str(e) or type(e).__name__
+                    done_count += 1
+                yield done_count, len(self.files)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._commit(wallet, scans)
+        self.elapsed = time.perf_counter() - started
+
+    def _commit(self, wallet, scans):
+        # 파일 순서대로 합치며 같은 키는 처음 나온 것만 남김 (키 -> (파일 번호, 금액))
+        owners = {}
+        for index, scan in enumerate(scans):
+            if scan is None:
+                continue
+            keys, amounts, invalid = scan
+            result = self.files[index]
+            result.found = len(amounts)
+            result.invalid = invalid
+            for key, amount in zip(zip(keys[0::2], keys[1::2]), amounts):
+                owners.setdefault(key, (index, amount))
+
+        pins = wallet.pins
+        is_spent = self.is_spent
+        new_pins = []
+        for (high, low), (index, amount) in owners.items():
+            pin = key_to_pin(high, low)
+            if pin in pins:
+                continue
+            if is_spent is not None and is_spent(pin):
+                self.files[index].spent += 1
+            else:
+                new_pins.append((pin, amount))
+                self.files[index].added += 1
+        for result in self.files:
+            result.duplicated = result.found - result.added - result.spent
+        if new_pins:
+            wallet.add_pins(new_pins)
+            wallet.save_pins()
+        self.committed = True
+
+    def report(self):
+        """파일별 결과와 처리량을 보여주는 여러 줄 문자열"""
+        lines = []
+        for result in self.files:
+            name = os.path.basename(result.path)
+            if result.error:
+                lines.append(f"{name}: 읽지 못함 ({result.error})")
+            else:
+                lines.append(f"{name}: 추가 {result.added:,}개, 중복 {result.duplicated:,}개, "
+                             f"이미 사용됨 {result.spent:,}개, 형식 오류 {result.invalid:,}개")
+        seconds = max(self.elapsed, 1e-9)
+        lines.append(f"합계: 추가 {self.added:,}개, 중복 {self.duplicated:,}개, 이미 사용됨 {self.spent:,}개, "
+                     f"형식 오류 {self.invalid:,}개")
+        lines.append(f"처리량: 파일 {len(self.files)}개 {self.size / 1024 / 1024:,.1f}MB, {self.elapsed:.2f}초 "
+                     f"({self.found / seconds:,.0f}개/초, {self.size / 1024 / 1024 / seconds:,.1f}MB/초, "
+                     f"작업 프로세스 {max(1, min(self.max_workers, len(self.files)))}개)")
+        return "\n".join(lines)
@@ -0,0 +1,246 @@
+"""스크립트와 예약 작업용 PinManager 일괄 명령 (pinmgr)
+
+python PinManager.py <명령> ... 또는 python -m eggcore.cli <명령> ... 으로 실행하며, 결과는 JSON 한 개로
+표준 출력에 씁니다. PIN은 인자로 주거나 표준 입력으로 흘려보내면(한 줄씩 읽음) PIN 일괄 추가와 같은
+해석기로 찾고, 명령 하나의 변경은 지갑 잠금을 한 번 잡고 모두 반영한 뒤 한 번만 저장합니다.
+GUI와 같은 지갑 파일(config.ini의 pin_file 등), 사용한 PIN 보관소, PIN 조합 계산을 사용합니다.
+
+  pinmgr add 12345-67890-12345-67890 5000        pinmgr add --amount 10000 < pins.txt
+  pinmgr delete 12345-67890-12345-67890           pinmgr update 12345-67890-12345-67890 3000
+  pinmgr total | list | find 23000 | import a.txt b.csv | export --format csv
+"""
+import argparse
+import configparser
+import csv
+import io
+import json
+import os
+import sys
+
+from .importer import iter_pins
+from .wallet import PinWallet
+from .wallets import DEFAULT_WALLET, WalletRegistry
+
+
+def default_paths(config_file='config.ini'):
+    """GUI의 기본 지갑과 같은 파일 경로 (config.ini가 없으면 GUI의 기본값)"""
+    config = configparser.ConfigParser()
+    config.read(config_file, encoding='utf-8')
+    defaults = config['DEFAULT']
+    return {
+        'pins': defaults.get('pin_file', 'pins.json'),
+        'txt': defaults.get('txt_file', 'pins.txt'),
+        'log': defaults.get('log_file', 'pin_usage_log.txt'),
+        'locked': os.path.join("resource", "locked_pins.json"),
+        'journal': os.path.join("resource", "pins_sync.json"),
+        'summary': os.path.join("resource", "pins_summary.json"),
+    }
+
+
+def open_wallet(name=DEFAULT_WALLET, wallet_class=PinWallet):
+    """GUI와 같은 파일(잠긴 PIN, 사용한 PIN 보관소 포함)로 지갑을 엽니다 (wallet_class는 PinWallet 하위 클래스)"""
+    def factory(paths, load=True):
+        return wallet_class(paths, os.path.join("resource", "pin_stats.json"), load=load,
+                            spent_file=os.path.join("resource", "spent_pins.bin"))
+    registry = WalletRegistry(factory, default_paths())
+    try:
+        return registry.open(name)
+    except KeyError:
+        raise ValueError(f"'{name}' 지갑이 없습니다.") from None
+
+
+def read_entries(args, default_amount):
+    """인자(공백으로 이어 한 줄로 해석)나 표준 입력(한 줄씩)에서 (PIN, 금액, 줄)을 차례로 내놓습니다"""
+    if args.pins:
+        return iter_pins([" ".join(args.pins)], default_amount)
+    return iter_pins(sys.stdin, default_amount)
+
+
+class Transaction:
+    """지갑 잠금을 잡고 다른 프로세스의 변경을 읽은 뒤, 끝날 때 한 번만 저장합니다"""
+
+    def __init__(self, wallet):
+        self.wallet = wallet
+        self.changed = False
+
+    def __enter__(self):
+        self.wallet.file_lock.acquire()
+        try:
+            self.wallet.reload_external()
+        except BaseException:
+            self.wallet.file_lock.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None and self.changed:
+                self.wallet.save_pins()
+                self.wallet.save_pins_to_txt()
+        finally:
+            self.wallet.file_lock.release()
+
+
+def cmd_add(wallet, args):
+    wallet.refresh_spent_pins()
+    added = duplicated = spent = 0
+    with Transaction(wallet) as transaction:
+        new_pins = {}
+        for pin, amount, _ in read_entries(args, args.amount):
+            if pin in wallet.pins or pin in new_pins:
+                duplicated += 1
+            elif not args.allow_spent and wallet.is_pin_spent(pin):
+                spent += 1
+            else:
+                new_pins[pin] = amount
+        added = len(wallet.add_pins(new_pins.items()))
+        transaction.changed = bool(added)
+    return {'added': added, 'duplicated': duplicated, 'spent': spent}
+
+
+def cmd_delete(wallet, args):
+    deleted = []
+    missing = []
+    with Transaction(wallet) as transaction:
+        for pin, _, _ in read_entries(args, 0):
+            if pin in wallet.pins:
+                del wallet.pins[pin]
+                wallet.locked_pins.discard(pin)
+                deleted.append(pin)
+            else:
+                missing.append(pin)
+        if deleted:
+            transaction.changed = True
+            wallet.save_locked_pins()
+    return {'deleted': len(deleted), 'missing': missing}
+
+
+def cmd_update(wallet, args):
+    updated = 0
+    missing = []
+    invalid = []
+    with Transaction(wallet) as transaction:
+        for pin, amount, _ in read_entries(args, None):
+            if amount is None or amount <= 0:
+                invalid.append(pin)
+            elif pin in wallet.pins:
+                wallet.pins[pin] = amount
+                updated += 1
+            else:
+                missing.append(pin)
+        transaction.changed = bool(updated)
+    return {'updated': updated, 'missing': missing, 'invalid': invalid}
+
+
+def cmd_total(wallet, args):
+    return wallet.get_totals()
+
+
+def cmd_list(wallet, args):
+    locked = wallet.locked_pins
+    return {'pins': [{'pin': pin, 'balance': balance, 'locked': pin in locked}
+                     for pin, balance in wallet.pins.items()]}
+
+
+def cmd_find(wallet, args):
+    results = []
+    for amount in args.amounts:
+        selected = wallet.find_pins_for_amount(amount)
+        results.append({'amount': amount, 'total': sum(balance for _, balance in selected),
+                        'pins': [{'pin': pin, 'balance': balance} for pin, balance in selected]})
+    return {'results': results}
+
+
+def cmd_import(wallet, args):
+    from .batchimport import MultiFileImport
+
+    wallet.refresh_spent_pins()
+    job = MultiFileImport(args.files, args.amount, args.workers,
+                          is_spent=None if args.allow_spent else wallet.is_pin_spent)
+    with Transaction(wallet):
+        for _ in job.run(wallet):  # 모두 읽은 뒤 한 번만 추가하고 저장함
+            pass
+    if job.added:
+        wallet.save_pins_to_txt()
+    return {
+        'files': [{'path': result.path, 'found': result.found, 'added': result.added,
+                   'duplicated': result.duplicated, 'spent': result.spent, 'invalid': result.invalid,
+                   'error': result.error}
+                  for result in job.files],
+        'added': job.added, 'duplicated': job.duplicated, 'spent': job.spent, 'invalid': job.invalid,
+        'seconds': round(job.elapsed, 3), 'pins_per_second': round(job.found / max(job.elapsed, 1e-9)),
+    }
+
+
+def cmd_export(wallet, args):
+    if args.format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(['pin', 'balance', 'locked'])
+        for pin, balance in wallet.pins.items():
+            writer.writerow([pin, balance, int(pin in wallet.locked_pins)])
+        return buffer.getvalue()
+    return dict(wallet.pins)
+
+
+COMMANDS = {
+    'add': cmd_add, 'delete': cmd_delete, 'update': cmd_update, 'total': cmd_total,
+    'list': cmd_list, 'find': cmd_find, 'import': cmd_import, 'export': cmd_export,
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='pinmgr', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--wallet', default=DEFAULT_WALLET, help="사용할 지갑 이름 (기본 지갑)")
+    parser.add_argument('--indent', type=int, default=None, help="JSON 들여쓰기 (기본은 한 줄)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="PIN 추가 (PIN 뒤에 금액을 적거나 --amount)")
+    add.add_argument('pins', nargs='*', help="PIN과 금액 (없으면 표준 입력에서 읽음)")
+    add.add_argument('--amount', type=int, default=50000, help="금액이 적혀 있지 않은 PIN의 잔액")
+    add.add_argument('--allow-spent', action='store_true', help="이미 사용한 PIN도 추가")
+
+    delete = commands.add_parser('delete', help="PIN 삭제")
+    delete.add_argument('pins', nargs='*', help="삭제할 PIN (없으면 표준 입력에서 읽음)")
+
+    update = commands.add_parser('update', help="PIN 잔액 수정 (PIN 뒤에 새 잔액)")
+    update.add_argument('pins', nargs='*', help="PIN과 새 잔액 (없으면 표준 입력에서 읽음)")
+
+    commands.add_parser('total', help="총 잔액과 잔액별 PIN 개수")
+    commands.add_parser('list', help="PIN 목록")
+
+    find = commands.add_parser('find', help="금액에 맞는 PIN 조합 (잠긴 PIN 제외)")
+    find.add_argument('amounts', nargs='+', type=int, help="찾을 금액")
+
+    import_ = commands.add_parser('import', help="TXT/CSV 파일 여러 개를 한 번에 가져오기")
+    import_.add_argument('files', nargs='+', help="가져올 파일")
+    import_.add_argument('--amount', type=int, default=50000, help="금액이 적혀 있지 않은 PIN의 잔액")
+    import_.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본 CPU 수)")
+    import_.add_argument('--allow-spent', action='store_true', help="이미 사용한 PIN도 추가")
+
+    export = commands.add_parser('export', help="지갑 내보내기")
+    export.add_argument('--format', choices=['json', 'csv'], default='json', help="출력 형식")
+    return parser
+
+
+def main(argv=None):
+    """명령을 실행하고 종료 코드를 반환합니다 (오류면 {"error": ...}를 출력하고 1)"""
+    args = build_parser().parse_args(argv)
+    try:
+        wallet = open_wallet(args.wallet)
+        result = COMMANDS[args.command](wallet, args)
+    except (OSError, ValueError, TimeoutError) as e:
+        result, status = {'error': str(e)}, 1
+    else:
+        status = 0
+    if isinstance(result, str):
+        sys.stdout.write(result)
+    else:
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=args.indent)
+        sys.stdout.write("\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,492 @@
+"""지갑을 메모리에 유지하며 Unix 도메인 소켓으로 JSON-RPC 요청을 처리하는 로컬 서비스
+
+한 줄에 하나의 JSON-RPC 2.0 요청을 보내고, 응답을 기다리지 않고 여러 요청을 이어서
+보낼 수 있습니다(파이프라이닝). 응답은 요청 순서대로 한 줄씩 돌아옵니다.
+
+GUI, CLI와 같은 지갑(PinWallet)을 쓰므로 사용한 PIN 보관소, 사용 로그, 통계, pins.txt도 함께 갱신합니다.
+
+실행: python -m eggcore.daemon --wallet 기본 --socket resource/eggmanager.sock
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+import uuid
+
+from .cli import open_wallet
+from .importer import format_pin, is_valid_pin
+from .solver import compress_candidates, find_pins_for_amount
+from .wallets import DEFAULT_WALLET
+
+DEFAULT_SOCKET = os.path.join("resource", "eggmanager.sock")
+PIN_SPENT = -32001  # add: 이미 모두 사용한 PIN (allow_spent=True로 다시 요청하면 추가)
+
+
+class ServiceError(Exception):
+    """클라이언트에게 JSON-RPC 오류로 전달되는 예외"""
+
+    def __init__(self, message, code=-32000):
+        super().__init__(message)
+        self.code = code
+
+
+class WalletService:
+    """지갑(PinWallet), 잔액 정렬 인덱스, PIN 예약 상태를 메모리에 유지하며 요청을 처리합니다.
+
+    commit 결과는 모아서 한 번에 저장(그룹 커밋)하고, 저장이 끝난 뒤에 응답합니다.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.lock = threading.RLock()
+        self._locked_dirty = False  # 잠긴 PIN을 지워 잠금 목록도 저장해야 함
+        self.reservations = {}   # 예약 토큰 -> (PIN 목록, 만료 시각)
+        self.reserved = {}       # PIN -> 예약 토큰
+        self._sorted_pins = None  # 잠기지 않은 PIN의 잔액 오름차순 목록 (변경 시 무효화)
+        self._candidates = None   # 예약되지 않은 PIN 중 잔액별 최대 5개 (예약 변경 시에도 무효화)
+        self._disk_stamp = self._stamp()
+
+        self._flush_cond = threading.Condition()
+        self._dirty_seq = 0
+        self._flushed_seq = 0
+        self._flush_error = None
+        self._stopping = False
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+        self.methods = {
+            'query': self.query,
+            'plan': self.plan,
+            'reserve': self.reserve,
+            'release': self.release,
+            'commit': self.commit,
+            'add': self.add,
+            'delete': self.delete,
+            'update': self.update,
+        }
+
+    def _stamp(self):
+        stamp = []
+        for path in (self.store.filename, self.store.locked_pins_file):
+            try:
+                info = os.stat(path) if path else None
+                stamp.append((info.st_mtime_ns, info.st_size) if info else None)
+            except FileNotFoundError:
+                stamp.append(None)
+        return stamp
+
+    def _sync_external(self):
+        # GUI나 다른 CLI가 파일을 바꿨으면 변경분만 반영
+        # (아직 저장하지 않은 변경이 있으면 저장 스레드가 저장한 뒤 반영)
+        if self._dirty_seq != self._flushed_seq:
+            return
+        stamp = self._stamp()
+        if stamp == self._disk_stamp:
+            return
+        try:
+            if self.store.reload_external():
+                self._invalidate()
+        except (ValueError, TimeoutError):
+            return
+        self._disk_stamp = stamp
+
+    def _expire_reservations(self):
+        now = time.monotonic()
+        for token, (pins, expires) in list(self.reservations.items()):
+            if expires <= now:
+                self._drop_reservation(token)
+
+    def _drop_reservation(self, token):
+        self._candidates = None
+        pins, _ = self.reservations.pop(token, ([], 0))
+        for pin in pins:
+            if self.reserved.get(pin) == token:
+                del self.reserved[pin]
+
+    def _available_sorted(self):
+        if self._sorted_pins is None:
+            locked = self.store.locked_pins
+            self._sorted_pins = sorted(
+                ((pin, balance) for pin, balance in self.store.pins.items() if pin not in locked),
+                key=lambda x: x[1])
+        return self._sorted_pins
+
+    def _plan_candidates(self):
+        if self._candidates is None:
+            available = self._available_sorted()
+            if self.reserved:
+                available = [(pin, balance) for pin, balance in available if pin not in self.reserved]
+            self._candidates = compress_candidates(available)
+        return self._candidates
+
+    def _invalidate(self):
+        self._sorted_pins = None
+        self._candidates = None
+
+    def _changed(self):
+        self._invalidate()
+        with self._flush_cond:
+            self._dirty_seq += 1
+            self._flush_cond.notify_all()
+            return self._dirty_seq
+
+    def _wait_flushed(self, seq):
+        with self._flush_cond:
+            while self._flushed_seq < seq and self._flush_error is None:
+                self._flush_cond.wait()
+            if self._flush_error is not None:
+                raise ServiceError(f"저장 중 오류가 발생했습니다: {self._flush_error}")
+
+    def _flush_loop(self):
+        while True:
+            with self._flush_cond:
+                while self._dirty_seq == self._flushed_seq and not self._stopping:
+                    self._flush_cond.wait()
+                if self._stopping and self._dirty_seq == self._flushed_seq:
+                    return
+            with self.lock:
+                # 잠금을 잡은 동안에는 새 변경이 생기지 않으므로 지금까지의 변경을 모두 저장
+                seq = self._dirty_seq
+                try:
+                    # 저장하면서 병합된 다른 프로세스의 변경이 있으면 메모리에도 반영
+                    external = self.store.save_pins()
+                    if self._locked_dirty:
+                        self.store.save_locked_pins()
+                        self._locked_dirty = False
+                    if external and self.store.reload_external():
+                        self._invalidate()
+                    self.store.save_pins_to_txt()
+                    self._disk_stamp = self._stamp()
+                    error = None
+                except Exception as e:
+                    error = e
+            with self._flush_cond:
+                self._flushed_seq = seq
+                self._flush_error = error
+                self._flush_cond.notify_all()
+
+    def close(self):
+        """남은 변경분을 저장하고 저장 스레드를 종료합니다."""
+        with self._flush_cond:
+            self._stopping = True
+            self._flush_cond.notify_all()
+        self._flusher.join()
+
+    def dispatch(self, request):
+        """JSON-RPC 요청 딕셔너리 하나를 처리하여 응답 딕셔너리를 반환합니다."""
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                raise ServiceError("잘못된 요청입니다.", -32600)
+            method = self.methods.get(request['method'])
+            if method is None:
+                raise ServiceError(f"알 수 없는 메서드입니다: {request['method']}", -32601)
+            params = request.get('params') or {}
+            if not isinstance(params, dict):
+                raise ServiceError("params는 객체여야 합니다.", -32602)
+            result = method(**params)
+            return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        except ServiceError as e:
+            return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': e.code, 'message': str(e)}}
+        except TypeError as e:
+            return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': -32602, 'message': str(e)}}
+
+    def query(self, what='total', pin=None):
+        """total: 잔액 합계와 잔액별 PIN 개수, list: [PIN, 잔액, 잠금] 목록, get: PIN 하나의 잔액"""
+        with self.lock:
+            self._sync_external()
+            if what == 'total':
+                return self.store.get_totals()
+            if what == 'list':
+                locked = self.store.locked_pins
+                return [[p, balance, p in locked] for p, balance in self.store.pins.items()]
+            if what == 'get':
+                return self.store.pins.get(pin)
+        raise ServiceError(f"알 수 없는 조회 종류입니다: {what}", -32602)
+
+    def plan(self, amount, pins=None, reserve=False, ttl=60):
+        """금액에 맞는 PIN 조합을 찾습니다. reserve=True면 찾은 조합을 바로 예약합니다."""
+        with self.lock:
+            self._sync_external()
+            self._expire_reservations()
+            if pins is not None:
+                allowed = set(pins)
+                candidates = [(pin, balance) for pin, balance in self._available_sorted()
+                              if pin in allowed and pin not in self.reserved]
+            else:
+                candidates = self._plan_candidates()
+            selected = find_pins_for_amount(candidates, amount)
+            result = {'pins': [[pin, balance] for pin, balance in selected],
+                      'total': sum(balance for _, balance in selected)}
+            if reserve and selected:
+                result['token'] = self._reserve([pin for pin, _ in selected], ttl)
+            return result
+
+    def _reserve(self, pins, ttl):
+        self._candidates = None
+        token = uuid.uuid4().hex
+        self.reservations[token] = (list(pins), time.monotonic() + ttl)
+        for pin in pins:
+            self.reserved[pin] = token
+        return token
+
+    def reserve(self, pins, ttl=60):
+        """PIN을 다른 클라이언트가 계획에 쓰지 못하도록 예약하고 토큰을 반환합니다."""
+        with self.lock:
+            self._sync_external()
+            self._expire_reservations()
+            for pin in pins:
+                if pin not in self.store.pins:
+                    raise ServiceError(f"PIN {pin}은(는) 존재하지 않습니다.")
+                if pin in self.reserved:
+                    raise ServiceError(f"PIN {pin}은(는) 이미 예약되어 있습니다.")
+            return self._reserve(pins, ttl)
+
+    def release(self, token):
+        """예약을 취소합니다."""
+        with self.lock:
+            found = token in self.reservations
+            self._drop_reservation(token)
+            return found
+
+    def commit(self, amount, token=None, pins=None, product_name=None):
+        """예약한(또는 지정한) PIN으로 금액을 사용한 결과를 반영하고 저장이 끝나면 응답합니다.
+
+        모두 사용한 PIN은 사용한 PIN 보관소에 기록하고, 사용 로그(product_name이 있으면 통계도)를 남깁니다.
+        """
+        with self.lock:
+            self._sync_external()
+            if token is not None:
+                if token not in self.reservations:
+                    raise ServiceError("예약이 없거나 만료되었습니다.")
+                pins = self.reservations[token][0]
+            if not pins:
+                raise ServiceError("사용할 PIN이 없습니다.")
+            selected = []
+            for pin in pins:
+                if pin not in self.store.pins:
+                    raise ServiceError(f"PIN {pin}은(는) 존재하지 않습니다.")
+                if token is None and pin in self.reserved:
+                    raise ServiceError(f"PIN {pin}은(는) 이미 예약되어 있습니다.")
+                selected.append((pin, self.store.pins[pin]))
+            if sum(balance for _, balance in selected) < amount:
+                raise ServiceError("충분한 잔액이 없습니다.")
+            used = self.store.apply_usage(selected, amount)
+            if token is not None:
+                self._drop_reservation(token)
+            seq = self._changed()
+            try:
+                self.store.log_usage(f"{product_name or '지갑 서비스'} - {amount}원\n", used, product_name, amount)
+            except OSError as e:
+                log_error = e
+            else:
+                log_error = None
+        self._wait_flushed(seq)
+        if log_error is not None:
+            raise ServiceError(f"PIN 사용은 반영했지만 사용 로그를 저장하지 못했습니다: {log_error}")
+        return {'used': [list(info) for info in used]}
+
+    @staticmethod
+    def _check_balance(balance):
+        if isinstance(balance, bool) or not isinstance(balance, int) or balance <= 0:
+            raise ServiceError("잔액은 0보다 큰 정수여야 합니다.", -32602)
+
+    def add(self, pin, balance, allow_spent=False):
+        """PIN을 추가합니다. 이미 모두 사용한 PIN은 allow_spent=True일 때만 추가합니다 (pinmgr add --allow-spent와 같음)"""
+        pin = format_pin(str(pin).strip())
+        if not is_valid_pin(pin):
+            raise ServiceError(f"올바른 PIN 형식이 아닙니다: {pin}", -32602)
+        self._check_balance(balance)
+        with self.lock:
+            self._sync_external()
+            if pin in self.store.pins:
+                raise ServiceError(f"PIN {pin}은(는) 이미 존재합니다.")
+            self.store.refresh_spent_pins()
+            if not allow_spent and self.store.is_pin_spent(pin):
+                raise ServiceError(f"PIN {pin}은(는) 이미 사용한 PIN입니다.", PIN_SPENT)
+            self.store.pins[pin] = balance
+            seq = self._changed()
+        self._wait_flushed(seq)
+        return True
+
+    def delete(self, pin):
+        with self.lock:
+            self._sync_external()
+            if pin not in self.store.pins:
+                raise ServiceError(f"PIN {pin}은(는) 존재하지 않습니다.")
+            del self.store.pins[pin]
+            if pin in self.store.locked_pins:
+                self.store.locked_pins.discard(pin)
+                self._locked_dirty = True
+            seq = self._changed()
+        self._wait_flushed(seq)
+        return True
+
+    def update(self, pin, balance):
+        self._check_balance(balance)
+        with self.lock:
+            self._sync_external()
+            if pin not in self.store.pins:
+                raise ServiceError(f"PIN {pin}은(는) 존재하지 않습니다.")
+            previous = self.store.pins[pin]
+            self.store.pins[pin] = balance
+            seq = self._changed()
+        self._wait_flushed(seq)
+        return previous
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        service = self.server.service
+        buffer = b""
+        while True:
+            chunk = self.request.recv(65536)
+            if not chunk:
+                return
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            # 한 번에 받은 요청들의 응답을 모아서 보냄
+            responses = []
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {'jsonrpc': '2.0', 'id': None,
+                                'error': {'code': -32700, 'message': "JSON 파싱 오류"}}
+                else:
+                    response = service.dispatch(request)
+                responses.append(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+            if responses:
+                self.request.sendall(b"".join(responses))
+
+
+# Windows의 파이썬은 AF_UNIX 소켓을 지원하지 않으므로 서버는 Unix 계열에서만 정의
+if hasattr(socketserver, 'UnixStreamServer'):
+    class WalletServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, socket_path, service):
+            self.service = service
+            directory = os.path.dirname(socket_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            _remove_stale_socket(socket_path)
+            super().__init__(socket_path, _RequestHandler)
+
+        def server_close(self):
+            super().server_close()
+            try:
+                os.remove(self.server_address)
+            except OSError:
+                pass
+
+
+def _remove_stale_socket(socket_path):
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.remove(socket_path)  # 이전 실행이 남긴 소켓 파일
+    else:
+        raise ServiceError(f"이미 실행 중인 서비스가 있습니다: {socket_path}")
+    finally:
+        probe.close()
+
+
+class DaemonError(RuntimeError):
+    """서비스가 오류 응답을 보냈을 때 클라이언트에서 발생하는 예외 (code는 JSON-RPC 오류 코드)"""
+
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code
+
+
+class WalletClient:
+    """WalletServer에 연결하는 클라이언트 (GUI 스레드가 아닌 곳에서 사용)"""
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, timeout=30.0):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(socket_path)
+        self.reader = self.sock.makefile("rb")
+        self._next_id = 0
+
+    @staticmethod
+    def available(socket_path=DEFAULT_SOCKET):
+        """서비스가 실행 중인지 확인합니다."""
+        if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+            return False
+        try:
+            WalletClient(socket_path, timeout=1.0).close()
+            return True
+        except OSError:
+            return False
+
+    def pipeline(self, calls):
+        """[(메서드, params), ...] 요청을 한 번에 보내고 결과 목록을 순서대로 반환합니다."""
+        payload = []
+        for method, params in calls:
+            self._next_id += 1
+            payload.append(json.dumps({'jsonrpc': '2.0', 'id': self._next_id,
+                                       'method': method, 'params': params}).encode('utf-8'))
+        self.sock.sendall(b"\n".join(payload) + b"\n")
+        results = []
+        for _ in calls:
+            line = self.reader.readline()
+            if not line:
+                raise DaemonError("서비스와의 연결이 끊어졌습니다.")
+            response = json.loads(line)
+            if 'error' in response:
+                results.append(DaemonError(response['error']['message'], response['error'].get('code')))
+            else:
+                results.append(response['result'])
+        return results
+
+    def call(self, method, **params):
+        result = self.pipeline([(method, params)])[0]
+        if isinstance(result, DaemonError):
+            raise result
+        return result
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EggManager 지갑 서비스")
+    parser.add_argument('--wallet', default=DEFAULT_WALLET, help="사용할 지갑 이름 (기본 지갑, 파일 경로는 config.ini)")
+    parser.add_argument('--socket', default=os.environ.get('EGGMANAGER_SOCKET', DEFAULT_SOCKET), help="Unix 소켓 경로")
+    args = parser.parse_args(argv)
+
+    try:
+        wallet = open_wallet(args.wallet)
+    except ValueError as e:
+        parser.exit(1, f"{e}\n")
+    service = WalletService(wallet)
+    server = WalletServer(args.socket, service)
+    print(f"지갑 서비스 시작: {args.socket} (PIN {len(service.store.pins)}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
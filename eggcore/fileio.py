@@ -0,0 +1,40 @@
+import json
+import os
+import stat
+import tempfile
+
+# 새 파일에 줄 권한 (open()으로 만든 파일과 같게): 현재 umask는 바꿔서 읽을 수밖에 없으므로 불러올 때 한 번만 읽음
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def file_stamp(filename):
+    """파일의 (수정 시각, 크기)를 반환합니다. 파일이 없으면 None을 반환합니다."""
+    try:
+        info = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+
+def write_json_atomic(filename, data, **kwargs):
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 저장합니다.
+
+    mkstemp가 만든 임시 파일은 0600이므로, 원래 파일(없으면 open()으로 새로 만든 파일)의 권한을 옮겨 줍니다.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp_", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding=kwargs.pop('encoding', None)) as file:
+            file.write(json.dumps(data, **kwargs))
+        try:
+            mode = stat.S_IMODE(os.stat(filename).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
@@ -0,0 +1,78 @@
+import os
+import time
+import threading
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """여러 프로세스(GUI 창, CLI)가 같은 지갑 파일을 쓸 때 사용하는 권고(advisory) 잠금"""
+
+    def __init__(self, path, timeout=10.0, poll_interval=0.05):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._file = None
+        self._depth = 0  # 같은 프로세스 안에서 중첩 획득 허용
+        self._thread_lock = threading.RLock()
+
+    def _try_lock(self):
+        if os.name == 'nt':
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(self):
+        if os.name == 'nt':
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    def acquire(self):
+        """잠금을 획득합니다. timeout 안에 획득하지 못하면 TimeoutError를 발생시킵니다."""
+        self._thread_lock.acquire()
+        if self._depth > 0:
+            self._depth += 1
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a+b")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._try_lock()
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    self._file.close()
+                    self._file = None
+                    self._thread_lock.release()
+                    raise TimeoutError(f"다른 프로그램이 {self.path} 잠금을 해제하지 않습니다.")
+                time.sleep(self.poll_interval)
+        self._depth = 1
+
+    def release(self):
+        """잠금을 해제합니다."""
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self._unlock()
+            finally:
+                self._file.close()
+                self._file = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -0,0 +1,452 @@
+"""붙여넣은 텍스트에서 PIN과 금액을 찾아내는 PIN 일괄 추가 해석기
+
+에그머니 구매 문자나 G마켓 주문 내역처럼 여러 형식이 섞인 텍스트를 받아
+(PIN, 금액, PIN이 있던 줄) 목록으로 만듭니다. GUI의 PIN 일괄 추가와 CLI가 함께 사용합니다.
+"""
+import bisect
+import codecs
+import csv
+import mmap
+import os
+import re
+from operator import attrgetter
+
+PIN_FORMAT = re.compile(r'^\d{5}-\d{5}-\d{5}-\d{5}$')
+_GROUPED_PIN = re.compile(r'^\d{4}-\d{4}-\d{4}-\d{4}-\d{4}$')
+
+# 텍스트를 한 번만 훑으며 에그머니 헤더와 PIN(+ 바로 뒤에 적힌 금액)을 차례로 찾는 토큰 패턴
+# PIN 앞에 숫자가 없는지는 첫 숫자 뒤에서 확인함: 모든 갈래가 [, (, 숫자로 시작해야
+# 정규식 엔진이 그 외의 글자를 빠르게 건너뜀
+# PIN 뒤의 금액 앞에는 "PIN: ..., 금액: 10000원"처럼 금액:/잔액: 이름표가 올 수 있음
+_TOKEN = re.compile(r"""
+    (?P<header>\[에그머니[^\]\n]*\]|\(에그머니[^)\n]*\))
+  | (?P<pin>\d(?<!\d\d)(?:\d{4}-\d{5}-\d{5}-\d{5}|\d{3}-\d{4}-\d{4}-\d{4}-\d{4}|\d{19}))(?!-?\d)
+    (?:[ \t]*,?[ \t]*(?:(?:금액|잔액)[ \t]*:?[ \t]*)?(?P<amount>\d{1,3}(?:,\d{3})+|\d{1,9})(?P<unit>만원|천원|원)?(?!-?\d))?
+""", re.VERBOSE)
+_HEADER_AMOUNT = re.compile(r'(\d{1,3}(?:,\d{3})+|\d+)\s*(만원|천원|원)')
+_UNITS = {'만원': 10000, '천원': 1000}
+
+
+def unformat_pin(formatted_pin):
+    return formatted_pin.replace("-", "")
+
+
+def format_pin(pin):
+    """숫자만 20자리이거나 4-4-4-4-4 형식인 PIN을 00000-00000-00000-00000 형식으로 바꿉니다"""
+    if _GROUPED_PIN.match(pin):
+        pin = unformat_pin(pin)
+    if len(pin) == 20 and pin.isdigit():
+        return f"{pin[:5]}-{pin[5:10]}-{pin[10:15]}-{pin[15:]}"
+    return pin
+
+
+def is_valid_pin(pin):
+    return bool(PIN_FORMAT.match(pin))
+
+
+def _amount_value(number, unit):
+    """'50,000' + '원' -> 50000, '1' + '만원' -> 10000"""
+    return int(number.replace(',', '')) * _UNITS.get(unit, 1)
+
+
+def header_amount(header, default_amount):
+    """[에그머니-1만원권], [에그머니 50,000원], (에그머니 5천원) 같은 헤더의 금액"""
+    match = _HEADER_AMOUNT.search(header)
+    if match:
+        return _amount_value(*match.groups())
+    # 숫자 없이 만원/천원만 적힌 경우
+    if '만원' in header:
+        return 10000
+    if '천원' in header:
+        return 1000
+    return default_amount
+
+
+CLIPBOARD_MAX_LENGTH = 64 * 1024  # 이보다 긴 클립보드 텍스트는 PIN을 찾지 않음
+
+
+def may_contain_pins(text, max_length=CLIPBOARD_MAX_LENGTH, min_digit_ratio=0.1):
+    """parse_pins를 부르기 전에 PIN이 있을 만한 텍스트인지 빠르게 확인합니다 (길이와 숫자 비율만 봄)
+
+    클립보드가 바뀔 때마다 부르므로 정규식을 쓰지 않고, 너무 길거나 숫자가 PIN 하나보다 적거나
+    숫자 비율이 낮은 텍스트(긴 문서, 코드 등)는 바로 거릅니다.
+    """
+    if not 20 <= len(text) <= max_length:
+        return False
+    digits = sum(map(text.count, '0123456789'))
+    return digits >= 20 and digits >= len(text) * min_digit_ratio
+
+
+def parse_pins(text, default_amount):
+    """텍스트에서 찾은 [(PIN, 금액, PIN이 있던 줄)]을 처음 나온 순서로 반환합니다 (같은 PIN은 한 번만)
+
+    텍스트를 처음부터 한 번만 훑습니다. 에그머니 헤더를 만나면 다음 헤더까지 나오는 PIN에 헤더
+    금액을 쓰고, PIN 바로 뒤에 금액이 적혀 있으면(공백이나 쉼표로 구분, 5000 / 5,000원 / 1만원)
+    그 금액을 씁니다. 둘 다 없으면 default_amount를 씁니다.
+    PIN은 00000-00000-00000-00000, 숫자만 20자리, 4-4-4-4-4 형식을 인식합니다.
+    """
+    current_amount = default_amount  # 상태: 마지막으로 만난 헤더의 금액
+    unique_pins = {}
+    for token in _TOKEN.finditer(text):
+        header, pin, number, unit = token.groups()
+        if header is not None:
+            current_amount = header_amount(header, default_amount)
+            continue
+        digits = pin.replace('-', '')
+        pin = f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}"
+        if pin in unique_pins:
+            continue
+        amount = _amount_value(number, unit) if number else current_amount
+        line_start = text.rfind('\n', 0, token.start()) + 1
+        line_end = text.find('\n', token.end())
+        context = text[line_start:line_end if line_end != -1 else len(text)].strip()
+        unique_pins[pin] = (amount, context)
+    return [(pin, amount, context) for pin, (amount, context) in unique_pins.items()]
+
+
+def _tokenize_line(line):
+    """한 줄의 토큰 [(헤더, PIN, 바로 뒤에 적힌 금액)] (헤더 토큰은 PIN이 None, PIN 토큰은 헤더가 None)"""
+    tokens = []
+    for token in _TOKEN.finditer(line):
+        header, pin, number, unit = token.groups()
+        if header is not None:
+            tokens.append((header, None, None))
+            continue
+        digits = pin.replace('-', '')
+        pin = f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}"
+        tokens.append((None, pin, _amount_value(number, unit) if number else None))
+    return tokens
+
+
+class _LineBlock:
+    """IncrementalPinParser가 나눈 줄 묶음 하나와 그 해석 결과"""
+    __slots__ = ('lines', 'length', 'entering', 'leaving', 'first', 'visible', 'position')
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.length = sum(map(len, lines)) + len(lines)  # 줄마다 끝의 '\n' 포함
+        self.entering = self.leaving = None  # 들어올 때와 끝날 때의 헤더 금액
+        self.first = {}      # PIN -> 이 묶음에서 처음 나온 행
+        self.visible = []    # 이 묶음이 전체에서 처음인 PIN의 행 (결과에 들어가는 행)
+        self.position = 0    # 묶음 순서
+
+
+class IncrementalPinParser:
+    """같은 텍스트를 고쳐 가며 여러 번 해석할 때 바뀐 부분만 다시 해석하는 parse_pins
+
+    토큰은 줄을 넘지 않으므로 줄 단위로 나눠 해석해도 결과가 parse_pins와 같습니다.
+    - 줄 캐시: 줄 내용 -> 토큰 (앞뒤 헤더와 상관없음)
+    - 줄 묶음: 텍스트를 BLOCK_LINES줄씩 나눈 묶음마다 (들어올 때의 헤더 금액, 결과 행, 끝날 때의 헤더 금액)과
+      묶음 안에서 처음 나온 PIN을 기억합니다 (헤더가 없는 텍스트도 묶음으로 나뉨).
+    다시 해석할 때는 지난 텍스트와 앞뒤로 같은 부분을 비교해 바뀐 곳이 걸친 묶음만 다시 나누고 해석하며,
+    헤더 금액이 달라진 뒷 묶음만 이어서 다시 계산합니다. 같은 PIN이 처음 나온 묶음이 바뀐 PIN만 다시
+    확인하므로, 한 줄을 고치면 그 근처 묶음 몇 개만 다룹니다.
+
+    parse()를 부른 뒤 changes는 지난 결과를 이번 결과로 바꾸는 [(시작 행, 지울 행 수, 넣을 행)]입니다
+    (시작 행 순서대로 차례로 적용, 처음 해석했거나 기본 금액이 바뀌었으면 None).
+    """
+    BLOCK_LINES = 256
+
+    def __init__(self):
+        self._lines = {}
+        self._text = None
+        self._default_amount = None
+        self._blocks = []
+        self._offsets = []   # 묶음 시작 위치 (마지막은 len(text) + 1)
+        self._where = {}     # PIN -> 그 PIN이 있는 묶음 목록
+        self._owner = {}     # PIN -> 그 PIN이 처음 나온 묶음
+        self.changes = None
+
+    def parse(self, text, default_amount):
+        if self._text is None or default_amount != self._default_amount:
+            self._reset(text, default_amount)
+        elif text != self._text:
+            self._update(text)
+        else:
+            self.changes = []
+        if len(self._lines) > 2 * text.count('\n') + 1024:  # 지난 텍스트의 줄이 많이 쌓이면 비움
+            self._lines = {}
+        rows = []
+        for block in self._blocks:
+            rows += block.visible
+        return rows
+
+    def _split(self, text):
+        lines = text.split('\n')
+        size = self.BLOCK_LINES
+        return [_LineBlock(lines[start:start + size]) for start in range(0, len(lines), size)]
+
+    def _reset(self, text, default_amount):
+        self._text = text
+        self._default_amount = default_amount
+        self._blocks = []
+        self._where = {}
+        self._owner = {}
+        self._replace(0, 0, self._split(text), default_amount)
+        self.changes = None
+
+    def _update(self, text):
+        old = self._text
+        self._text = text
+        # 앞뒤로 같은 부분의 길이 (큰 조각부터 비교하므로 거의 C 안에서 끝남)
+        limit = min(len(old), len(text))
+        prefix = _common_length(old, text, limit, False)
+        suffix = _common_length(old, text, limit - prefix, True)
+        offsets = self._offsets
+        first = bisect.bisect_right(offsets, prefix) - 1
+        # 바뀐 부분 바로 뒤 글자가 들어 있는 묶음까지 (그 묶음의 끝은 지난/새 텍스트 모두 줄의 시작)
+        last = bisect.bisect_right(offsets, len(old) - suffix) - 1
+        start = offsets[first]
+        end = offsets[last + 1] + len(text) - len(old)
+        blocks = self._split(text[start:end - 1])
+        old_rows = sum(len(block.visible) for block in self._blocks[first:last + 1])
+        self.changes = self._replace(first, last + 1, blocks, self._blocks[first].entering, old_rows)
+
+    def _replace(self, first, last, blocks, entering, old_rows=0):
+        """self._blocks[first:last]를 blocks로 바꾸고 해석한 뒤, 결과가 달라진 부분을 [(시작 행, 지울 행 수, 넣을 행)]로 반환"""
+        removed = self._blocks[first:last]
+        amount = entering
+        for block in blocks:
+            amount = self._parse_block(block, amount)
+        # 헤더 금액이 달라졌으면 다음 묶음도 다시 해석
+        following = self._blocks[last:]
+        for block in following:
+            if block.entering == amount:
+                break
+            removed.append(block)
+            old_rows += len(block.visible)
+            copy = _LineBlock(block.lines)
+            amount = self._parse_block(copy, amount)
+            blocks.append(copy)
+            last += 1
+        self._blocks[first:last] = blocks
+        offsets = [0]
+        for position, block in enumerate(self._blocks):
+            block.position = position
+            offsets.append(offsets[-1] + block.length)
+        self._offsets = offsets
+
+        # 처음 나온 묶음이 바뀔 수 있는 PIN은 지우거나 넣은 묶음에 있는 PIN뿐
+        where = self._where
+        owner = self._owner
+        pins = set()
+        for block in removed:
+            for pin in block.first:
+                where[pin].remove(block)
+            pins.update(block.first)
+        for block in blocks:
+            for pin in block.first:
+                where.setdefault(pin, []).append(block)
+            pins.update(block.first)
+        changed = set()
+        for pin in pins:
+            holders = where[pin]
+            previous = owner.get(pin)
+            if not holders:
+                del where[pin]
+                del owner[pin]
+                continue
+            current = min(holders, key=attrgetter('position'))
+            if current is not previous:
+                owner[pin] = current
+                if previous is not None:
+                    changed.add(previous)
+                changed.add(current)
+        changed.difference_update(removed)
+        changed.difference_update(blocks)
+
+        # 바꾼 묶음과, 처음 나온 PIN이 생기거나 없어진 다른 묶음만 결과 행을 다시 만듦
+        changes = []
+        for block in blocks:
+            block.visible = [row for pin, row in block.first.items() if owner[pin] is block]
+        replaced_at = blocks[0].position if blocks else first
+        row = 0
+        for block in self._blocks:
+            if block.position == replaced_at:
+                changes.append((row, old_rows, [entry for item in blocks for entry in item.visible]))
+            if block in changed:
+                old_count = len(block.visible)
+                block.visible = [row for pin, row in block.first.items() if owner[pin] is block]
+                changes.append((row, old_count, block.visible))
+            row += len(block.visible)
+        return changes
+
+    def _parse_block(self, block, current_amount):
+        block.entering = current_amount
+        default_amount = self._default_amount
+        first = block.first
+        for line in block.lines:
+            tokens = self._lines.get(line)
+            if tokens is None:
+                tokens = self._lines[line] = _tokenize_line(line)
+            for header, pin, amount in tokens:
+                if header is not None:
+                    current_amount = header_amount(header, default_amount)
+                elif pin not in first:
+                    first[pin] = (pin, current_amount if amount is None else amount, line.strip())
+        block.leaving = current_amount
+        return current_amount
+
+
+def _common_length(a, b, limit, from_end):
+    """a와 b의 앞(from_end면 뒤)에서 같은 글자 수 (limit 이하)"""
+    def same(start, stop):
+        if from_end:
+            return a[len(a) - stop:len(a) - start] == b[len(b) - stop:len(b) - start]
+        return a[start:stop] == b[start:stop]
+
+    length = 0
+    step = 1 << 16
+    while length < limit:
+        size = min(step, limit - length)
+        if same(length, length + size):
+            length += size
+        elif size == 1:
+            break
+        else:
+            step = max(size // 2, 1)  # 다른 글자가 있는 조각을 반씩 좁힘
+    return length
+
+
+def iter_pins(lines, default_amount):
+    """줄을 하나씩 받아 (PIN, 금액, 줄)을 내놓는 parse_pins (같은 PIN도 나올 때마다 내놓음)
+
+    토큰이 줄을 넘지 않으므로 텍스트 전체를 메모리에 올리지 않아도 결과가 parse_pins와 같습니다.
+    """
+    current_amount = default_amount
+    for line in lines:
+        for header, pin, amount in _tokenize_line(line):
+            if header is not None:
+                current_amount = header_amount(header, default_amount)
+            else:
+                yield pin, current_amount if amount is None else amount, line.strip()
+
+
+def detect_encoding(path, sample_size=64 * 1024):
+    """파일 앞부분으로 인코딩을 추정합니다 (UTF-8, BOM이 있는 UTF-8, 아니면 CP949)"""
+    with open(path, 'rb') as file:
+        sample = file.read(sample_size)
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # 마지막 글자가 잘렸을 수 있으므로 final=False로 확인
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+class PinFileReader:
+    """TXT/CSV 파일을 한 줄씩 읽으며 (PIN, 금액, 줄)을 내놓습니다
+
+    파일 전체를 읽지 않으므로 메모리 사용량은 가장 긴 줄 하나 정도이고, 몇 GB짜리 파일도
+    읽을 수 있습니다. position은 지금까지 읽은 바이트 수로, size와 함께 진행률 표시에 씁니다.
+    CSV는 따옴표로 감싼 칸("5,000")을 풀어 쉼표로 이은 줄로 해석합니다.
+    """
+
+    def __init__(self, path, default_amount, encoding=None):
+        self.path = path
+        self.default_amount = default_amount
+        self.encoding = encoding or detect_encoding(path)
+        self.size = os.path.getsize(path)
+        self.position = 0
+        self.is_csv = path.lower().endswith('.csv')
+
+    def _lines(self):
+        with open(self.path, 'rb') as file:
+            for raw in file:
+                self.position += len(raw)
+                line = raw.decode(self.encoding, errors='replace')  # utf-8-sig는 첫 줄의 BOM을 지움
+                if self.is_csv and '"' in line:
+                    line = ','.join(next(csv.reader([line]), []))
+                yield line
+
+    def __iter__(self):
+        self.position = 0
+        return iter_pins(self._lines(), self.default_amount)
+
+
+def _bytes_token(encoding):
+    """_TOKEN과 같은 토큰을 encoding으로 인코딩된 바이트에서 찾는 패턴 (한글 부분만 인코딩이 다름)"""
+    def text(value):
+        return re.escape(value.encode(encoding))
+    return re.compile(rb"""
+        (?P<header>\[""" + text('에그머니') + rb"""[^\]\n]*\]|\(""" + text('에그머니') + rb"""[^)\n]*\))
+      | (?P<pin>\d(?<!\d\d)(?:\d{4}-\d{5}-\d{5}-\d{5}|\d{3}-\d{4}-\d{4}-\d{4}-\d{4}|\d{19}))(?!-?\d)
+        (?:[ \t]*,?[ \t]*(?:(?:""" + text('금액') + rb"""|""" + text('잔액') + rb""")[ \t]*:?[ \t]*)?
+           (?P<amount>\d{1,3}(?:,\d{3})+|\d{1,9})
+           (?P<unit>""" + b'|'.join([text('만원'), text('천원'), text('원')]) + rb""")?(?!-?\d))?
+    """, re.VERBOSE)
+
+
+class MappedPinScanner:
+    """아주 큰 TXT 파일을 메모리에 매핑하고 바이트 패턴으로 바로 훑어 (PIN, 금액, None)을 내놓습니다
+
+    PinFileReader와 같은 순서로 같은 PIN과 금액을 내놓지만, 파일을 문자열로 디코딩하거나
+    줄로 나눠 복사하지 않고 찾은 헤더와 PIN 부분만 꺼냅니다 (세 번째 값인 줄은 없음).
+    매핑한 버퍼를 chunk_size 정도씩 줄바꿈에서 끊어 findall로 훑으므로 position은 묶음 단위로 늘어납니다.
+    UTF-8/CP949처럼 숫자, 괄호, 줄바꿈이 ASCII인 인코딩에서만 씁니다.
+    """
+
+    def __init__(self, path, default_amount, encoding=None, chunk_size=8 * 1024 * 1024):
+        self.path = path
+        self.default_amount = default_amount
+        self.encoding = encoding or detect_encoding(path)
+        self.size = os.path.getsize(path)
+        self.position = 0
+        self.chunk_size = chunk_size
+        pattern_encoding = 'utf-8' if self.encoding == 'utf-8-sig' else self.encoding  # BOM은 파일 맨 앞에만 있음
+        self._token = _bytes_token(pattern_encoding)
+        self._units = {unit.encode(pattern_encoding): value for unit, value in _UNITS.items()}
+
+    def __iter__(self):
+        self.position = 0
+        if not self.size:
+            return iter(())
+        return self._scan()
+
+    def _scan(self):
+        current_amount = self.default_amount
+        units = self._units
+        header_amounts = {}  # 같은 헤더가 반복되므로 금액을 기억해 둠
+        with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            view = memoryview(buffer)
+            try:
+                start = 0
+                while start < self.size:
+                    # 토큰은 줄을 넘지 않으므로 줄바꿈에서 끊으면 결과가 같음
+                    end = buffer.find(b'\n', min(start + self.chunk_size, self.size))
+                    end = self.size if end == -1 else end + 1
+                    tokens = self._token.findall(view[start:end])
+                    self.position = start = end
+                    for header, pin, number, unit in tokens:
+                        if header:
+                            current_amount = header_amounts.get(header)
+                            if current_amount is None:
+                                current_amount = header_amounts[header] = header_amount(
+                                    header.decode(self.encoding, errors='replace'), self.default_amount)
+                            continue
+                        if len(pin) == 23:  # 이미 00000-00000-00000-00000 형식
+                            pin = pin.decode('ascii')
+                        else:
+                            digits = pin.replace(b'-', b'').decode('ascii')
+                            pin = f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}"
+                        amount = int(number.replace(b',', b'')) * units.get(unit, 1) if number else current_amount
+                        yield pin, amount, None
+            finally:
+                view.release()
+
+
+MAPPED_SCAN_SIZE = 64 * 1024 * 1024  # 이보다 큰 TXT 파일은 MappedPinScanner로 읽음
+
+
+def open_pin_file(path, default_amount, encoding=None):
+    """파일에 맞는 PIN 읽기 객체 (size, position, 반복하면 (PIN, 금액, ...))
+
+    큰 TXT 파일은 MappedPinScanner, CSV(따옴표를 풀어야 함)나 작은 파일은 PinFileReader를 씁니다.
+    """
+    reader = PinFileReader(path, default_amount, encoding)
+    if not reader.is_csv and reader.size > MAPPED_SCAN_SIZE and reader.encoding in ('utf-8', 'utf-8-sig', 'cp949'):
+        return MappedPinScanner(path, default_amount, reader.encoding)
+    return reader
+
@@ -0,0 +1,32 @@
+"""처음 사용할 때 불러오는 모듈
+
+자동 입력(pyautogui, pywinauto), 업데이트(requests, zipfile) 모듈은 불러오는 데 오래 걸리지만
+대부분의 실행에서는 지갑을 보거나 고치기만 하므로 쓰이지 않습니다.
+LazyModule은 모듈처럼 쓰다가 속성에 처음 접근할 때 실제 모듈을 불러옵니다.
+"""
+import importlib
+
+
+class LazyModule:
+    """속성에 처음 접근할 때 name 모듈을 불러오는 대리 객체"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            # 여러 스레드에서 동시에 접근해도 import 잠금으로 한 번만 실행됨
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __repr__(self):
+        state = "불러옴" if self._module is not None else "아직 불러오지 않음"
+        return f"<LazyModule {self._name} ({state})>"
@@ -0,0 +1,102 @@
+"""PIN 여러 개를 한 번에 정규화하고 검사하는 일괄 처리 함수
+
+PIN 20자리는 64비트 정수 하나에 들어가지 않으므로(10^20 > 2^64) 앞 10자리와 뒤 10자리를
+정수 두 개로 나눈 (high, low)를 PIN의 정규 키로 씁니다. 키의 크기 순서는 PIN 순서와 같습니다.
+NumPy가 설치되어 있으면 문자열 배열을 고정 폭 문자 코드 행렬로 보고, 행마다 숫자/하이픈이 있는
+열을 비트로 모아 형식별 비트 패턴과 비교해 한꺼번에 검사합니다. 없으면 한 개씩 검사합니다 (결과는 같음).
+"""
+KEY_SPLIT = 10 ** 10
+WIDTH = 25  # 가장 긴 형식(4-4-4-4-4, 24자)보다 한 칸 넓게 잘라 더 긴 문자열을 걸러냄
+
+# (길이, 하이픈 위치): 숫자만 20자리, 00000-00000-00000-00000, 0000-0000-0000-0000-0000
+_FORMATS = [
+    (20, ()),
+    (23, (5, 11, 17)),
+    (24, (4, 9, 14, 19)),
+]
+
+
+def pin_key(pin):
+    """PIN 문자열 하나의 정규 키 (high, low). 지원하는 형식이 아니면 None"""
+    if not pin.isascii():
+        return None
+    for length, hyphens in _FORMATS:
+        if len(pin) == length and all(pin[position] == '-' for position in hyphens):
+            digits = pin.replace('-', '') if hyphens else pin
+            if len(digits) == 20 and digits.isdigit():
+                return int(digits[:10]), int(digits[10:])
+            return None
+    return None
+
+
+def key_to_pin(high, low):
+    """정규 키를 00000-00000-00000-00000 형식으로"""
+    digits = f"{int(high):010d}{int(low):010d}"
+    return f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}"
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def normalize_pins(raw, use_numpy=None):
+    """PIN 문자열 목록(또는 NumPy 문자열 배열)의 (정규 키, 유효 여부)
+
+    NumPy를 쓰면 키는 (n, 2) uint64 배열, 유효 여부는 bool 배열이고,
+    아니면 [(high, low)] 목록과 [bool] 목록입니다. 유효하지 않은 PIN의 키는 (0, 0)입니다.
+    use_numpy=None이면 설치되어 있을 때만 씁니다.
+    """
+    numpy = _numpy() if use_numpy is not False else None
+    if use_numpy and numpy is None:
+        raise ImportError("normalize_pins(use_numpy=True)에는 numpy가 필요합니다.")
+    if numpy is None:
+        keys = [pin_key(pin) for pin in raw]
+        return [key or (0, 0) for key in keys], [key is not None for key in keys]
+    return _normalize_numpy(numpy, raw)
+
+
+def _normalize_numpy(np, raw):
+    if isinstance(raw, np.ndarray) and raw.dtype.kind in 'SU':
+        kind = raw.dtype.kind
+        fixed = np.ascontiguousarray(raw.ravel(), dtype=f'{kind}{WIDTH}')
+    else:
+        raw = list(raw)
+        kind = 'U'
+        fixed = np.array(raw, dtype=f'U{WIDTH}') if raw else np.zeros(0, dtype=f'U{WIDTH}')
+    count = len(fixed)
+    # 한 행이 PIN 하나, 한 열이 글자 하나인 문자 코드 행렬 (짧은 문자열은 0으로 채워짐)
+    codes = fixed.view(np.uint32 if kind == 'U' else np.uint8).reshape(count, WIDTH)
+
+    def row_bits(mask):
+        # 행마다 조건을 만족하는 열을 비트로 모은 32비트 정수 (열 0이 가장 낮은 비트)
+        packed = np.packbits(mask, axis=1, bitorder='little')
+        return np.pad(packed, ((0, 0), (0, 4 - packed.shape[1]))).view('<u4').ravel()
+
+    digit_bits = row_bits((codes - ord('0')) < 10)  # 부호 없는 정수라 '0'보다 작은 코드는 아주 큰 값이 됨
+    hyphen_bits = row_bits(codes == ord('-'))
+    used_bits = row_bits(codes != 0)  # 25자 이상이면 마지막 열도 채워져 어느 형식과도 맞지 않음
+
+    # 형식이 맞는 행에 그 형식의 숫자 열 20개를 모음 (맞는 형식이 없는 행은 0)
+    values = (codes - ord('0')).astype(np.uint8)  # 맞는 행은 모두 숫자/하이픈이라 잘리는 값이 없음
+    valid = np.zeros(count, dtype=bool)
+    digits = np.zeros((count, 20), dtype=np.uint8)
+    for length, hyphens in _FORMATS:
+        columns = [column for column in range(length) if column not in hyphens]
+        match = ((used_bits == (1 << length) - 1) & (hyphen_bits == sum(1 << column for column in hyphens))
+                 & (digit_bits == sum(1 << column for column in columns)))
+        valid |= match
+        # 하이픈 사이의 숫자 묶음을 잘라 붙임 (열 목록으로 고르는 것보다 빠름)
+        bounds = zip((-1,) + hyphens, hyphens + (length,))
+        groups = np.concatenate([values[:, start + 1:end] for start, end in bounds], axis=1)
+        np.copyto(digits, groups, where=match[:, None])
+
+    # 앞/뒤 10자리를 정수로
+    keys = np.zeros((count, 2), dtype=np.uint64)
+    for column in range(10):
+        keys[:, 0] = keys[:, 0] * 10 + digits[:, column]
+        keys[:, 1] = keys[:, 1] * 10 + digits[:, column + 10]
+    return keys, valid
@@ -0,0 +1,212 @@
+"""PIN 숫자 조각과 잔액 범위로 PIN을 빠르게 찾는 검색 색인
+
+색인을 만들 때 두 자리 숫자('00'~'99') 100개마다 그 숫자가 들어 있는 PIN 목록을 만들어 두므로, 첫 검색도
+전체 PIN을 훑지 않고 가장 짧은 목록만 확인합니다. 숫자 조각별 결과도 캐시합니다. 검색창에 한 글자씩
+입력하면 '12' -> '123' -> '1234'처럼 직전 조각이 다음 조각의 일부이므로 직전 결과만 확인해 입력할수록
+빨라집니다 (트라이처럼 좁혀 감).
+잔액은 잔액별 PIN 집합으로 거릅니다. PIN이 추가/삭제되면 캐시된 결과도 함께 갱신됩니다.
+"""
+import re
+from collections import OrderedDict
+
+from .store import BALANCE_CHANGED, PIN_INSERTED, PIN_REMOVED, PINS_LOADED, WALLET_RESET
+
+MIN_FRAGMENT = 2      # 한 자리 숫자는 거의 모든 PIN에 있으므로 거르지 않음 (두 자리 색인의 크기이기도 함)
+CACHE_SIZE = 64       # 결과를 기억해 두는 숫자 조각 수
+
+_RANGE = re.compile(r"^(>=|<=|>|<|=)?([\d,]+)원?$|^([\d,]*)원?~([\d,]*)원?$")
+
+
+class PinQuery:
+    """검색어를 해석한 결과: 모든 PIN 숫자 조각을 포함하고 모든 잔액 범위를 만족하는 PIN
+
+    검색어는 공백으로 나눕니다. 숫자(하이픈 허용)는 PIN 조각, '5000~10000', '~5000',
+    '>=50000', '<1000', '=5000' 같은 형식은 잔액 범위입니다.
+    """
+
+    def __init__(self, text):
+        self.fragments = []
+        self.ranges = []   # [(최소, 최대)] 양 끝 포함, None이면 제한 없음
+        for token in text.split():
+            match = _RANGE.match(token)
+            if match and (match.group(1) or match.group(3) is not None):
+                self.ranges.append(self._parse_range(match))
+                continue
+            digits = re.sub(r"\D", "", token)
+            if len(digits) >= MIN_FRAGMENT:
+                self.fragments.append(digits)
+
+    @staticmethod
+    def _parse_range(match):
+        def number(text):
+            text = text.replace(",", "")
+            return int(text) if text else None
+        operator = match.group(1)
+        if operator is None:
+            return (number(match.group(3)), number(match.group(4)))
+        value = number(match.group(2))
+        if operator == ">=":
+            return (value, None)
+        if operator == ">":
+            return (value + 1, None)
+        if operator == "<=":
+            return (None, value)
+        if operator == "<":
+            return (None, value - 1)
+        return (value, value)
+
+    def __bool__(self):
+        return bool(self.fragments or self.ranges)
+
+    def balance_matches(self, balance):
+        for low, high in self.ranges:
+            if (low is not None and balance < low) or (high is not None and balance > high):
+                return False
+        return True
+
+    def matches(self, pin, balance):
+        """PIN 하나가 검색어에 맞는지 확인합니다 (지갑이 바뀐 행을 다시 거를 때 사용)"""
+        digits = pin.replace("-", "")
+        return all(fragment in digits for fragment in self.fragments) and self.balance_matches(balance)
+
+
+class PinSearchIndex:
+    """PinStore에 연결되어 PIN이 추가/삭제/변경될 때마다 함께 갱신되는 검색 색인"""
+
+    def __init__(self, store, cache_size=CACHE_SIZE):
+        self.store = store
+        self.cache_size = cache_size
+        self.rebuild()
+        store.add_listener(self.on_wallet_changed)
+
+    def close(self):
+        self.store.remove_listener(self.on_wallet_changed)
+
+    def rebuild(self):
+        pins = list(self.store.pins)
+        self._pins = pins          # PIN 번호 -> PIN (삭제된 PIN은 None)
+        self._digits = [pin.replace("-", "") for pin in pins]  # PIN 번호 -> 숫자만
+        self._ids = dict(zip(pins, range(len(pins))))         # PIN -> PIN 번호
+        self._removed = 0
+        # 두 자리 숫자 -> 그 숫자가 들어 있는 PIN 번호 목록 (번호 순, 삭제된 번호는 검색할 때 건너뜀)
+        self._grams = {f"{number:02d}": [] for number in range(100)}
+        for number, digits in enumerate(self._digits):
+            self._index_grams(number, digits)
+        self._cache = OrderedDict()  # 숫자 조각 -> 그 조각이 들어 있는 PIN 번호 목록 (최근 사용 순)
+        self._by_balance = {}      # 잔액 -> PIN 집합
+        for pin, balance in self.store.pins.items():
+            group = self._by_balance.get(balance)
+            if group is None:
+                self._by_balance[balance] = group = set()
+            group.add(pin)
+
+    def _index_grams(self, number, digits):
+        grams = self._grams
+        for gram in {digits[i:i + MIN_FRAGMENT] for i in range(len(digits) - MIN_FRAGMENT + 1)}:
+            grams[gram].append(number)
+
+    def on_wallet_changed(self, event, pin, value):
+        if event == PIN_INSERTED:
+            self._add(pin, value)
+        elif event == PIN_REMOVED:
+            self._remove(pin, value)
+        elif event == BALANCE_CHANGED:
+            for balance, pins in self._by_balance.items():
+                if pin in pins:
+                    pins.discard(pin)
+                    if not pins:
+                        del self._by_balance[balance]
+                    break
+            self._by_balance.setdefault(value, set()).add(pin)
+        elif event == PINS_LOADED:
+            balances = self.store.pins
+            for pin in value:
+                self._add(pin, balances[pin])
+        elif event == WALLET_RESET:
+            self.rebuild()
+
+    def _add(self, pin, balance):
+        number = len(self._pins)
+        digits = pin.replace("-", "")
+        self._ids[pin] = number
+        self._pins.append(pin)
+        self._digits.append(digits)
+        self._index_grams(number, digits)
+        self._by_balance.setdefault(balance, set()).add(pin)
+        # 새 PIN은 번호가 가장 크므로 캐시된 결과 끝에 붙이면 순서가 유지됨
+        for fragment, ids in self._cache.items():
+            if fragment in digits:
+                ids.append(number)
+
+    def _remove(self, pin, balance):
+        # 번호는 비워 두기만 하고 (결과를 돌려줄 때 건너뜀), 많이 쌓이면 다시 만듦
+        number = self._ids.pop(pin)
+        self._pins[number] = None
+        self._digits[number] = ""
+        self._removed += 1
+        pins = self._by_balance.get(balance)
+        if pins is not None:
+            pins.discard(pin)
+            if not pins:
+                del self._by_balance[balance]
+        if self._removed > 1000 and self._removed * 2 > len(self._pins):
+            self.rebuild()
+
+    def _matching(self, fragment):
+        """fragment가 들어 있는 PIN 번호 목록
+
+        이미 찾아 둔 조각 중 fragment의 일부인 것이 있으면 (한 글자씩 입력하면 직전 검색어가 항상 그렇습니다)
+        그 결과만 확인하고, 없으면 fragment의 두 자리 숫자 중 PIN이 가장 적은 두 자리 색인 목록을 확인합니다.
+        """
+        cache = self._cache
+        ids = cache.get(fragment)
+        if ids is not None:
+            cache.move_to_end(fragment)
+            return ids
+        base = None
+        for size in range(len(fragment) - 1, MIN_FRAGMENT - 1, -1):
+            for i in range(len(fragment) - size + 1):
+                candidates = cache.get(fragment[i:i + size])
+                if candidates is not None and (base is None or len(candidates) < len(base)):
+                    base = candidates
+        if base is None:
+            grams = self._grams
+            base = min((grams[fragment[i:i + MIN_FRAGMENT]] for i in range(len(fragment) - MIN_FRAGMENT + 1)),
+                       key=len)
+        digits = self._digits
+        ids = [number for number in base if fragment in digits[number]]
+        cache[fragment] = ids
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return ids
+
+    def search(self, query):
+        """검색어에 맞는 PIN 집합을 반환합니다. 거를 조건이 없으면 None을 반환합니다"""
+        if not isinstance(query, PinQuery):
+            query = PinQuery(query)
+        if not query:
+            return None
+
+        result = None
+        for fragment in sorted(query.fragments, key=len, reverse=True):
+            ids = self._matching(fragment)
+            if result is None:
+                result = ids
+            else:
+                # 번호 순서를 유지해야 PIN을 차례로 읽으므로 목록으로 거름
+                wanted = set(ids)
+                result = [number for number in result if number in wanted]
+            if not result:
+                return set()
+        if result is not None:
+            pins = self._pins
+            result = {pins[number] for number in result}
+            result.discard(None)
+
+        if query.ranges:
+            groups = [pins for balance, pins in self._by_balance.items() if query.balance_matches(balance)]
+            if result is None:
+                result = set().union(*groups)
+            else:
+                result = set().union(*(result & pins for pins in groups))
+        return result
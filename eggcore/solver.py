@@ -0,0 +1,117 @@
+from bisect import bisect_left
+from math import gcd
+
+MAX_PINS = 5  # 한 번에 입력할 수 있는 최대 PIN 개수
+
+
+def find_pins_for_amount(sorted_pins, amount, max_pins=MAX_PINS):
+    """잔액 오름차순으로 정렬된 (PIN, 잔액) 목록에서 금액에 맞는 PIN 조합을 찾습니다.
+
+    작은 잔액부터 차례로 골라 max_pins 개 이하로 충분하면 그대로 사용하고,
+    아니면 max_pins 개 이하 조합 중 합계가 금액 이상이면서 가장 작은 조합을 찾습니다.
+    """
+    selected_pins = []
+    total_selected = 0
+    for pin, balance in sorted_pins:
+        if total_selected >= amount:
+            break
+        selected_pins.append((pin, balance))
+        total_selected += balance
+
+    if total_selected >= amount and len(selected_pins) <= max_pins:
+        return selected_pins
+    if total_selected < amount:
+        return []
+
+    return _best_combination(sorted_pins, amount, max_pins)
+
+
+def compress_candidates(sorted_pins, max_pins=MAX_PINS):
+    """같은 잔액의 PIN은 max_pins 개까지만 남긴 후보 목록을 반환합니다.
+
+    find_pins_for_amount 결과는 원래 목록을 넣었을 때와 같으므로, 지갑이 바뀔 때만
+    한 번 만들어 두고 여러 번 계산할 때 사용합니다.
+    """
+    counts = {}
+    compressed = []
+    for pin, balance in sorted_pins:
+        count = counts.get(balance, 0)
+        if count < max_pins:
+            counts[balance] = count + 1
+            compressed.append((pin, balance))
+    return compressed
+
+
+def _best_combination(sorted_pins, amount, max_pins):
+    # 같은 잔액의 PIN은 서로 바꿔 써도 결과가 같으므로 잔액별로 max_pins 개까지만 후보로 남김
+    candidates = []
+    by_balance = {}
+    for pin, balance in sorted_pins:
+        group = by_balance.setdefault(balance, [])
+        if len(group) < max_pins:
+            if not group:
+                candidates.append(balance)
+            group.append(pin)
+    values = []
+    for balance in candidates:
+        values.extend([balance] * len(by_balance[balance]))
+    values.sort(reverse=True)
+    ascending = values[::-1]  # 마지막 PIN을 이진 탐색으로 고르기 위한 오름차순 목록
+    smallest = ascending[0]
+    # 잔액들의 최대공약수 단위로만 합계가 만들어지므로 이 값에 도달하면 더 찾을 필요가 없음
+    unit = 0
+    for balance in candidates:
+        if not isinstance(balance, int):
+            unit = 0  # 소수 잔액(CLI 입력)은 단위를 알 수 없으므로 끝까지 탐색
+            break
+        unit = gcd(unit, balance)
+    target = -(-amount // unit) * unit if unit else amount
+
+    best = [None, None]  # [합계, 선택한 인덱스]
+    picked = []
+
+    def search(start, total, remaining):
+        need = amount - total
+        if remaining == 1:
+            # 필요한 금액 이상인 가장 작은 잔액 하나만 보면 됨
+            position = bisect_left(ascending, need, 0, len(values) - start)
+            if position < len(values) - start:
+                value = ascending[position]
+                if best[0] is None or total + value < best[0]:
+                    best[0] = total + value
+                    best[1] = picked + [len(values) - 1 - position]
+            return
+        previous = None
+        for index in range(start, len(values) - remaining + 1):
+            value = values[index]
+            if value == previous:
+                continue  # 같은 잔액으로 같은 조합을 반복 탐색하지 않음
+            previous = value
+            # 남은 자리를 지금 잔액으로 모두 채워도 부족하면 이후(더 작은 잔액)도 불가능
+            if value * remaining < need:
+                break
+            # 이 잔액을 고른 뒤 어떻게 채워도 지금까지의 최선보다 나아질 수 없음
+            if best[0] is not None and total + value + smallest * (remaining - 1) >= best[0]:
+                continue
+            picked.append(index)
+            search(index + 1, total + value, remaining - 1)
+            picked.pop()
+            if best[0] == target:
+                return
+
+    # 원래 방식처럼 적은 개수의 조합부터 찾아 합계가 같으면 PIN 개수가 적은 쪽을 사용
+    for count in range(1, min(max_pins, len(values)) + 1):
+        search(0, 0, count)
+        if best[0] == target:
+            break
+    if best[1] is None:
+        return []
+
+    used = {}
+    for index in best[1]:
+        used[values[index]] = used.get(values[index], 0) + 1
+    combination = []
+    for balance in sorted(used):
+        for pin in by_balance[balance][:used[balance]]:
+            combination.append((pin, balance))
+    return combination
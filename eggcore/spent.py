@@ -0,0 +1,143 @@
+"""모두 사용해 지갑에서 지운 PIN을 기억하는 추가 전용 보관소 (resource/spent_pins.bin)
+
+사용 로그는 덮어쓰일 수 있으므로, 잔액이 0이 되어 지운 PIN의 64비트 키만 파일 끝에 8바이트씩 덧붙여
+둡니다. 메모리에는 정렬된 키 배열(이분 탐색)과 그 앞의 블룸 필터를 두어, 수십만 개가 쌓여도 PIN 하나를
+확인하는 데 블룸 필터 비트 몇 개만 보면 됩니다 (대부분인 새 PIN은 여기서 바로 걸러짐).
+"""
+import bisect
+import os
+import sys
+from array import array
+
+from .filelock import FileLock
+from .normalize import KEY_SPLIT, pin_key
+
+KEY_MASK = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15  # 블룸 필터 위치를 고르게 흩기 위한 곱셈 상수 (황금비)
+
+
+def spent_key(pin):
+    """PIN의 64비트 키 (20자리 숫자의 아래 64비트). 올바른 PIN이 아니면 None
+
+    20자리는 64비트에 다 들어가지 않으므로 2^64 차이 나는 PIN끼리 키가 같지만, PIN 하나와 키가 같은
+    다른 PIN은 최대 5개뿐이라 실제로 겹칠 가능성은 무시할 수 있습니다.
+    """
+    key = pin_key(pin)
+    if key is None:
+        return None
+    return (key[0] * KEY_SPLIT + key[1]) & KEY_MASK
+
+
+class SpentPinArchive:
+    """사용한 PIN 보관소. `pin in archive`로 확인하고 add()로 추가합니다
+
+    다른 프로세스가 덧붙인 키는 refresh()를 호출하면 읽어 옵니다 (읽은 위치부터 끝까지만).
+    """
+    PROBES = 7         # 키 하나가 켜는 블룸 필터 비트 수
+    BITS_PER_KEY = 10  # 키 하나당 블룸 필터 비트 수 (오탐률 약 1%)
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.file_lock = FileLock(filename + ".lock")
+        self._keys = array('Q')  # 정렬된 키
+        self._recent = set()     # 마지막으로 정렬한 뒤 추가된 키
+        self._offset = 0         # 파일에서 읽은 바이트 수
+        self._bits = bytearray()
+        self._mask = 0
+        self._capacity = 0       # 블룸 필터를 다시 만들지 않고 넣을 수 있는 키 수
+        self.refresh()
+
+    def __len__(self):
+        return len(self._keys) + len(self._recent)
+
+    def __contains__(self, pin):
+        key = spent_key(pin)
+        return key is not None and self._has(key)
+
+    def _has(self, key):
+        if not self._maybe(key):
+            return False
+        if key in self._recent:
+            return True
+        index = bisect.bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def _positions(self, key):
+        mixed = (key * _MIX) & KEY_MASK
+        first, step = mixed & 0xFFFFFFFF, (mixed >> 32) | 1
+        mask = self._mask
+        return [(first + probe * step) & mask for probe in range(self.PROBES)]
+
+    def _maybe(self, key):
+        bits = self._bits
+        if not bits:
+            return False
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def _set_bits(self, keys):
+        bits = self._bits
+        for key in keys:
+            for position in self._positions(key):
+                bits[position >> 3] |= 1 << (position & 7)
+
+    def _rebuild(self):
+        # 모든 키를 정렬된 배열로 합치고 블룸 필터를 키 수에 맞게 다시 만듦
+        self._keys = array('Q', sorted(set(self._keys).union(self._recent)))
+        self._recent = set()
+        self._capacity = max(1024, len(self._keys) * 2)
+        size = 1 << (self._capacity * self.BITS_PER_KEY - 1).bit_length()
+        self._bits = bytearray(size // 8)
+        self._mask = size - 1
+        self._set_bits(self._keys)
+
+    def _merge(self, keys):
+        new_keys = [key for key in keys if key not in self._recent]
+        self._recent.update(new_keys)
+        if len(self) > self._capacity or len(self._recent) > max(1024, len(self._keys) // 8):
+            self._rebuild()
+        else:
+            self._set_bits(new_keys)
+
+    def refresh(self):
+        """다른 프로세스가 파일 끝에 덧붙인 키를 읽어 옵니다"""
+        try:
+            size = os.path.getsize(self.filename)
+        except OSError:
+            return
+        size -= size % 8  # 덧붙이는 중인 마지막 키는 다음에 읽음
+        if size <= self._offset:
+            return
+        with open(self.filename, 'rb') as file:
+            file.seek(self._offset)
+            data = file.read(size - self._offset)
+        data = data[:len(data) - len(data) % 8]
+        self._offset += len(data)
+        keys = array('Q')
+        keys.frombytes(data)
+        if sys.byteorder != 'little':
+            keys.byteswap()
+        self._merge(keys)
+
+    def add(self, pins):
+        """pins를 보관소에 추가하고 새로 추가한 PIN 수를 반환합니다 (이미 있거나 올바르지 않은 PIN은 건너뜀)"""
+        with self.file_lock:
+            self.refresh()
+            keys = dict.fromkeys(spent_key(pin) for pin in pins)
+            new_keys = [key for key in keys if key is not None and not self._has(key)]
+            if not new_keys:
+                return 0
+            keys = array('Q', new_keys)
+            if sys.byteorder != 'little':
+                keys.byteswap()
+            os.makedirs(os.path.dirname(self.filename) or '.', exist_ok=True)
+            with open(self.filename, 'ab') as file:
+                end = file.seek(0, os.SEEK_END)
+                if end % 8:
+                    file.truncate(end - end % 8)  # 덧붙이다 멈춘 키 조각은 버림
+                file.write(keys.tobytes())
+            self._offset += len(new_keys) * 8
+            self._merge(new_keys)
+            return len(new_keys)
@@ -0,0 +1,84 @@
+"""PIN 사용 통계 파일 (resource/pin_stats.json)
+
+연 → 월 → 상품 구조에 연/월/일 합계를 함께 저장해, 통계를 볼 때 상품 목록을 모두 훑지 않아도 됩니다.
+"""
+import json
+import os
+from datetime import datetime
+
+from .fileio import file_stamp
+
+
+def empty_stats():
+    return {
+        'total_amount': 0,
+        'years': {}
+    }
+
+
+def aggregate_days(products):
+    """일별 합계가 없는 예전 통계 파일용: 한 달의 상품 목록으로 일별 합계를 만듭니다"""
+    days = {}
+    for product in products:
+        day_stats = days.setdefault(str(product['date']), {'amount': 0, 'count': 0})
+        day_stats['amount'] += product['amount']
+        day_stats['count'] += 1
+    return days
+
+
+class StatsLog:
+    """통계 파일을 읽고 쓰며, 파일이 그대로면 다시 읽지 않습니다"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._cache = (None, None)  # (파일 스탬프, 통계)
+
+    def load(self):
+        """통계를 불러옵니다. 파일이 없거나 읽을 수 없으면 빈 통계를 반환합니다."""
+        stamp = file_stamp(self.filename)
+        if stamp is not None and stamp == self._cache[0]:
+            return self._cache[1]
+        try:
+            with open(self.filename, "r", encoding='utf-8') as file:
+                stats_data = json.load(file)
+            self._cache = (stamp, stats_data)
+            return stats_data
+        except (FileNotFoundError, json.JSONDecodeError):
+            return empty_stats()
+
+    def save(self, stats_data):
+        os.makedirs(os.path.dirname(self.filename) or '.', exist_ok=True)
+        with open(self.filename, "w", encoding='utf-8') as file:
+            json.dump(stats_data, file, indent=4, ensure_ascii=False)
+        self._cache = (file_stamp(self.filename), stats_data)
+
+    def add_entry(self, date_str, product_name, amount):
+        """date_str('%Y-%m-%d')에 product_name을 amount원에 산 기록을 추가하고 저장합니다"""
+        stats_data = self.load()
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        year, month, day = str(date_obj.year), str(date_obj.month), date_obj.day
+
+        stats_data['total_amount'] += amount
+
+        # 연도별 통계
+        year_stats = stats_data['years'].setdefault(year, {'year_amount': 0, 'months': {}})
+        year_stats['year_amount'] += amount
+
+        # 월별 통계
+        month_stats = year_stats['months'].setdefault(month, {'month_amount': 0, 'products': []})
+        month_stats['month_amount'] += amount
+
+        # 일별 합계 (통계 창에서 상품 목록을 훑지 않고 바로 표시)
+        if 'days' not in month_stats:
+            month_stats['days'] = aggregate_days(month_stats.get('products', []))
+        day_stats = month_stats['days'].setdefault(str(day), {'amount': 0, 'count': 0})
+        day_stats['amount'] += amount
+        day_stats['count'] += 1
+
+        # 상품별 통계
+        month_stats['products'].append({
+            'name': product_name,
+            'amount': amount,
+            'date': day,
+        })
+        self.save(stats_data)
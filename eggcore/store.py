@@ -0,0 +1,459 @@
+import json
+import os
+
+from .aggregates import _MISSING, LockedSet, PinDict, WalletTotals
+from .filelock import FileLock
+from .fileio import file_stamp, write_json_atomic
+from .sync import SyncJournal
+
+
+class PinDelta:
+    """디스크와 메모리 지갑 사이에서 달라진 PIN 정보"""
+
+    def __init__(self):
+        self.changed = {}      # 새로 추가되었거나 잔액이 바뀐 PIN -> 잔액
+        self.removed = []      # 삭제된 PIN
+        self.locked = []       # 새로 잠긴 PIN
+        self.unlocked = []     # 잠금 해제된 PIN
+
+    def __bool__(self):
+        return bool(self.changed or self.removed or self.locked or self.unlocked)
+
+
+# add_listener()로 등록한 함수가 받는 변경 종류: callback(event, pin, value)
+PIN_INSERTED = "inserted"      # value: 잔액
+PIN_REMOVED = "removed"        # value: 삭제 전 잔액
+BALANCE_CHANGED = "balance"    # value: 새 잔액
+LOCK_CHANGED = "lock"          # value: 잠김 여부 (지갑에 있는 PIN만 알림)
+WALLET_RESET = "reset"         # 지갑 전체를 다시 불러옴 (pin, value는 None)
+PINS_LOADED = "loaded"         # 불러오거나 가져올 때 PIN 여러 개가 한 번에 추가됨 (pin은 None, value: 추가된 PIN 목록)
+
+
+def diff_pins(old, new):
+    """두 PIN 딕셔너리를 비교하여 (변경된 PIN 딕셔너리, 삭제된 PIN 목록)을 반환합니다."""
+    changed = {pin: balance for pin, balance in new.items() if old.get(pin) != balance}
+    removed = [pin for pin in old if pin not in new]
+    return changed, removed
+
+
+def summary_stamp(filename, locked_pins_file=None):
+    """요약 파일이 가리키는 지갑 파일 상태 (JSON으로 저장했다 읽어도 같은 값)"""
+    stamps = [file_stamp(filename), file_stamp(locked_pins_file) if locked_pins_file else None]
+    return [list(stamp) if stamp else None for stamp in stamps]
+
+
+class PinStore:
+    """pins.json / locked_pins.json 을 여러 프로세스가 안전하게 공유하도록 관리하는 저장소
+
+    저장할 때는 잠금을 잡고 디스크의 최신 내용에 이 프로세스의 변경분만 덮어써서
+    다른 창이나 CLI가 저장한 PIN을 잃어버리지 않습니다.
+    """
+
+    def __init__(self, filename, locked_pins_file=None, journal_file=None, summary_file=None, load=True):
+        self.filename = filename
+        self.locked_pins_file = locked_pins_file
+        self.summary_file = summary_file  # 지갑을 열지 않고 합계만 볼 때 쓰는 요약 파일
+        self.file_lock = FileLock(filename + ".lock")
+        self.journal = SyncJournal(journal_file) if journal_file else None  # PC 간 동기화 기록
+        self._synced_pins = {}       # 마지막으로 디스크와 맞춘 PIN 상태
+        self._synced_stamp = None    # 마지막으로 읽거나 쓴 pins 파일의 (수정 시각, 크기)
+        self._synced_locked = set()  # 마지막으로 디스크와 맞춘 잠금 상태
+        self.aggregates = WalletTotals()  # PIN이 바뀔 때마다 갱신되는 합계
+        self._listeners = []
+        self._pins = PinDict(self)
+        self._locked_pins = LockedSet(self)
+        if load:
+            # load=False면 빈 지갑으로 만들고, read_snapshot()/load_snapshot()으로 나중에 불러옴
+            self.pins = self.load_pins()
+            if locked_pins_file:
+                self.load_locked_pins()
+
+    @property
+    def pins(self):
+        return self._pins
+
+    @pins.setter
+    def pins(self, pins):
+        # 새 딕셔너리를 대입해도 같은 컨테이너의 내용만 바꾸고 합계를 한 번에 다시 계산
+        if pins is self._pins:
+            return
+        pins = dict(pins)
+        dict.clear(self._pins)
+        dict.update(self._pins, pins)
+        self._recount()
+        self._notify(WALLET_RESET, None, None)
+
+    @property
+    def locked_pins(self):
+        return self._locked_pins
+
+    @locked_pins.setter
+    def locked_pins(self, locked_pins):
+        if locked_pins is self._locked_pins:
+            return
+        locked_pins = set(locked_pins)
+        set.clear(self._locked_pins)
+        set.update(self._locked_pins, locked_pins)
+        self._recount()
+        self._notify(WALLET_RESET, None, None)
+
+    def add_listener(self, callback):
+        """PIN이 추가/삭제되거나 잔액·잠금이 바뀔 때마다 callback(event, pin, value)를 호출합니다."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, pin, value):
+        for callback in self._listeners:
+            callback(event, pin, value)
+
+    def _recount(self):
+        self.aggregates = WalletTotals()
+        for pin, balance in self._pins.items():
+            self.aggregates.add(balance, pin in self._locked_pins)
+
+    def _pin_changed(self, pin, old, new):
+        locked = pin in self._locked_pins
+        if old is not _MISSING:
+            self.aggregates.remove(old, locked)
+        if new is not _MISSING:
+            self.aggregates.add(new, locked)
+        if not self._listeners:
+            return
+        if old is _MISSING:
+            self._notify(PIN_INSERTED, pin, new)
+        elif new is _MISSING:
+            self._notify(PIN_REMOVED, pin, old)
+        elif old != new:
+            self._notify(BALANCE_CHANGED, pin, new)
+
+    def _lock_changed(self, pin, locked):
+        balance = self._pins.get(pin)
+        if balance is not None:
+            self.aggregates.locked += balance if locked else -balance
+            self._notify(LOCK_CHANGED, pin, locked)
+
+    def _file_stamp(self):
+        return file_stamp(self.filename)
+
+    def _read_pins(self, strict=False):
+        try:
+            with open(self.filename, "r") as file:
+                pins = json.load(file)
+            self._synced_stamp = self._file_stamp()
+            return pins
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            if strict:
+                raise
+            return {}
+
+    def _read_locked_pins(self, strict=False):
+        if not self.locked_pins_file:
+            return set()
+        try:
+            with open(self.locked_pins_file, "r") as file:
+                return set(json.load(file))
+        except FileNotFoundError:
+            return set()
+        except json.JSONDecodeError:
+            if strict:
+                raise
+            return set()
+
+    def load_pins(self):
+        """PIN 목록을 파일에서 불러옵니다."""
+        with self.file_lock:
+            pins = self._read_pins()
+        self._synced_pins = dict(pins)
+        return pins
+
+    def read_snapshot(self):
+        """지갑 파일을 읽어 (PIN 딕셔너리, 잠긴 PIN 집합, 파일 스탬프)를 반환합니다.
+
+        지갑 상태는 바꾸지 않으므로 작업 스레드에서 읽고, 반영은 load_snapshot()으로 합니다.
+        """
+        with self.file_lock:
+            stamp = self._file_stamp()
+            try:
+                with open(self.filename, "r") as file:
+                    pins = json.load(file)
+            except FileNotFoundError:
+                pins = {}
+            except json.JSONDecodeError:
+                pins, stamp = {}, None
+            locked_pins = self._read_locked_pins()
+        return pins, locked_pins, stamp
+
+    def load_snapshot(self, pins, locked_pins, stamp, chunk_size=5000):
+        """read_snapshot()의 결과를 빈 지갑에 chunk_size개씩 추가하는 제너레이터
+
+        한 묶음을 추가할 때마다 PINS_LOADED로 알리고 지금까지 추가한 PIN 수를 내놓습니다.
+        잠금 목록을 먼저 반영하므로 추가되는 PIN의 합계와 잠금 표시는 처음부터 맞습니다.
+        디스크와 맞춘 상태는 모두 추가한 뒤에 기록하므로, 도중에 저장해도 PIN을 잃지 않습니다.
+        """
+        self.locked_pins = locked_pins
+        self._synced_locked = set(locked_pins)
+        items = list(pins.items())
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            dict.update(self._pins, chunk)
+            for pin, balance in chunk:
+                self.aggregates.add(balance, pin in self._locked_pins)
+            self._notify(PINS_LOADED, None, [pin for pin, _ in chunk])
+            yield start + len(chunk)
+        self._synced_pins = dict(pins)
+        self._synced_stamp = stamp
+
+    def add_pins(self, items):
+        """(PIN, 잔액) 중 지갑에 없는 PIN만 한 번에 추가하고 추가한 PIN 목록을 반환합니다 (PINS_LOADED로 알림)"""
+        added = {}
+        for pin, balance in items:
+            if pin not in self._pins and pin not in added:
+                added[pin] = balance
+        if added:
+            dict.update(self._pins, added)
+            for pin, balance in added.items():
+                self.aggregates.add(balance, pin in self._locked_pins)
+            self._notify(PINS_LOADED, None, list(added))
+        return list(added)
+
+    def import_pins(self, entries, batch_size=5000, is_spent=None):
+        """entries의 (PIN, 잔액, ...)를 batch_size개씩 추가하고 저장하는 제너레이터
+
+        묶음 하나를 저장할 때마다 (추가한 PIN 수, 이미 있던 PIN 수, 이미 사용한 PIN 수) 누계를 내놓습니다.
+        is_spent(pin)이 참인 PIN(이미 모두 사용한 PIN)은 추가하지 않습니다.
+        도중에 멈춰도(close) 그때까지 저장한 묶음은 지갑에 남습니다.
+        """
+        added = duplicated = spent = 0
+        batch = []
+        for entry in entries:
+            if is_spent is not None and entry[0] not in self._pins and is_spent(entry[0]):
+                spent += 1
+                continue
+            batch.append(entry[:2])
+            if len(batch) >= batch_size:
+                new_pins = self.add_pins(batch)
+                self.save_pins()
+                added += len(new_pins)
+                duplicated += len(batch) - len(new_pins)
+                batch = []
+                yield added, duplicated, spent
+        if batch:
+            new_pins = self.add_pins(batch)
+            if new_pins:
+                self.save_pins()
+            added += len(new_pins)
+            duplicated += len(batch) - len(new_pins)
+        yield added, duplicated, spent
+
+    def save_pins(self):
+        """이 프로세스의 변경분을 디스크의 최신 PIN 목록에 병합하여 저장합니다.
+
+        다른 프로세스의 변경과 병합했으면 True를 반환합니다.
+        """
+        with self.file_lock:
+            stamp = self._file_stamp()
+            if stamp is not None and stamp == self._synced_stamp:
+                # 마지막으로 읽거나 쓴 뒤 파일이 그대로이면 다시 읽을 필요가 없음
+                disk_pins = self._synced_pins
+            else:
+                disk_pins = self._read_pins()
+            external = disk_pins != self._synced_pins
+            if not external:
+                # 다른 프로세스의 변경이 없으면 메모리 상태(순서 포함)를 그대로 저장
+                merged = self.pins
+            else:
+                merged = disk_pins
+            if external or self.journal is not None:
+                changed, removed = diff_pins(self._synced_pins, self.pins)
+            if external:
+                for pin in removed:
+                    merged.pop(pin, None)
+                merged.update(changed)
+            write_json_atomic(self.filename, merged, indent=4)
+            self._synced_stamp = self._file_stamp() if not external else None
+            if self.journal is not None and (changed or removed):
+                # 바뀐 PIN이 없으면 동기화 기록은 그대로 둠
+                self._record_local(changed, removed)
+            if not external:
+                self._write_summary()
+            # 병합으로 들어온 다른 프로세스의 변경은 reload_external()로 메모리에 반영될 때까지
+            # 이 프로세스가 모르는 상태로 두어, 다음 저장에서 삭제로 오인하지 않도록 함
+            self._synced_pins = dict(self.pins)
+        return external
+
+    def load_locked_pins(self):
+        """잠긴 핀 목록을 파일에서 로드합니다"""
+        with self.file_lock:
+            self.locked_pins = self._read_locked_pins()
+        self._synced_locked = set(self.locked_pins)
+
+    def save_locked_pins(self):
+        """잠긴 핀 목록의 변경분을 디스크의 최신 잠금 목록에 병합하여 저장합니다"""
+        if not self.locked_pins_file:
+            return
+        with self.file_lock:
+            disk_locked = self._read_locked_pins()
+            unlocked = self._synced_locked - self.locked_pins
+            locked = self.locked_pins - self._synced_locked
+            merged = (disk_locked - unlocked) | locked
+            write_json_atomic(self.locked_pins_file, sorted(merged), indent=4)
+            if self.journal is not None and (locked or unlocked):
+                self._record_local(locked=locked, unlocked=unlocked)
+            self._synced_locked = set(self.locked_pins)
+            if merged == self.locked_pins and self.pins == self._synced_pins and self._synced_stamp == self._file_stamp():
+                self._write_summary()
+
+    def reload_external(self):
+        """다른 프로세스가 저장한 변경분만 메모리 지갑에 반영하고 PinDelta로 반환합니다.
+
+        파일이 쓰는 중이거나 손상되어 읽을 수 없으면 json.JSONDecodeError를 그대로 발생시킵니다.
+        """
+        with self.file_lock:
+            disk_pins = self._read_pins(strict=True)
+            disk_locked = self._read_locked_pins(strict=True)
+
+        delta = PinDelta()
+        delta.changed, delta.removed = diff_pins(self.pins, disk_pins)
+        for pin in delta.removed:
+            del self.pins[pin]
+        self.pins.update(delta.changed)
+        self._synced_pins = dict(disk_pins)
+
+        if self.locked_pins_file:
+            delta.locked = sorted(disk_locked - self.locked_pins)
+            delta.unlocked = sorted(self.locked_pins - disk_locked)
+            self.locked_pins.update(delta.locked)
+            self.locked_pins.difference_update(delta.unlocked)
+            self._synced_locked = set(disk_locked)
+        return delta
+
+    def _open_journal(self):
+        # 지갑 잠금을 잡은 상태에서 호출
+        self.journal.load()
+        if not self.journal.exists:
+            self.journal.bootstrap(self._synced_pins, self._synced_locked)
+
+    def _record_local(self, changed=None, removed=(), locked=(), unlocked=()):
+        """이 프로세스에서 저장한 변경을 동기화 저널에 기록합니다."""
+        self._open_journal()
+        for pin, balance in (changed or {}).items():
+            self.journal.record_local(pin, balance)
+        for pin in removed:
+            self.journal.record_local(pin, removed=True)
+        for pin in locked:
+            if pin in self.pins:
+                self.journal.record_local(pin, self.pins[pin], True)
+        for pin in unlocked:
+            if pin in self.pins:
+                self.journal.record_local(pin, self.pins[pin], False)
+        self.journal.save()
+
+    def export_sync(self, since=None):
+        """since 순번 이후의 변경분을 동기화 파일 내용(bytes)으로 반환합니다."""
+        with self.file_lock:
+            self._open_journal()
+            if not os.path.exists(self.journal.filename):
+                self.journal.save()
+            return self.journal.export_delta(since)
+
+    def import_sync(self, data):
+        """다른 PC에서 내보낸 변경분을 병합하고 (PinDelta, 반영된 기록 수)를 반환합니다."""
+        with self.file_lock:
+            delta = self.reload_external()
+            self._open_journal()
+            winners = self.journal.merge_delta(data)
+            for pin, balance, locked in winners:
+                if balance is None:
+                    if pin in self.pins:
+                        del self.pins[pin]
+                        delta.changed.pop(pin, None)
+                        delta.removed.append(pin)
+                    locked = False
+                elif self.pins.get(pin) != balance:
+                    self.pins[pin] = balance
+                    delta.changed[pin] = balance
+                if self.locked_pins_file:
+                    if locked and pin not in self.locked_pins:
+                        self.locked_pins.add(pin)
+                        delta.locked.append(pin)
+                    elif not locked and pin in self.locked_pins:
+                        self.locked_pins.remove(pin)
+                        delta.unlocked.append(pin)
+
+            # 가져온 변경은 이 PC의 변경으로 다시 기록하지 않도록 바로 저장
+            write_json_atomic(self.filename, self.pins, indent=4)
+            self._synced_pins = dict(self.pins)
+            self._synced_stamp = self._file_stamp()
+            if self.locked_pins_file:
+                write_json_atomic(self.locked_pins_file, sorted(self.locked_pins), indent=4)
+                self._synced_locked = set(self.locked_pins)
+            self.journal.save()
+            self._write_summary()
+        return delta, len(winners)
+
+    def get_total_balance(self):
+        return self.aggregates.total
+
+    def get_available_balance(self):
+        """잠기지 않아 사용할 수 있는 잔액"""
+        return self.aggregates.available
+
+    def get_locked_balance(self):
+        return self.aggregates.locked
+
+    def get_pin_count(self):
+        return self.aggregates.count
+
+    def get_balance_counts(self):
+        """[(잔액, PIN 개수), ...] 를 잔액 오름차순으로 반환합니다."""
+        return sorted(self.aggregates.histogram.items())
+
+    def get_totals(self):
+        """총 잔액, 사용 가능 잔액, 잠긴 잔액, PIN 개수, 잔액별 PIN 개수를 한 번에 반환합니다."""
+        return {
+            'total': self.aggregates.total,
+            'available': self.aggregates.available,
+            'locked': self.aggregates.locked,
+            'count': self.aggregates.count,
+            'counts': [list(item) for item in self.get_balance_counts()],
+        }
+
+    def summary(self):
+        """요약 파일에 저장하는 지갑의 합계 정보를 반환합니다."""
+        return {'total': self.aggregates.total, 'locked': self.aggregates.locked, 'count': self.aggregates.count}
+
+    def _write_summary(self):
+        # 메모리 지갑이 디스크와 같을 때만 호출 (지갑 잠금을 잡은 상태)
+        if not self.summary_file:
+            return
+        data = self.summary()
+        data['stamp'] = summary_stamp(self.filename, self.locked_pins_file)
+        write_json_atomic(self.summary_file, data)
+
+    def apply_usage(self, selected_pins, amount):
+        """선택된 PIN으로 금액을 사용한 결과를 지갑에 반영합니다.
+
+        잔액이 남은 PIN은 잔액을 줄이고 모두 쓴 PIN은 삭제하며,
+        [(PIN, 원금, 사용된 금액, 남은 잔액), ...] 목록을 반환합니다. 저장은 호출한 쪽에서 합니다.
+        """
+        total_used = 0
+        pins_used_info = []
+        for pin, balance in selected_pins:
+            if total_used >= amount:
+                break
+            used_amount = min(balance, amount - total_used)
+            remaining_balance = balance - used_amount
+            pins_used_info.append((pin, balance, used_amount, remaining_balance))
+            if remaining_balance > 0:
+                self.pins[pin] = remaining_balance
+                total_used = amount
+            else:
+                del self.pins[pin]
+                total_used += balance
+        return pins_used_info
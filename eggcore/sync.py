@@ -0,0 +1,184 @@
+"""여러 PC의 지갑을 변경분(델타) 파일로 동기화하기 위한 저널
+
+PIN마다 마지막 변경 기록 [시계, 노드, 잔액, 잠금]과 함께 그 기록이 알고 있는 노드별 마지막 변경 시계
+(버전 벡터)를 남깁니다. 병합할 때 한쪽 기록이 다른 쪽을 보고 나서 바뀐 것이면(버전 벡터가 크면) 그 기록이
+이기고, 서로 모르고 바뀐 동시 변경이면 사용 완료(삭제)가 항상 이깁니다. 둘 다 잔액 변경이면
+(시계, 노드)가 큰 쪽이 이기므로(LWW) 어느 PC에서 어떤 순서로 가져와도 결과가 같습니다.
+사용 완료 뒤에 다시 추가한 PIN은 삭제 기록을 본 뒤의 변경이므로 그대로 이깁니다.
+"""
+import json
+import uuid
+import zlib
+
+from .fileio import file_stamp, write_json_atomic
+
+SYNC_FORMAT = 2
+_READABLE_FORMATS = (1, 2)  # 1: 버전 벡터가 없던 형식
+
+# 기록 필드 위치: [시계, 노드, 잔액(사용 완료/삭제면 None), 잠금, 로컬 순번, 버전 벡터 {노드: 시계}]
+CLOCK, NODE, BALANCE, LOCKED, SEQ, VERSIONS = range(6)
+
+
+def _versions(record):
+    # 버전 벡터가 없던 기록은 자기 변경만 알고 있는 것으로 봄
+    return record[VERSIONS] if len(record) > VERSIONS else {record[NODE]: record[CLOCK]}
+
+
+def _covers(versions, other):
+    """versions가 other의 모든 변경을 알고 있는지"""
+    return all(versions.get(node, 0) >= clock for node, clock in other.items())
+
+
+def _concurrent_order(record):
+    # 동시 변경끼리는 사용 완료(삭제)가 먼저, 그다음 나중 시계, 노드 ID
+    return (record[BALANCE] is None, record[CLOCK], record[NODE])
+
+
+class SyncJournal:
+    """PIN별 마지막 변경 기록을 파일(resource/pins_sync.json)에 유지합니다."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.node = uuid.uuid4().hex[:12]
+        self.clock = 0      # 램포트 시계 (가져온 기록을 보면 그보다 크게 맞춤)
+        self.seq = 0        # 이 PC에서 기록이 바뀔 때마다 증가하는 순번 (내보내기 기준)
+        self.records = {}
+        self.seen = {}      # 다른 노드 -> 그 노드에서 가져온 마지막 순번
+        self.acked = {}     # 다른 노드 -> 그 노드가 이 PC에서 가져간 마지막 순번
+        self._stamp = None
+        self.exists = False
+
+    def load(self):
+        """파일이 바뀌었을 때만 다시 읽습니다. (지갑 잠금을 잡은 상태에서 호출)"""
+        stamp = file_stamp(self.filename)
+        if stamp is not None and stamp == self._stamp:
+            return
+        try:
+            with open(self.filename, "r", encoding='utf-8') as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.node = data['node']
+        self.clock = data['clock']
+        self.seq = data['seq']
+        self.records = data['records']
+        self.seen = data.get('seen', {})
+        self.acked = data.get('acked', {})
+        self._stamp = stamp
+        self.exists = True
+
+    def save(self):
+        write_json_atomic(self.filename, {
+            'node': self.node,
+            'clock': self.clock,
+            'seq': self.seq,
+            'records': self.records,
+            'seen': self.seen,
+            'acked': self.acked,
+        }, encoding='utf-8', separators=(',', ':'))
+        self._stamp = file_stamp(self.filename)
+        self.exists = True
+
+    def bootstrap(self, pins, locked_pins):
+        """저널이 없던 지갑의 현재 PIN을 모두 기록합니다."""
+        for pin, balance in pins.items():
+            self.record_local(pin, balance, pin in locked_pins)
+
+    def record_local(self, pin, balance=None, locked=None, removed=False):
+        """이 PC에서 생긴 변경을 기록합니다. 지정하지 않은 값은 이전 기록을 유지합니다."""
+        previous = self.records.get(pin)
+        if removed:
+            balance = None
+        elif balance is None:
+            balance = previous[BALANCE] if previous else None
+        if locked is None:
+            locked = previous[LOCKED] if previous else False
+        if previous and previous[BALANCE] == balance and previous[LOCKED] == locked:
+            return
+        self.clock += 1
+        self.seq += 1
+        versions = dict(_versions(previous)) if previous else {}
+        versions[self.node] = self.clock  # 이전 기록(가져온 변경 포함)을 본 뒤의 변경
+        self.records[pin] = [self.clock, self.node, balance, bool(locked), self.seq, versions]
+
+    def export_delta(self, since=None):
+        """since 순번 이후 바뀐 기록을 압축한 바이트로 반환합니다.
+
+        since를 생략하면 상대 PC가 마지막으로 가져간 순번(여러 대면 가장 작은 값)을 사용합니다.
+        """
+        if since is None:
+            since = min(self.acked.values()) if self.acked else 0
+        nodes = []
+        node_index = {}
+        rows = []
+        for pin, record in self.records.items():
+            if record[SEQ] <= since:
+                continue
+            if record[NODE] not in node_index:
+                node_index[record[NODE]] = len(nodes)
+                nodes.append(record[NODE])
+            digits = pin.replace("-", "")
+            versions = []
+            for node, clock in _versions(record).items():
+                if node not in node_index:
+                    node_index[node] = len(nodes)
+                    nodes.append(node)
+                versions.append([node_index[node], clock])
+            rows.append([digits if len(digits) == 20 and digits.isdigit() else pin, record[CLOCK], node_index[record[NODE]],
+                         record[BALANCE], 1 if record[LOCKED] else 0, versions])
+        payload = {
+            'f': SYNC_FORMAT,
+            'node': self.node,
+            'seq': self.seq,
+            'since': since,
+            'seen': self.seen,
+            'nodes': nodes,
+            'r': rows,
+        }
+        return zlib.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'), 9)
+
+    def merge_delta(self, data):
+        """내보낸 델타를 병합하고, 이긴 기록의 (PIN, 잔액 또는 None, 잠금) 목록을 반환합니다."""
+        try:
+            payload = json.loads(zlib.decompress(data).decode('utf-8'))
+        except (zlib.error, ValueError):
+            raise ValueError("올바른 동기화 파일이 아닙니다.")
+        if payload.get('f') not in _READABLE_FORMATS:
+            raise ValueError("지원하지 않는 동기화 파일 형식입니다.")
+        if payload['node'] == self.node:
+            raise ValueError("이 PC에서 내보낸 동기화 파일입니다.")
+
+        winners = []
+        nodes = payload['nodes']
+        for row in payload['r']:
+            digits, clock, node, balance, locked = row[:5]
+            pin = f"{digits[:5]}-{digits[5:10]}-{digits[10:15]}-{digits[15:]}" if len(digits) == 20 and digits.isdigit() else digits
+            versions = {nodes[index]: seen for index, seen in row[5]} if len(row) > 5 else {nodes[node]: clock}
+            incoming = [clock, nodes[node], balance, bool(locked), 0, versions]
+            self.clock = max(self.clock, clock)
+            current = self.records.get(pin)
+            if current is not None:
+                current_versions = _versions(current)
+                if _covers(current_versions, versions):
+                    continue  # 이미 알고 있는 변경
+                if not _covers(versions, current_versions):
+                    # 동시 변경: 이긴 쪽이 양쪽 변경을 모두 아는 것으로 기록 (다음 변경이 둘 다 이기도록)
+                    merged = dict(current_versions)
+                    for other, seen in versions.items():
+                        merged[other] = max(merged.get(other, 0), seen)
+                    if _concurrent_order(current) >= _concurrent_order(incoming):
+                        if len(current) > VERSIONS:
+                            current[VERSIONS] = merged
+                        else:
+                            current.append(merged)
+                        continue
+                    incoming[VERSIONS] = merged
+            self.seq += 1
+            incoming[SEQ] = self.seq
+            self.records[pin] = incoming
+            winners.append((pin, balance, bool(locked)))
+
+        remote = payload['node']
+        self.seen[remote] = max(self.seen.get(remote, 0), payload['seq'])
+        self.acked[remote] = max(self.acked.get(remote, 0), payload['seen'].get(self.node, 0))
+        return winners
@@ -0,0 +1,155 @@
+"""GUI가 사용하는 지갑: PinStore에 텍스트 내보내기, 사용 로그, 잠금, 사용 통계를 더한 것
+
+Qt나 Windows API 없이 동작하므로 분석용 스크립트나 작업 프로세스에서도 그대로 불러올 수 있습니다.
+"""
+import re
+from datetime import datetime
+
+from .importer import format_pin, is_valid_pin, unformat_pin
+from .solver import find_pins_for_amount
+from .spent import SpentPinArchive
+from .stats import StatsLog
+from .store import PinStore
+
+
+class PinWallet(PinStore):
+    """paths는 WALLET_FILES와 같은 키('pins', 'txt', 'log', 'locked', 'journal', 'summary')의 경로 딕셔너리
+
+    spent_file을 주면 모두 사용한 PIN을 그 보관소(SpentPinArchive)에 기록합니다 (여러 지갑이 함께 써도 됨).
+    """
+
+    def __init__(self, paths, stats_file, load=True, spent_file=None):
+        super().__init__(paths['pins'], paths['locked'], paths['journal'], paths['summary'], load=load)
+        self.spent_pins = SpentPinArchive(spent_file) if spent_file else None
+        self.txt_filename = paths['txt']
+        self.log_filename = paths['log']
+        self.stats_log_filename = stats_file  # 통계용 구조화된 로그 파일
+        self.stats_log = StatsLog(stats_file)
+
+    def show_log(self):
+        try:
+            with open(self.log_filename, "r", encoding='utf-8') as log_file:
+                return log_file.read()
+        except FileNotFoundError:
+            return "로그 파일을 찾을 수 없습니다."
+        except Exception as e:
+            return f"오류가 발생했습니다: {e}"
+
+    def save_pins_to_txt(self):
+        with open(self.txt_filename, "w") as file:
+            for idx, (pin, balance) in enumerate(self.pins.items(), start=1):
+                file.write(f"{idx}. {pin}: {balance}\n")
+
+    # 로그 파일로부터 PIN과 원금을 사용하여 PIN 목록을 복구하는 함수
+    def load_pins_from_log(self):
+        try:
+            with open(self.log_filename, "r", encoding='utf-8') as log_file:
+                for line in log_file:
+                    match = re.search(r'(\d{5}-\d{5}-\d{5}-\d{5}) \[원금: (\d+)\]', line)
+                    if match:
+                        self.pins[match.group(1)] = int(match.group(2))
+            self.save_pins()
+            self.save_pins_to_txt()
+            return "PIN 목록이 성공적으로 복구되었습니다."
+        except FileNotFoundError:
+            return "로그 파일을 찾을 수 없습니다."
+        except Exception as e:
+            return f"오류가 발생했습니다: {e}"
+
+    def add_pin(self, pin, balance):
+        self.pins[pin] = balance
+        self.save_pins()
+        self.save_pins_to_txt()
+        return f"PIN {pin} 추가 완료. 잔액: {balance}"
+
+    def format_pin(self, pin):
+        return format_pin(pin)
+
+    def unformat_pin(self, formatted_pin):
+        return unformat_pin(formatted_pin)
+
+    def is_valid_pin_format(self, pin):
+        return is_valid_pin(pin)
+
+    def delete_pin(self, pin):
+        pin = self.format_pin(pin)
+        if pin in self.pins:
+            del self.pins[pin]
+            if pin in self.locked_pins:
+                self.locked_pins.remove(pin)
+                self.save_locked_pins()
+            self.save_pins()
+            self.save_pins_to_txt()
+            return f"PIN {pin} 삭제 완료."
+        return f"PIN {pin}은(는) 존재하지 않습니다."
+
+    def update_pin_balance(self, pin, new_balance):
+        if pin in self.pins:
+            self.pins[pin] = new_balance
+            self.save_pins()
+            self.save_pins_to_txt()
+            return True
+        return False
+
+    def apply_usage(self, selected_pins, amount):
+        pins_used_info = super().apply_usage(selected_pins, amount)
+        if self.spent_pins is not None:
+            self.spent_pins.add(pin for pin, _, _, remaining_balance in pins_used_info if remaining_balance <= 0)
+        return pins_used_info
+
+    def log_usage(self, header, pins_used_info, product_name=None, amount=0):
+        """apply_usage 결과를 사용 로그(마지막 사용 기록)에 쓰고, 상품 이름이 있으면 통계 로그에도 추가합니다"""
+        now = datetime.now()
+        entry = header + "".join(
+            f"{now.strftime('%Y-%m-%d %H:%M:%S')} : {pin} [원금: {balance}] [사용된 금액: {used_amount}] "
+            f"[남은 잔액: {remaining_balance}]\n"
+            for pin, balance, used_amount, remaining_balance in pins_used_info)
+        with open(self.log_filename, "w", encoding='utf-8') as log_file:
+            log_file.write(entry)
+        if product_name and amount > 0 and pins_used_info:
+            self.add_stats_log_entry(now.strftime('%Y-%m-%d'), product_name, amount, pins_used_info)
+
+    def is_pin_spent(self, pin):
+        """모두 사용해 지갑에서 지운 적이 있는 PIN인지 확인합니다"""
+        return self.spent_pins is not None and pin in self.spent_pins
+
+    def refresh_spent_pins(self):
+        """다른 창이나 CLI가 사용한 PIN을 보관소에서 읽어 옵니다"""
+        if self.spent_pins is not None:
+            self.spent_pins.refresh()
+
+    def list_pins(self):
+        return list(self.pins.items())
+
+    def find_pins_for_amount(self, amount, select_pins=None):
+        """잠기지 않은 PIN 중 amount를 결제할 조합 (select_pins를 주면 그 중에서만)"""
+        candidates = select_pins if select_pins else self.pins.items()
+        available_pins = [(pin, balance) for pin, balance in candidates if pin not in self.locked_pins]
+        return find_pins_for_amount(sorted(available_pins, key=lambda x: x[1]), amount)
+
+    def pin_check(self, pin):
+        return 1 if self.format_pin(pin) in self.pins else 0
+
+    def toggle_pin_lock(self, pin):
+        """핀의 잠금 상태를 토글합니다. 잠기면 True를 반환합니다"""
+        if pin in self.locked_pins:
+            self.locked_pins.remove(pin)
+            self.save_locked_pins()
+            return False
+        self.locked_pins.add(pin)
+        self.save_locked_pins()
+        return True
+
+    def is_pin_locked(self, pin):
+        return pin in self.locked_pins
+
+    def load_stats_log(self):
+        """통계용 구조화된 로그 파일을 불러옵니다."""
+        return self.stats_log.load()
+
+    def save_stats_log(self, stats_data):
+        self.stats_log.save(stats_data)
+
+    def add_stats_log_entry(self, date_str, product_name, amount, pins_used):
+        """통계용 로그에 새 항목을 추가합니다."""
+        self.stats_log.add_entry(date_str, product_name, amount)
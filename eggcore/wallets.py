@@ -0,0 +1,128 @@
+"""여러 게임 계정의 PIN 지갑을 이름별로 나누어 관리하는 레지스트리
+
+기본 지갑은 기존 설정(config.ini의 pin_file 등)의 파일을 그대로 사용하고,
+추가한 지갑은 wallets/<이름>/ 폴더에 각자의 파일로 따로 저장합니다.
+지갑은 처음 열 때만 불러오고 최근에 연 몇 개만 메모리에 유지합니다.
+"""
+import json
+import os
+from collections import OrderedDict
+
+from .fileio import write_json_atomic
+from .store import summary_stamp
+
+DEFAULT_WALLET = "기본"
+WALLET_FILES = {
+    'pins': "pins.json",
+    'txt': "pins.txt",
+    'log': "pin_usage_log.txt",
+    'locked': "locked_pins.json",
+    'journal': "pins_sync.json",
+    'summary': "summary.json",
+}
+
+
+class WalletRegistry:
+    """이름별 지갑(샤드)을 필요할 때 열고 최근 사용한 지갑을 LRU로 유지합니다.
+
+    factory(paths)는 WALLET_FILES와 같은 키의 경로 딕셔너리를 받아 PinStore를 만듭니다.
+    """
+
+    def __init__(self, factory, default_paths, root="wallets", cache_size=3):
+        self.factory = factory
+        self.default_paths = default_paths
+        self.root = root
+        self.cache_size = max(1, cache_size)
+        self._cache = OrderedDict()  # 이름 -> 열린 지갑 (뒤쪽일수록 최근 사용)
+
+    def names(self):
+        """기본 지갑과 wallets 폴더의 지갑 이름 목록"""
+        names = [DEFAULT_WALLET]
+        if os.path.isdir(self.root):
+            names.extend(sorted(
+                name for name in os.listdir(self.root)
+                if os.path.isfile(os.path.join(self.root, name, WALLET_FILES['pins']))
+            ))
+        return names
+
+    def paths(self, name):
+        if name == DEFAULT_WALLET:
+            return dict(self.default_paths)
+        return {key: os.path.join(self.root, name, filename) for key, filename in WALLET_FILES.items()}
+
+    def create(self, name):
+        """새 지갑을 만들고 이름을 반환합니다. 이름이 올바르지 않으면 ValueError를 발생시킵니다."""
+        name = name.strip()
+        if not name or name in (".", "..") or any(char in name for char in '\\/:*?"<>|'):
+            raise ValueError("지갑 이름에 사용할 수 없는 문자가 있습니다.")
+        if name in self.names():
+            raise ValueError(f"'{name}' 지갑이 이미 있습니다.")
+        paths = self.paths(name)
+        write_json_atomic(paths['pins'], {}, indent=4)
+        return name
+
+    def open(self, name, load=True):
+        """지갑을 열어 반환합니다. 이미 열려 있으면 불러오지 않고 그대로 사용합니다.
+
+        load=False면 파일을 읽지 않은 빈 지갑을 만들어 둡니다 (나중에 load_snapshot()으로 불러옴).
+        """
+        store = self._cache.get(name)
+        if store is not None:
+            self._cache.move_to_end(name)
+            return store
+        if name not in self.names():
+            raise KeyError(name)
+        store = self.factory(self.paths(name)) if load else self.factory(self.paths(name), load=False)
+        self._cache[name] = store
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return store
+
+    def is_open(self, name):
+        return name in self._cache
+
+    def summary(self, name):
+        """지갑을 열지 않고 {'total', 'locked', 'count'} 합계를 반환합니다.
+
+        저장할 때 함께 기록한 요약 파일이 지갑 파일과 맞으면 그 값을 쓰고,
+        다른 프로그램이 지갑을 바꿔 맞지 않을 때만 파일을 읽어 다시 계산합니다.
+        """
+        paths = self.paths(name)
+        stamp = summary_stamp(paths['pins'], paths['locked'])
+        try:
+            with open(paths['summary'], "r", encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('stamp') == stamp:
+                return {key: data[key] for key in ('total', 'locked', 'count')}
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+
+        try:
+            with open(paths['pins'], "r") as file:
+                pins = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pins = {}
+        try:
+            with open(paths['locked'], "r") as file:
+                locked_pins = set(json.load(file))
+        except (FileNotFoundError, json.JSONDecodeError):
+            locked_pins = set()
+        data = {
+            'total': sum(pins.values()),
+            'locked': sum(pins[pin] for pin in locked_pins if pin in pins),
+            'count': len(pins),
+        }
+        try:
+            write_json_atomic(paths['summary'], dict(data, stamp=stamp))
+        except OSError:
+            pass
+        return data
+
+    def combined_summary(self):
+        """모든 지갑의 합계를 (지갑별 [(이름, 요약)], 전체 요약)으로 반환합니다."""
+        rows = [(name, self.summary(name)) for name in self.names()]
+        combined = {'total': 0, 'locked': 0, 'count': 0}
+        for _, data in rows:
+            for key in combined:
+                combined[key] += data[key]
+        return rows, combined
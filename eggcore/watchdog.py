@@ -0,0 +1,149 @@
+"""GUI 이벤트 루프가 멈춘 시간과 그때 메인 스레드가 실행 중이던 코드를 기록하는 감시 스레드
+
+GUI 스레드는 타이머로 beat()를 자주 호출합니다. 감시 스레드는 마지막 beat() 이후
+threshold 이상 지나면 이벤트 루프가 멈춘 것으로 보고, 멈춰 있는 동안 sys._current_frames()로
+메인 스레드의 스택을 여러 번 채취합니다. 다시 beat()가 오면 멈춘 시간과 가장 많이 채취된 스택을
+resource/stalls.log에 한 줄의 JSON으로 남깁니다 (크기가 커지면 stalls.log.1, .2 ...로 넘김).
+"""
+import json
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from datetime import datetime
+
+DEFAULT_LOG = os.path.join("resource", "stalls.log")
+DEFAULT_THRESHOLD = 0.25    # 초, 이보다 오래 멈추면 기록
+MAX_BYTES = 256 * 1024      # 기록 파일 하나의 최대 크기
+BACKUP_COUNT = 3            # 넘긴 기록 파일을 몇 개까지 남길지
+
+
+class StallWatchdog:
+    """이벤트 루프 멈춤 감시 스레드
+
+    thread_id의 스레드(기본: 메인 스레드)에서 beat()를 호출해야 합니다.
+    """
+
+    def __init__(self, log_path=DEFAULT_LOG, threshold=DEFAULT_THRESHOLD, thread_id=None,
+                 max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+        self.log_path = log_path
+        self.threshold = threshold
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._last_beat = time.monotonic()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._handler = None
+
+    def beat(self):
+        self._last_beat = time.monotonic()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        directory = os.path.dirname(self.log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._handler = logging.handlers.RotatingFileHandler(
+            self.log_path, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8", delay=True)
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        self._stopping.clear()
+        self.beat()
+        self._thread = threading.Thread(target=self._run, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        self._handler.close()
+        self._handler = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def _run(self):
+        interval = max(self.threshold / 4, 0.01)
+        stalled_since = None   # 멈추기 직전의 마지막 beat 시각
+        started_at = None      # 멈춘 시각 (기록용 벽시계 시간)
+        samples = Counter()
+        while not self._stopping.wait(interval):
+            last_beat = self._last_beat
+            if stalled_since is not None and last_beat != stalled_since:
+                # 다시 beat가 왔으므로 멈춤이 끝남
+                self._record(started_at, last_beat - stalled_since, samples)
+                stalled_since = None
+                samples = Counter()
+            if time.monotonic() - last_beat < self.threshold:
+                continue
+            if stalled_since is None:
+                stalled_since = last_beat
+                started_at = time.time() - (time.monotonic() - last_beat)
+            stack = self._capture()
+            if stack:
+                samples[stack] += 1
+
+    def _capture(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return None
+        return tuple((entry.filename, entry.lineno, entry.name) for entry in traceback.extract_stack(frame))
+
+    def _record(self, started_at, elapsed, samples):
+        stack, count = samples.most_common(1)[0] if samples else ((), 0)
+        entry = {
+            "time": datetime.fromtimestamp(started_at).strftime("%Y-%m-%d %H:%M:%S"),
+            "elapsed_ms": round(elapsed * 1000),
+            "samples": sum(samples.values()),
+            "stack_samples": count,
+            "stack": [list(frame) for frame in stack],
+        }
+        # emit()을 직접 부르지 않고 handle()로 넘겨 핸들러의 잠금과 필터를 거치게 함
+        self._handler.handle(logging.makeLogRecord({"msg": json.dumps(entry, ensure_ascii=False)}))
+
+
+def read_stalls(log_path=DEFAULT_LOG, backup_count=BACKUP_COUNT):
+    """기록 파일(넘긴 파일 포함)에 남은 멈춤 기록 목록 (오래된 순)"""
+    entries = []
+    paths = [f"{log_path}.{number}" for number in range(backup_count, 0, -1)] + [log_path]
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue  # 기록 중 종료되어 잘린 줄
+        except FileNotFoundError:
+            continue
+    return entries
+
+
+def worst_stalls(entries, limit=50):
+    """오래 멈춘 순으로 limit개"""
+    return sorted(entries, key=lambda entry: entry.get("elapsed_ms", 0), reverse=True)[:limit]
+
+
+def stall_location(entry, root=None):
+    """멈춘 원인으로 보이는 위치: root 폴더 안의 코드 중 가장 안쪽 프레임 (없으면 가장 안쪽 프레임)"""
+    stack = entry.get("stack") or []
+    if not stack:
+        return "(스택 없음)"
+    frame = stack[-1]
+    if root:
+        root = os.path.abspath(root)
+        for candidate in reversed(stack):
+            path = os.path.abspath(candidate[0])
+            if path.startswith(root) and "site-packages" not in path:
+                frame = candidate
+                break
+    filename, lineno, name = frame
+    return f"{os.path.basename(filename)}:{lineno} {name}()"
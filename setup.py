@@ -3,6 +3,9 @@ versions = '1.2.7'
 
 build_exe_options = {
     "packages": ["comtypes"],
+    # EggManager_GUI가 LazyModule로 처음 사용할 때 불러오는 모듈 (import 문이 없어 자동으로 포함되지 않음)
+    "includes": ["pyautogui", "pyperclip", "pywinauto", "pythoncom", "win32api", "win32con", "win32gui",
+                 "requests", "zipfile"],
     "include_files": ['resource/'],
     "build_exe": f"EggManager_{versions}"
 }
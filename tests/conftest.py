@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트의 eggcore를 설치하지 않고 불러옴 (python -m pytest / pytest 모두)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,98 @@
+"""지갑 서비스(eggcore.daemon) 테스트: 임시 폴더의 기본 지갑으로 예약/사용/추가 요청을 처리"""
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+from eggcore.cli import open_wallet
+from eggcore.daemon import PIN_SPENT, DaemonError, ServiceError, WalletClient, WalletService
+
+PIN = "12345-67890-12345-67890"
+OTHER = "11111-22222-33333-44444"
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    # open_wallet은 작업 디렉터리의 config.ini, pins.json, resource/...를 씀
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "resource").mkdir()
+    (tmp_path / "pins.json").write_text(json.dumps({PIN: 50000, OTHER: 10000}), encoding='utf-8')
+    service = WalletService(open_wallet())
+    yield service
+    service.close()
+
+
+def test_reserved_pins_are_not_planned_again(service):
+    first = service.plan(10000, reserve=True)
+    assert first['pins'] == [[OTHER, 10000]]
+    second = service.plan(10000, reserve=True)
+    assert second['pins'] == [[PIN, 50000]]
+    assert service.plan(10000)['pins'] == []
+    service.release(first['token'])
+    assert service.plan(10000)['pins'] == [[OTHER, 10000]]
+
+
+def test_commit_updates_wallet_archive_and_logs(service, tmp_path):
+    token = service.plan(10000, reserve=True)['token']
+    result = service.commit(10000, token=token, product_name="테스트 상품")
+    assert result['used'] == [[OTHER, 10000, 10000, 0]]
+
+    assert json.loads((tmp_path / "pins.json").read_text(encoding='utf-8')) == {PIN: 50000}
+    assert OTHER not in (tmp_path / "pins.txt").read_text(encoding='utf-8')
+    assert OTHER in (tmp_path / "pin_usage_log.txt").read_text(encoding='utf-8')
+    assert "테스트 상품" in (tmp_path / "resource" / "pin_stats.json").read_text(encoding='utf-8')
+    # 다른 프로세스(GUI, CLI)가 여는 지갑에서도 사용한 PIN으로 보임
+    assert open_wallet().is_pin_spent(OTHER)
+
+
+def test_commit_with_unknown_token_fails(service):
+    with pytest.raises(ServiceError):
+        service.commit(10000, token="없는 토큰")
+
+
+def test_add_refuses_spent_pin_unless_allowed(service):
+    service.commit(10000, pins=[OTHER])
+    with pytest.raises(ServiceError) as excinfo:
+        service.add(OTHER, 10000)
+    assert excinfo.value.code == PIN_SPENT
+    assert OTHER not in service.store.pins
+
+    assert service.add(OTHER.replace("-", ""), 10000, allow_spent=True)
+    assert service.store.pins[OTHER] == 10000
+
+
+@pytest.mark.parametrize("pin, balance", [
+    ("1234", 10000),
+    (PIN.replace("1", "a", 1), 10000),
+    ("22222-33333-44444-55555", 0),
+    ("22222-33333-44444-55555", "10000"),
+    ("22222-33333-44444-55555", True),
+])
+def test_add_rejects_invalid_pin_or_balance(service, pin, balance):
+    with pytest.raises(ServiceError) as excinfo:
+        service.add(pin, balance)
+    assert excinfo.value.code == -32602
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix 소켓 필요")
+def test_client_receives_error_code(service, tmp_path):
+    from eggcore.daemon import WalletServer
+
+    socket_path = str(tmp_path / "test.sock")
+    server = WalletServer(socket_path, service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with WalletClient(socket_path) as client:
+            client.call("commit", amount=10000, pins=[OTHER])
+            with pytest.raises(DaemonError) as excinfo:
+                client.call("add", pin=OTHER, balance=10000)
+            assert excinfo.value.code == PIN_SPENT
+            assert client.call("add", pin=OTHER, balance=10000, allow_spent=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+    assert not os.path.exists(socket_path)
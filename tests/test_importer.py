@@ -0,0 +1,65 @@
+"""PIN 일괄 추가 해석기(eggcore.importer) 테스트: 붙여넣기, 미리보기, 파일 읽기가 같은 PIN과 금액을 찾는지"""
+import pytest
+
+from eggcore import IncrementalPinParser, MappedPinScanner, PinFileReader, iter_pins, parse_pins
+
+PIN = "12345-67890-12345-67890"
+OTHER = "11111-22222-33333-44444"
+
+TEXT = f"""{PIN} 5000
+[에그머니-1만원권]
+{OTHER.replace("-", "")}
+주문번호 3 에그머니 모바일 상품권 2222-2222-2222-2222-2222
+33333-33333-33333-33333, 10,000원
+[에그머니 50,000원]
+44444-44444-44444-44444 3만원
+PIN: 55555-55555-55555-55555, 금액: 10000원
+PIN: 66666-66666-66666-66666, 잔액 : 7,000원
+77777-77777-77777-77777
+{PIN} 1000"""
+
+EXPECTED = [
+    (PIN, 5000),
+    (OTHER, 10000),
+    ("22222-22222-22222-22222", 10000),
+    ("33333-33333-33333-33333", 10000),
+    ("44444-44444-44444-44444", 30000),
+    ("55555-55555-55555-55555", 10000),
+    ("66666-66666-66666-66666", 7000),
+    ("77777-77777-77777-77777", 50000),
+]
+
+
+def first_seen(rows):
+    # iter_pins와 파일 읽기는 같은 PIN도 나올 때마다 내놓으므로 처음 나온 것만 비교
+    found = {}
+    for pin, amount, *_ in rows:
+        found.setdefault(pin, amount)
+    return list(found.items())
+
+
+def test_parse_pins():
+    assert [(pin, amount) for pin, amount, _ in parse_pins(TEXT, 50000)] == EXPECTED
+
+
+def test_labelled_amount_after_separator():
+    assert parse_pins("PIN: 12345-67890-12345-67890, 금액: 10000원", 50000)[0][1] == 10000
+
+
+def test_incremental_parser_matches_parse_pins():
+    parser = IncrementalPinParser()
+    assert parser.parse(TEXT, 50000) == parse_pins(TEXT, 50000)
+    edited = TEXT.replace("금액: 10000원", "금액: 20000원")
+    assert parser.parse(edited, 50000) == parse_pins(edited, 50000)
+
+
+def test_iter_pins_matches_parse_pins():
+    assert first_seen(iter_pins(TEXT.splitlines(), 50000)) == EXPECTED
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp949"])
+@pytest.mark.parametrize("reader_class", [PinFileReader, MappedPinScanner])
+def test_file_readers_match_parse_pins(tmp_path, encoding, reader_class):
+    path = tmp_path / "pins.txt"
+    path.write_bytes(TEXT.encode(encoding))
+    assert first_seen(reader_class(str(path), 50000, encoding)) == EXPECTED
@@ -0,0 +1,114 @@
+"""지갑 저장(eggcore.store) 테스트: 묶음 추가와 동기화 기록 저장 횟수, 파일 권한, 변경 알림"""
+import os
+import stat
+
+import pytest
+
+from eggcore import PIN_INSERTED, PIN_REMOVED, PINS_LOADED, WALLET_RESET, PinStore
+from eggcore.sync import SyncJournal
+
+
+def make_pins(count):
+    return [(f"{index:05d}-00000-00000-00000", 10000) for index in range(count)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PinStore(str(tmp_path / "pins.json"), str(tmp_path / "locked_pins.json"),
+                    str(tmp_path / "pins_sync.json"))
+
+
+@pytest.fixture
+def journal_saves(monkeypatch):
+    saves = []
+    original = SyncJournal.save
+
+    def counting_save(journal):
+        saves.append(journal.filename)
+        original(journal)
+
+    monkeypatch.setattr(SyncJournal, "save", counting_save)
+    return saves
+
+
+def test_batch_add_writes_journal_once(store, journal_saves):
+    added = store.add_pins(make_pins(1000) + make_pins(10))
+    store.save_pins()
+    assert len(added) == 1000
+    assert len(journal_saves) == 1
+    assert len(store.export_sync()) > 0
+
+
+def test_import_writes_journal_once_per_batch(store, journal_saves):
+    for _ in store.import_pins(make_pins(2500), batch_size=1000):
+        pass
+    assert len(store.pins) == 2500
+    assert len(journal_saves) == 3
+
+
+def test_unchanged_save_skips_journal(store, journal_saves):
+    store.add_pins(make_pins(10))
+    store.save_pins()
+    store.save_locked_pins()
+    store.save_pins()
+    store.save_locked_pins()
+    assert len(journal_saves) == 1
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX 권한")
+def test_save_keeps_file_mode(store, tmp_path):
+    store.add_pins(make_pins(1))
+    store.save_pins()
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(tmp_path / "pins.json").st_mode) == 0o666 & ~umask
+    os.chmod(tmp_path / "pins.json", 0o640)
+    store.add_pins(make_pins(2))
+    store.save_pins()
+    assert stat.S_IMODE(os.stat(tmp_path / "pins.json").st_mode) == 0o640
+
+
+class RowMirror:
+    """PIN 목록 표(PinTableModel)처럼 지갑 변경 알림만으로 행 순서를 따라가는 목록"""
+
+    def __init__(self, store):
+        self.store = store
+        self.rows = list(store.pins)
+        store.add_listener(self.on_wallet_changed)
+
+    def on_wallet_changed(self, event, pin, value):
+        if event == PIN_INSERTED:
+            self.rows.append(pin)
+        elif event == PINS_LOADED:
+            self.rows.extend(value)
+        elif event == PIN_REMOVED:
+            self.rows.remove(pin)
+        elif event == WALLET_RESET:
+            self.rows = list(self.store.pins)
+        else:
+            assert pin in self.rows
+
+
+def test_change_events_keep_table_rows_in_wallet_order(store, tmp_path):
+    mirror = RowMirror(store)
+    pins = [pin for pin, _ in make_pins(6)]
+    store.add_pins(make_pins(4))
+    store.pins[pins[4]] = 5000
+    del store.pins[pins[1]]
+    store.pins[pins[1]] = 3000  # 지웠다 다시 추가하면 맨 뒤로
+    store.pins[pins[0]] = 7000
+    store.locked_pins.add(pins[2])
+    store.apply_usage([(pins[3], 10000)], 10000)
+    store.save_pins()
+    assert mirror.rows == list(store.pins)
+
+    # 다른 프로세스가 저장한 변경분만 반영해도 행 순서가 지갑과 같음
+    other = PinStore(str(tmp_path / "pins.json"), str(tmp_path / "locked_pins.json"))
+    del other.pins[pins[0]]
+    other.pins[pins[5]] = 1000
+    other.save_pins()
+    store.reload_external()
+    assert mirror.rows == list(store.pins)
+
+    store.pins = {pins[5]: 1000}
+    assert mirror.rows == [pins[5]]
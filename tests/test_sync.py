@@ -0,0 +1,116 @@
+"""PC 간 동기화(eggcore.sync) 병합 규칙 테스트: 두 PC의 지갑을 임시 폴더에 만들고 동기화 파일을 주고받음"""
+import json
+import os
+import zlib
+
+import pytest
+
+from eggcore import PinStore
+
+PIN = "12345-67890-12345-67890"
+OTHER = "11111-22222-33333-44444"
+
+
+def make_pc(tmp_path, name):
+    directory = tmp_path / name
+    directory.mkdir()
+    return PinStore(str(directory / "pins.json"), str(directory / "locked_pins.json"),
+                    str(directory / "pins_sync.json"))
+
+
+def spend(pc, pin):
+    pc.apply_usage([(pin, pc.pins[pin])], pc.pins[pin])
+    pc.save_pins()
+
+
+def exchange(first, second):
+    """서로 상대의 동기화 파일을 (first가 먼저) 가져옵니다"""
+    from_first = first.export_sync()
+    from_second = second.export_sync()
+    first.import_sync(from_second)
+    second.import_sync(from_first)
+
+
+@pytest.fixture
+def pcs(tmp_path):
+    a, b = make_pc(tmp_path, "a"), make_pc(tmp_path, "b")
+    a.pins[PIN] = 50000
+    a.pins[OTHER] = 10000
+    a.save_pins()
+    b.import_sync(a.export_sync())
+    a.import_sync(b.export_sync())
+    assert dict(b.pins) == dict(a.pins)
+    return a, b
+
+
+@pytest.mark.parametrize("spender_first", [True, False])
+def test_concurrent_spend_wins_over_rebalance(pcs, spender_first):
+    a, b = pcs
+    spend(a, PIN)  # A에서 모두 사용
+    for _ in range(5):  # B의 시계가 A보다 앞서도 동시 변경이면 사용 완료가 이겨야 함
+        b.pins[OTHER] += 1000
+        b.save_pins()
+    b.pins[PIN] = 30000
+    b.save_pins()
+
+    if spender_first:
+        exchange(a, b)
+    else:
+        exchange(b, a)
+    assert PIN not in a.pins
+    assert PIN not in b.pins
+    assert a.pins[OTHER] == b.pins[OTHER] == 15000
+
+    # 한 번 더 주고받아도 되살아나지 않음
+    exchange(a, b)
+    assert PIN not in a.pins and PIN not in b.pins
+
+
+def test_change_after_seeing_the_other_wins(pcs):
+    a, b = pcs
+    a.pins[PIN] = 40000
+    a.save_pins()
+    b.import_sync(a.export_sync())
+    assert b.pins[PIN] == 40000
+    b.pins[PIN] = 20000  # A의 변경을 본 뒤의 변경
+    b.save_pins()
+    a.import_sync(b.export_sync())
+    assert a.pins[PIN] == 20000
+
+
+def test_re_adding_after_seeing_the_spend_wins(pcs):
+    a, b = pcs
+    spend(a, PIN)
+    exchange(a, b)
+    assert PIN not in b.pins
+    b.pins[PIN] = 50000  # 사용 완료를 본 뒤에 다시 추가
+    b.save_pins()
+    exchange(a, b)
+    assert a.pins[PIN] == b.pins[PIN] == 50000
+
+
+def test_concurrent_rebalances_converge(pcs):
+    a, b = pcs
+    a.pins[PIN] = 40000
+    a.save_pins()
+    b.pins[PIN] = 30000
+    b.save_pins()
+    exchange(a, b)
+    assert a.pins[PIN] == b.pins[PIN]
+    exchange(b, a)
+    assert a.pins[PIN] == b.pins[PIN]
+
+
+def test_reads_format_1_files(pcs):
+    a, b = pcs
+    record = a.journal.records[PIN]
+    payload = {'f': 1, 'node': "oldnode", 'seq': 1, 'since': 0, 'seen': {}, 'nodes': ["oldnode"],
+               'r': [[PIN.replace("-", ""), record[0] + 10, 0, 5000, 0]]}
+    a.import_sync(zlib.compress(json.dumps(payload).encode('utf-8')))
+    assert a.pins[PIN] == 5000
+
+
+def test_rejects_own_file(pcs):
+    a, _ = pcs
+    with pytest.raises(ValueError):
+        a.import_sync(a.export_sync())